@@ -1,8 +1,21 @@
 import copy
+import heapq
+import json
 import math
-from typing import List, Set, Dict, Optional, Tuple
+import mmap
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Set, Dict, Optional, Sequence, Tuple, Union
 from random import choice, random
 
+from cache_alocacao import CacheAlocacao, coloracao_valida, impressao_digital
+from estruturas_alocacao import IndiceOcorrencias, TabelaSimbolos
+
 
 class DispositivoMovel:
     def __init__(self, id: str, x: float, y: float, potencia: float, frequencia_uso: float = 1.0):
@@ -18,6 +31,181 @@ class DispositivoMovel:
         return f"Dispositivo({self.id}, pos=({self.x:.1f}, {self.y:.1f}), pot={self.potencia:.1f})"
 
 
+class DispositivoFrota:
+    # Visão leve de uma posição da frota, compatível com DispositivoMovel
+    __slots__ = ('_frota', '_indice')
+    
+    def __init__(self, frota: 'FrotaDispositivos', indice: int):
+        self._frota = frota
+        self._indice = indice
+    
+    @property
+    def id(self) -> str:
+        return self._frota.ids[self._indice]
+    
+    @property
+    def x(self) -> float:
+        return self._frota.x[self._indice]
+    
+    @x.setter
+    def x(self, valor: float):
+        self._frota.x[self._indice] = valor
+    
+    @property
+    def y(self) -> float:
+        return self._frota.y[self._indice]
+    
+    @y.setter
+    def y(self, valor: float):
+        self._frota.y[self._indice] = valor
+    
+    @property
+    def potencia(self) -> float:
+        return self._frota.potencia[self._indice]
+    
+    @potencia.setter
+    def potencia(self, valor: float):
+        self._frota.potencia[self._indice] = valor
+    
+    @property
+    def frequencia_uso(self) -> float:
+        return self._frota.frequencia_uso[self._indice]
+    
+    @frequencia_uso.setter
+    def frequencia_uso(self, valor: float):
+        self._frota.frequencia_uso[self._indice] = valor
+    
+    @property
+    def canal_alocado(self) -> Optional[str]:
+        return self._frota.canal_alocado[self._indice]
+    
+    @canal_alocado.setter
+    def canal_alocado(self, valor: Optional[str]):
+        self._frota.canal_alocado[self._indice] = valor
+    
+    @property
+    def em_spill(self) -> bool:
+        return bool(self._frota.em_spill[self._indice])
+    
+    @em_spill.setter
+    def em_spill(self, valor: bool):
+        self._frota.em_spill[self._indice] = 1 if valor else 0
+    
+    def __repr__(self):
+        return f"Dispositivo({self.id}, pos=({self.x:.1f}, {self.y:.1f}), pot={self.potencia:.1f})"
+
+
+class FrotaDispositivos:
+    # Frota em colunas tipadas (estrutura de arrays) no lugar de um objeto por dispositivo
+    def __init__(self, ids: Sequence[str] = (), x: Sequence[float] = (), y: Sequence[float] = (),
+                 potencia: Sequence[float] = (), frequencia_uso: Optional[Sequence[float]] = None):
+        self.ids = list(ids)
+        self.x = array('d', x)
+        self.y = array('d', y)
+        self.potencia = array('d', potencia)
+        if frequencia_uso is None:
+            self.frequencia_uso = array('d', [1.0]) * len(self.ids)
+        else:
+            self.frequencia_uso = array('d', frequencia_uso)
+        self.canal_alocado = [None] * len(self.ids)  # Canal alocado após coloração
+        self.em_spill = array('b', bytes(len(self.ids)))  # 1 se não conseguiu canal
+        self._indices = None
+        self._validar_colunas()
+    
+    def _validar_colunas(self):
+        if not (len(self.ids) == len(self.x) == len(self.y) == len(self.potencia) == len(self.frequencia_uso)):
+            raise ValueError("Colunas da frota com tamanhos diferentes")
+    
+    def _tornar_extensivel(self):
+        # Colunas emprestadas (ex.: memoryviews de snapshot) não crescem: copia na primeira inserção
+        if not isinstance(self.ids, list):
+            self.ids = list(self.ids)
+        for nome in ('x', 'y', 'potencia', 'frequencia_uso'):
+            coluna = getattr(self, nome)
+            if not isinstance(coluna, array):
+                setattr(self, nome, array('d', coluna))
+    
+    @classmethod
+    def de_colunas(cls, ids: Sequence[str], x: Sequence[float], y: Sequence[float], potencia: Sequence[float],
+                   frequencia_uso: Sequence[float]) -> 'FrotaDispositivos':
+        # Usa as colunas recebidas sem copiar (ex.: memoryviews de um snapshot mapeado)
+        frota = cls.__new__(cls)
+        frota.ids = ids
+        frota.x = x
+        frota.y = y
+        frota.potencia = potencia
+        frota.frequencia_uso = frequencia_uso
+        frota.canal_alocado = [None] * len(ids)
+        frota.em_spill = array('b', bytes(len(ids)))
+        frota._indices = None
+        frota._validar_colunas()
+        return frota
+    
+    @classmethod
+    def de_dispositivos(cls, dispositivos: Iterable[DispositivoMovel]) -> 'FrotaDispositivos':
+        frota = cls()
+        for disp in dispositivos:
+            frota.adicionar(disp.id, disp.x, disp.y, disp.potencia, disp.frequencia_uso)
+        return frota
+    
+    def adicionar(self, id: str, x: float, y: float, potencia: float, frequencia_uso: float = 1.0) -> DispositivoFrota:
+        self._tornar_extensivel()
+        indice = len(self.ids)
+        self.ids.append(id)
+        self.x.append(x)
+        self.y.append(y)
+        self.potencia.append(potencia)
+        self.frequencia_uso.append(frequencia_uso)
+        self.canal_alocado.append(None)
+        self.em_spill.append(0)
+        if self._indices is not None:
+            self._indices.setdefault(id, indice)
+        return DispositivoFrota(self, indice)
+    
+    def indice(self, id: str) -> int:
+        if self._indices is None:
+            self._indices = {}
+            for i, disp_id in enumerate(self.ids):
+                self._indices.setdefault(disp_id, i)
+        return self._indices[id]
+    
+    def obter(self, id: str) -> DispositivoFrota:
+        return DispositivoFrota(self, self.indice(id))
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __getitem__(self, indice: int) -> DispositivoFrota:
+        if indice < 0:
+            indice += len(self.ids)
+        if not 0 <= indice < len(self.ids):
+            raise IndexError("Índice fora da frota")
+        return DispositivoFrota(self, indice)
+    
+    def __iter__(self):
+        for indice in range(len(self.ids)):
+            yield DispositivoFrota(self, indice)
+    
+    def __repr__(self):
+        return f"Frota({len(self.ids)} dispositivos)"
+
+
+ConjuntoDispositivos = Union[List[DispositivoMovel], FrotaDispositivos]
+
+
+def _ids_dispositivos(dispositivos: ConjuntoDispositivos) -> Sequence[str]:
+    if isinstance(dispositivos, FrotaDispositivos):
+        return dispositivos.ids
+    return [d.id for d in dispositivos]
+
+
+def _colunas_espaciais(dispositivos: ConjuntoDispositivos) -> Tuple[Sequence[str], Sequence[float], Sequence[float], Sequence[float]]:
+    if isinstance(dispositivos, FrotaDispositivos):
+        return dispositivos.ids, dispositivos.x, dispositivos.y, dispositivos.potencia
+    return ([d.id for d in dispositivos], [d.x for d in dispositivos],
+            [d.y for d in dispositivos], [d.potencia for d in dispositivos])
+
+
 class TransmissaoAtiva:
     def __init__(self, dispositivo_id: str, ativa: bool):
         self.dispositivo_id = dispositivo_id
@@ -48,13 +236,46 @@ class SlotTempo:
 
 
 class EscalonamentoRede:
-    def __init__(self, slots: List[SlotTempo]):
+    def __init__(self, slots: List[SlotTempo], indexado: bool = False):
         self.slots = slots
+        # Índice opcional mantido pelas operações do escalonamento; alterações
+        # feitas direto em self.slots precisam passar por sobrescrever_slots
+        self.indice = self._construir_indice() if indexado else None
+    
+    def ativar_indice(self) -> IndiceOcorrencias:
+        if self.indice is None:
+            self.indice = self._construir_indice()
+        return self.indice
     
     def sobrescrever_slots(self, novos_slots: List[SlotTempo]):
         self.slots = novos_slots
+        if self.indice is not None:
+            self.indice = self._construir_indice()
+    
+    def adicionar_slot(self, slot: SlotTempo):
+        self.slots.append(slot)
+        if self.indice is not None:
+            for trans in slot.transmissoes:
+                self.indice.adicionar(trans.dispositivo_id, slot, trans)
+            for req in slot.requisicoes:
+                self.indice.adicionar(req.dispositivo_id, slot, req)
     
-    def remapear_dispositivos(self, mapeamento: Dict[str, str]) -> None:
+    def _construir_indice(self) -> IndiceOcorrencias:
+        indice = IndiceOcorrencias()
+        for slot in self.slots:
+            for trans in slot.transmissoes:
+                indice.adicionar(trans.dispositivo_id, slot, trans)
+            for req in slot.requisicoes:
+                indice.adicionar(req.dispositivo_id, slot, req)
+        return indice
+    
+    def remapear_dispositivos(self, mapeamento: Dict[str, str], no_local: bool = False) -> None:
+        if no_local:
+            # O índice construído na primeira chamada fica ativo para as próximas renomeações;
+            # altera só os operandos que referenciam ids do mapeamento, sem recriar slots
+            self.ativar_indice().renomear(mapeamento, 'dispositivo_id')
+            return
+        
         novos_slots = []
         for slot in self.slots:
             novas_trans = [
@@ -75,9 +296,18 @@ class EscalonamentoRede:
                 SlotTempo(slot.tipo, novas_trans, novas_req, slot.peso)
             )
         
-        self.slots = novos_slots
+        self.sobrescrever_slots(novos_slots)
+    
+    def contar_ocorrencias(self, dispositivo_id: str) -> int:
+        return self.ativar_indice().contagem(dispositivo_id)
+    
+    def obter_posicoes(self, dispositivo_id: str) -> List[SlotTempo]:
+        return self.ativar_indice().posicoes(dispositivo_id)
     
     def obter_dispositivos(self) -> Set[str]:
+        if self.indice is not None:
+            return set(self.indice.chaves())
+        
         dispositivos = set()
         for slot in self.slots:
             for trans in slot.transmissoes:
@@ -89,105 +319,126 @@ class EscalonamentoRede:
 
 class GrafoInterferencia:
     def __init__(self):
-        self._lista_adjacencia = {}
-        self._pesos_arestas = {}
+        self.simbolos = TabelaSimbolos()
+        # Adjacência por índice: vizinho -> peso (simétrica, o peso fica nas duas pontas)
+        self._adjacencia = {}
     
     def __copy__(self):
         nova_classe = self.__class__
         novo_grafo = nova_classe.__new__(nova_classe)
-        novo_grafo._lista_adjacencia = copy.deepcopy(self._lista_adjacencia)
-        novo_grafo._pesos_arestas = copy.deepcopy(self._pesos_arestas)
+        # A tabela só cresce e é consistente entre cópias, então pode ser compartilhada
+        novo_grafo.simbolos = self.simbolos
+        novo_grafo._adjacencia = {no: dict(vizinhos) for no, vizinhos in self._adjacencia.items()}
         return novo_grafo
     
     def adicionar_aresta(self, x: str, y: str, peso: float = 1.0):
         if x == y:
             return
         
-        # Adiciona y à lista de adjacência de x
-        lista_x = self._lista_adjacencia.get(x, [])
-        if y not in lista_x:
-            lista_x.append(y)
-        self._lista_adjacencia[x] = lista_x
-        
-        # Adiciona x à lista de adjacência de y
-        lista_y = self._lista_adjacencia.get(y, [])
-        if x not in lista_y:
-            lista_y.append(x)
-        self._lista_adjacencia[y] = lista_y
-        
-        # Armazena peso da aresta
-        chave = tuple(sorted([x, y]))
-        self._pesos_arestas[chave] = peso
+        i = self.simbolos.internar(x)
+        j = self.simbolos.internar(y)
+        self._adjacencia.setdefault(i, {})[j] = peso
+        self._adjacencia.setdefault(j, {})[i] = peso
+    
+    def adicionar_arestas(self, arestas: Iterable[Tuple[str, str, float]]):
+        adjacencia = self._adjacencia
+        internar = self.simbolos.internar
+        for x, y, peso in arestas:
+            if x == y:
+                continue
+            i = internar(x)
+            j = internar(y)
+            adjacencia.setdefault(i, {})[j] = peso
+            adjacencia.setdefault(j, {})[i] = peso
     
     def contem_aresta(self, x: str, y: str) -> bool:
-        return y in self._lista_adjacencia.get(x, [])
+        return self.simbolos.indice(y) in self._adjacencia.get(self.simbolos.indice(x), ())
     
     def obter_peso_aresta(self, x: str, y: str) -> float:
-        chave = tuple(sorted([x, y]))
-        return self._pesos_arestas.get(chave, 0.0)
+        return self._adjacencia.get(self.simbolos.indice(x), {}).get(self.simbolos.indice(y), 0.0)
+    
+    def remover_aresta(self, x: str, y: str):
+        i = self.simbolos.indice(x)
+        j = self.simbolos.indice(y)
+        if j not in self._adjacencia.get(i, ()):
+            return
+        self._adjacencia[i].pop(j)
+        self._adjacencia[j].pop(i)
     
     def remover_no(self, no: str):
-        if no in self._lista_adjacencia:
-            # Remove arestas associadas
-            for vizinho in self._lista_adjacencia[no]:
-                chave = tuple(sorted([no, vizinho]))
-                self._pesos_arestas.pop(chave, None)       
-            self._lista_adjacencia.pop(no)
+        i = self.simbolos.indice(no)
+        vizinhos = self._adjacencia.pop(i, None)
+        if vizinhos is None:
+            return
         
-        # Remove o nó das listas de adjacência de outros nós
-        for chave in list(self._lista_adjacencia.keys()):
-            if no in self._lista_adjacencia[chave]:
-                self._lista_adjacencia[chave].remove(no)
+        # Adjacência é simétrica: só os vizinhos referenciam o nó removido
+        for vizinho in vizinhos:
+            self._adjacencia[vizinho].pop(i)
     
     def renomear_no(self, nome_antigo: str, nome_novo: str):
-        lista_antiga = self._lista_adjacencia.pop(nome_antigo, [])
-        lista_nova = self._lista_adjacencia.get(nome_novo, [])
-        
-        # Combina as listas e remove duplicatas
-        self._lista_adjacencia[nome_novo] = list(set(lista_antiga + lista_nova))
-        
-        # Remove auto-referência
-        if nome_novo in self._lista_adjacencia[nome_novo]:
-            self._lista_adjacencia[nome_novo].remove(nome_novo)
+        novo = self.simbolos.internar(nome_novo)
+        antigo = self.simbolos.indice(nome_antigo)
+        vizinhos_novo = self._adjacencia.setdefault(novo, {})
+        if antigo is None or antigo == novo:
+            return
         
-        # Atualiza todas as referências
-        for chave in self._lista_adjacencia.keys():
-            self._lista_adjacencia[chave] = list(set([
-                nome_novo if valor == nome_antigo else valor
-                for valor in self._lista_adjacencia[chave]
-            ]))
-            if chave in self._lista_adjacencia[chave]:
-                self._lista_adjacencia[chave].remove(chave)
+        # Só os vizinhos do nó antigo são tocados; aresta já existente mantém o peso
+        for vizinho, peso in self._adjacencia.pop(antigo, {}).items():
+            vizinhos_vizinho = self._adjacencia[vizinho]
+            vizinhos_vizinho.pop(antigo)
+            if vizinho == novo:
+                continue
+            vizinhos_vizinho.setdefault(novo, peso)
+            vizinhos_novo.setdefault(vizinho, peso)
+    
+    def compactar_simbolos(self, fator: float = 2.0, minimo: int = 64) -> bool:
+        # Nomes de nós removidos continuam internados; quando passam a dominar a tabela, ela é
+        # trocada por uma nova só com os nós vivos. Cópias ficam com a tabela antiga, intacta
+        if len(self.simbolos) <= max(minimo, fator * len(self._adjacencia)):
+            return False
         
-        # Atualiza pesos das arestas
-        novos_pesos = {}
-        for (a, b), peso in self._pesos_arestas.items():
-            nova_a = nome_novo if a == nome_antigo else a
-            nova_b = nome_novo if b == nome_antigo else b
-            if nova_a != nova_b:
-                chave = tuple(sorted([nova_a, nova_b]))
-                novos_pesos[chave] = peso
-        self._pesos_arestas = novos_pesos
+        nomes = self.simbolos.nomes
+        novo_indice = {antigo: novo for novo, antigo in enumerate(self._adjacencia)}
+        self.simbolos = TabelaSimbolos(nomes[antigo] for antigo in self._adjacencia)
+        self._adjacencia = {
+            novo_indice[no]: {novo_indice[vizinho]: peso for vizinho, peso in vizinhos.items()}
+            for no, vizinhos in self._adjacencia.items()
+        }
+        return True
+    
+    def mesclar_adjacencia_indices(self, adjacencia: Dict[int, Dict[int, float]]):
+        # Adjacência parcial já simétrica e sem laços, com índices desta tabela; os dicts
+        # recebidos passam a ser do grafo, sem cópia
+        for no, vizinhos in adjacencia.items():
+            existentes = self._adjacencia.get(no)
+            if existentes is None:
+                self._adjacencia[no] = vizinhos
+            else:
+                existentes.update(vizinhos)
+    
+    def vizinhos_indices(self, indice: int) -> Dict[int, float]:
+        return self._adjacencia.get(indice, {})
     
     def obter_vizinhos(self, x: str) -> List[str]:
-        return self._lista_adjacencia.get(x, [])
+        nomes = self.simbolos.nomes
+        return [nomes[j] for j in self._adjacencia.get(self.simbolos.indice(x), ())]
     
     def obter_nos(self) -> List[str]:
-        return list(self._lista_adjacencia.keys())
+        nomes = self.simbolos.nomes
+        return [nomes[i] for i in self._adjacencia]
     
     def calcular_grau(self, no: str) -> int:
-        return len(self.obter_vizinhos(no))
+        return len(self._adjacencia.get(self.simbolos.indice(no), ()))
     
     def obter_arestas(self) -> List[Tuple[str, str, float]]:
+        # Cada aresta sai pela ponta que aparece primeiro na ordem dos nós
+        nomes = self.simbolos.nomes
+        ordem = {no: posicao for posicao, no in enumerate(self._adjacencia)}
         arestas = []
-        visitadas = set()       
-        for origem in self._lista_adjacencia:
-            for destino in self._lista_adjacencia[origem]:
-                par = tuple(sorted([origem, destino]))
-                if par not in visitadas:
-                    peso = self._pesos_arestas.get(par, 1.0)
-                    arestas.append((origem, destino, peso))
-                    visitadas.add(par)
+        for origem, vizinhos in self._adjacencia.items():
+            for destino, peso in vizinhos.items():
+                if ordem[destino] > ordem[origem]:
+                    arestas.append((nomes[origem], nomes[destino], peso))
         
         return arestas
 
@@ -208,7 +459,179 @@ def calcular_interferencia(d1: DispositivoMovel, d2: DispositivoMovel, limiar_di
     return min(interferencia * fator_potencia, 1.0)
 
 
-def construir_grafo_interferencia_espacial( dispositivos: List[DispositivoMovel], limiar_distancia: float = 150.0, limiar_interferencia: float = 0.1) -> GrafoInterferencia:
+def _pares_candidatos_grade(xs: List[float], ys: List[float], limiar_distancia: float):
+    # Agrupa os dispositivos em células de lado limiar_distancia: pares com
+    # distância < limiar só podem estar na mesma célula ou em células vizinhas
+    celulas = {}
+    coordenadas_celula = []
+    for i in range(len(xs)):
+        celula = (math.floor(xs[i] / limiar_distancia), math.floor(ys[i] / limiar_distancia))
+        coordenadas_celula.append(celula)
+        celulas.setdefault(celula, []).append(i)
+    
+    for i, (cx, cy) in enumerate(coordenadas_celula):
+        candidatos = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in celulas.get((cx + dx, cy + dy), ()):
+                    if j > i:
+                        candidatos.append(j)
+        # Mantém a mesma ordem de inserção da varredura por força bruta
+        candidatos.sort()
+        yield i, candidatos
+
+
+def calcular_arestas_lote(xs: Sequence[float], ys: Sequence[float], potencias: Sequence[float], limiar_distancia: float, limiar_interferencia: float, pares: Optional[Iterable[Tuple[int, Sequence[int]]]] = None) -> List[Tuple[int, int, float]]:
+    # Sem bloco de pares explícito, avalia todos os pares i < j do conjunto
+    if pares is None:
+        n = len(xs)
+        pares = ((i, range(i + 1, n)) for i in range(n))
+    
+    sqrt = math.sqrt
+    # Pares fora do alcance têm interferência 0.0, que só sobrevive a limiares não positivos
+    inclui_nulas = limiar_interferencia <= 0.0
+    arestas = []
+    adicionar = arestas.append
+    for i, candidatos in pares:
+        xi = xs[i]
+        yi = ys[i]
+        pi = potencias[i]
+        for j in candidatos:
+            dx = xi - xs[j]
+            dy = yi - ys[j]
+            # Corte barato: com |dx| ou |dy| acima do limiar a distância também está
+            if dx > limiar_distancia or -dx > limiar_distancia or dy > limiar_distancia or -dy > limiar_distancia:
+                if inclui_nulas:
+                    adicionar((i, j, 0.0))
+                continue
+            
+            # Mesma fórmula de calcular_interferencia, operando direto nas colunas
+            distancia = sqrt(dx**2 + dy**2)
+            if distancia >= limiar_distancia:
+                if inclui_nulas:
+                    adicionar((i, j, 0.0))
+                continue
+            interferencia = (1.0 - (distancia / limiar_distancia)) * ((pi + potencias[j]) / 200.0)
+            if interferencia > 1.0:
+                interferencia = 1.0
+            if interferencia >= limiar_interferencia:
+                adicionar((i, j, interferencia))
+    
+    return arestas
+
+
+def _arestas_tile(tarefa) -> List[Tuple[int, int, float]]:
+    indices, proprios, xs, ys, potencias, limiar_distancia, limiar_interferencia = tarefa
+    # Índices locais seguem a ordem global, então i < j local implica i < j global;
+    # cada par é emitido apenas pelo tile dono do menor índice
+    pares = (
+        (i, candidatos)
+        for i, candidatos in _pares_candidatos_grade(xs, ys, limiar_distancia)
+        if proprios[i]
+    )
+    return [
+        (indices[i], indices[j], peso)
+        for i, j, peso in calcular_arestas_lote(xs, ys, potencias, limiar_distancia, limiar_interferencia, pares)
+    ]
+
+
+def _tarefas_tiles(xs: Sequence[float], ys: Sequence[float], potencias: Sequence[float], limiar_distancia: float, limiar_interferencia: float, quantidade_tiles: int):
+    if len(xs) == 0:
+        return []
+    
+    x_min, x_max = min(xs), max(xs)
+    y_min, y_max = min(ys), max(ys)
+    lado = max(1, math.ceil(math.sqrt(quantidade_tiles)))
+    # Tiles nunca menores que o limiar: o halo alcança no máximo um tile vizinho por eixo
+    largura = max(limiar_distancia, (x_max - x_min) / lado)
+    altura = max(limiar_distancia, (y_max - y_min) / lado)
+    
+    membros = {}
+    for i in range(len(xs)):
+        tx = math.floor((xs[i] - x_min) / largura)
+        ty = math.floor((ys[i] - y_min) / altura)
+        # Dono do dispositivo
+        membros.setdefault((tx, ty), []).append((i, True))
+        # Halo: tiles cuja borda expandida por limiar_distancia contém o dispositivo
+        tx_min = math.floor((xs[i] - limiar_distancia - x_min) / largura)
+        tx_max = math.floor((xs[i] + limiar_distancia - x_min) / largura)
+        ty_min = math.floor((ys[i] - limiar_distancia - y_min) / altura)
+        ty_max = math.floor((ys[i] + limiar_distancia - y_min) / altura)
+        for vx in range(tx_min, tx_max + 1):
+            for vy in range(ty_min, ty_max + 1):
+                if (vx, vy) != (tx, ty):
+                    membros.setdefault((vx, vy), []).append((i, False))
+    
+    tarefas = []
+    for tile in membros.values():
+        if not any(proprio for _, proprio in tile):
+            continue
+        tile.sort()
+        indices = [i for i, _ in tile]
+        tarefas.append((
+            indices,
+            [proprio for _, proprio in tile],
+            [xs[i] for i in indices],
+            [ys[i] for i in indices],
+            [potencias[i] for i in indices],
+            limiar_distancia,
+            limiar_interferencia,
+        ))
+    return tarefas
+
+
+def construir_grafo_interferencia_espacial( dispositivos: ConjuntoDispositivos, limiar_distancia: float = 150.0, limiar_interferencia: float = 0.1, modo: str = 'forca_bruta', processos: Optional[int] = None) -> GrafoInterferencia:
+    if modo not in ('forca_bruta', 'grade', 'lote', 'paralelo'):
+        raise ValueError(f"Modo de construção desconhecido: {modo}")
+    
+    # Sem limiares positivos não há localidade para dividir em tiles
+    if modo == 'paralelo' and (limiar_distancia <= 0 or limiar_interferencia <= 0):
+        modo = 'lote'
+    
+    if modo == 'paralelo':
+        ids, xs, ys, potencias = _colunas_espaciais(dispositivos)
+        processos = processos or os.cpu_count() or 1
+        tarefas = _tarefas_tiles(xs, ys, potencias, limiar_distancia, limiar_interferencia, 4 * processos)
+        
+        arestas = []
+        if processos > 1 and len(tarefas) > 1:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                for arestas_tile in executor.map(_arestas_tile, tarefas):
+                    arestas.extend(arestas_tile)
+        else:
+            for tarefa in tarefas:
+                arestas.extend(_arestas_tile(tarefa))
+        
+        # Ordena pelos índices globais para inserir na mesma ordem da força bruta
+        arestas.sort(key=lambda aresta: (aresta[0], aresta[1]))
+        grafo = GrafoInterferencia()
+        grafo.adicionar_arestas((ids[i], ids[j], peso) for i, j, peso in arestas)
+        return grafo
+    
+    if modo == 'lote':
+        ids, xs, ys, potencias = _colunas_espaciais(dispositivos)
+        pares = None
+        if limiar_distancia > 0 and limiar_interferencia > 0:
+            pares = _pares_candidatos_grade(xs, ys, limiar_distancia)
+        arestas = calcular_arestas_lote(xs, ys, potencias, limiar_distancia, limiar_interferencia, pares)
+        
+        grafo = GrafoInterferencia()
+        grafo.adicionar_arestas((ids[i], ids[j], peso) for i, j, peso in arestas)
+        return grafo
+    
+    # Sem limiar positivo todo par pode gerar aresta, então a grade não poda nada
+    if modo == 'grade' and limiar_distancia > 0 and limiar_interferencia > 0:
+        grafo = GrafoInterferencia()
+        _, xs, ys, _ = _colunas_espaciais(dispositivos)
+        for i, candidatos in _pares_candidatos_grade(xs, ys, limiar_distancia):
+            d1 = dispositivos[i]
+            for j in candidatos:
+                d2 = dispositivos[j]
+                interferencia = calcular_interferencia(d1, d2, limiar_distancia)
+                if interferencia >= limiar_interferencia:
+                    grafo.adicionar_aresta(d1.id, d2.id, interferencia)
+        return grafo
+    
     grafo = GrafoInterferencia()
     for i in range(len(dispositivos)):
         for j in range(i + 1, len(dispositivos)):
@@ -223,10 +646,492 @@ def construir_grafo_interferencia_espacial( dispositivos: List[DispositivoMovel]
     return grafo
 
 
-def construir_grafo_interferencia_temporal(escalonamento: EscalonamentoRede) -> GrafoInterferencia:
+class GrafoInterferenciaIncremental:
+    # Mantém o grafo espacial atualizado conforme dispositivos se movem, entram ou saem
+    def __init__(self, dispositivos: ConjuntoDispositivos = (), limiar_distancia: float = 150.0, limiar_interferencia: float = 0.1):
+        if limiar_distancia <= 0 or limiar_interferencia <= 0:
+            raise ValueError("Atualização incremental exige limiares positivos")
+        
+        self.limiar_distancia = limiar_distancia
+        self.limiar_interferencia = limiar_interferencia
+        self.grafo = GrafoInterferencia()
+        self._dispositivos = {}
+        self._celula_dispositivo = {}
+        self._celulas = {}
+        
+        for disp in dispositivos:
+            self.adicionar_dispositivo(disp.id, disp.x, disp.y, disp.potencia)
+    
+    def _celula(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.limiar_distancia), math.floor(y / self.limiar_distancia))
+    
+    def _conectar(self, disp_id: str):
+        disp = self._dispositivos[disp_id]
+        cx, cy = self._celula_dispositivo[disp_id]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for outro_id in self._celulas.get((cx + dx, cy + dy), ()):
+                    if outro_id == disp_id:
+                        continue
+                    interferencia = calcular_interferencia(disp, self._dispositivos[outro_id], self.limiar_distancia)
+                    if interferencia >= self.limiar_interferencia:
+                        self.grafo.adicionar_aresta(disp_id, outro_id, interferencia)
+    
+    def _desconectar(self, disp_id: str):
+        vizinhos = list(self.grafo.obter_vizinhos(disp_id))
+        self.grafo.remover_no(disp_id)
+        # Reconstrução completa não teria nós sem arestas
+        for vizinho in vizinhos:
+            if self.grafo.calcular_grau(vizinho) == 0:
+                self.grafo.remover_no(vizinho)
+        # Dispositivos entram e saem sem parar: descarta os nomes que já saíram
+        self.grafo.compactar_simbolos()
+    
+    def adicionar_dispositivo(self, disp_id: str, x: float, y: float, potencia: float):
+        if disp_id in self._dispositivos:
+            raise ValueError(f"Dispositivo já existe: {disp_id}")
+        
+        self._dispositivos[disp_id] = DispositivoMovel(disp_id, x, y, potencia)
+        celula = self._celula(x, y)
+        self._celula_dispositivo[disp_id] = celula
+        self._celulas.setdefault(celula, {})[disp_id] = None
+        self._conectar(disp_id)
+    
+    def remover_dispositivo(self, disp_id: str):
+        self._desconectar(disp_id)
+        celula = self._celula_dispositivo.pop(disp_id)
+        ocupantes = self._celulas[celula]
+        ocupantes.pop(disp_id)
+        if not ocupantes:
+            self._celulas.pop(celula)
+        self._dispositivos.pop(disp_id)
+    
+    def mover_dispositivo(self, disp_id: str, x: float, y: float):
+        disp = self._dispositivos[disp_id]
+        self._desconectar(disp_id)
+        
+        celula_antiga = self._celula_dispositivo[disp_id]
+        celula_nova = self._celula(x, y)
+        if celula_nova != celula_antiga:
+            ocupantes = self._celulas[celula_antiga]
+            ocupantes.pop(disp_id)
+            if not ocupantes:
+                self._celulas.pop(celula_antiga)
+            self._celulas.setdefault(celula_nova, {})[disp_id] = None
+            self._celula_dispositivo[disp_id] = celula_nova
+        
+        disp.x = x
+        disp.y = y
+        self._conectar(disp_id)
+    
+    def obter_grafo(self) -> GrafoInterferencia:
+        return self.grafo
+
+
+def escrever_slots(caminho: str, slots: Iterable[SlotTempo]) -> None:
+    # Um slot por linha (JSON Lines), para poder ser lido de forma preguiçosa
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for slot in slots:
+            registro = {
+                'tipo': slot.tipo,
+                'transmissoes': [[trans.dispositivo_id, trans.ativa] for trans in slot.transmissoes],
+                'requisicoes': [[req.dispositivo_id, req.libera] for req in slot.requisicoes],
+                'peso': slot.peso,
+            }
+            arquivo.write(json.dumps(registro) + '\n')
+
+
+def ler_slots(caminho: str) -> Iterator[SlotTempo]:
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            if not linha.strip():
+                continue
+            registro = json.loads(linha)
+            yield SlotTempo(
+                registro['tipo'],
+                [TransmissaoAtiva(disp_id, ativa) for disp_id, ativa in registro['transmissoes']],
+                [RequisicaoCanal(disp_id, libera) for disp_id, libera in registro['requisicoes']],
+                registro.get('peso', 1.0)
+            )
+
+
+MAGICO_SNAPSHOT = b'GICS'
+VERSAO_SNAPSHOT = 1
+# magico, versão, dispositivos, nomes, slots, transmissões, requisições, bytes de nomes
+_CABECALHO_SNAPSHOT = struct.Struct('<4sIQQQQQQ')
+_TIPOS_SLOT = ('inicio_frame', 'slot_normal')
+
+
+def _escrever_secao(arquivo, dados: bytes):
+    arquivo.write(dados)
+    # Mantém cada seção alinhada em 8 bytes para os casts de memoryview
+    arquivo.write(bytes(-len(dados) % 8))
+
+
+def salvar_snapshot(caminho: str, dispositivos: ConjuntoDispositivos = (), slots: Iterable[SlotTempo] = ()) -> None:
+    nomes = list(_ids_dispositivos(dispositivos))
+    indice_nome = {}
+    for i, nome in enumerate(nomes):
+        indice_nome.setdefault(nome, i)
+    
+    def indice_de(nome: str) -> int:
+        if nome not in indice_nome:
+            indice_nome[nome] = len(nomes)
+            nomes.append(nome)
+        return indice_nome[nome]
+    
+    tipos = bytearray()
+    pesos = array('d')
+    inicio_trans = array('Q', [0])
+    trans_disp = array('I')
+    trans_ativa = bytearray()
+    inicio_req = array('Q', [0])
+    req_disp = array('I')
+    req_libera = bytearray()
+    for slot in slots:
+        # Os construtores temporais tratam todo tipo diferente de 'inicio_frame' como slot normal
+        tipos.append(0 if slot.tipo == 'inicio_frame' else 1)
+        pesos.append(slot.peso)
+        for trans in slot.transmissoes:
+            trans_disp.append(indice_de(trans.dispositivo_id))
+            trans_ativa.append(1 if trans.ativa else 0)
+        inicio_trans.append(len(trans_disp))
+        for req in slot.requisicoes:
+            req_disp.append(indice_de(req.dispositivo_id))
+            req_libera.append(1 if req.libera else 0)
+        inicio_req.append(len(req_disp))
+    
+    codificados = [nome.encode('utf-8') for nome in nomes]
+    inicio_nomes = array('Q', [0])
+    for nome in codificados:
+        inicio_nomes.append(inicio_nomes[-1] + len(nome))
+    
+    quantidade = len(dispositivos)
+    if isinstance(dispositivos, FrotaDispositivos):
+        colunas = [dispositivos.x, dispositivos.y, dispositivos.potencia, dispositivos.frequencia_uso]
+    else:
+        colunas = [[getattr(d, campo) for d in dispositivos] for campo in ('x', 'y', 'potencia', 'frequencia_uso')]
+    
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(_CABECALHO_SNAPSHOT.pack(
+            MAGICO_SNAPSHOT, VERSAO_SNAPSHOT, quantidade, len(nomes), len(tipos),
+            len(trans_disp), len(req_disp), inicio_nomes[-1]
+        ))
+        _escrever_secao(arquivo, inicio_nomes.tobytes())
+        _escrever_secao(arquivo, b''.join(codificados))
+        for coluna in colunas:
+            _escrever_secao(arquivo, array('d', coluna).tobytes())
+        _escrever_secao(arquivo, bytes(tipos))
+        _escrever_secao(arquivo, pesos.tobytes())
+        _escrever_secao(arquivo, inicio_trans.tobytes())
+        _escrever_secao(arquivo, trans_disp.tobytes())
+        _escrever_secao(arquivo, bytes(trans_ativa))
+        _escrever_secao(arquivo, inicio_req.tobytes())
+        _escrever_secao(arquivo, req_disp.tobytes())
+        _escrever_secao(arquivo, bytes(req_libera))
+
+
+class _TabelaNomes:
+    # Sequência de ids decodificada sob demanda a partir do buffer mapeado
+    def __init__(self, inicios: memoryview, dados: memoryview, quantidade: Optional[int] = None):
+        self._inicios = inicios
+        self._dados = dados
+        self._quantidade = len(inicios) - 1 if quantidade is None else quantidade
+    
+    def __len__(self):
+        return self._quantidade
+    
+    def __getitem__(self, indice: int) -> str:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fora da tabela de nomes")
+        return str(self._dados[self._inicios[indice]:self._inicios[indice + 1]], 'utf-8')
+    
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+
+class SnapshotCenario:
+    # Snapshot binário aberto com mmap: as colunas são memoryviews sobre o arquivo, sem cópia
+    def __init__(self, caminho: str):
+        with open(caminho, 'rb') as arquivo:
+            # ACCESS_COPY: colunas graváveis sem alterar o arquivo em disco
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._visoes = []
+        
+        magico, versao, quantidade, n_nomes, n_slots, n_trans, n_req, bytes_nomes = _CABECALHO_SNAPSHOT.unpack_from(self._mapa, 0)
+        if magico != MAGICO_SNAPSHOT or versao != VERSAO_SNAPSHOT:
+            self._mapa.close()
+            raise ValueError(f"Arquivo não é um snapshot válido: {caminho}")
+        
+        self._posicao = _CABECALHO_SNAPSHOT.size
+        inicios_nomes = self._secao('Q', n_nomes + 1)
+        dados_nomes = self._secao('B', bytes_nomes)
+        self._nomes = _TabelaNomes(inicios_nomes, dados_nomes)
+        # Os primeiros nomes são os da frota; os demais só aparecem nos slots
+        self.ids = _TabelaNomes(inicios_nomes, dados_nomes, quantidade)
+        self.x = self._secao('d', quantidade)
+        self.y = self._secao('d', quantidade)
+        self.potencia = self._secao('d', quantidade)
+        self.frequencia_uso = self._secao('d', quantidade)
+        self.tipos_slot = self._secao('B', n_slots)
+        self.pesos_slot = self._secao('d', n_slots)
+        self.inicio_transmissoes = self._secao('Q', n_slots + 1)
+        self.transmissao_dispositivo = self._secao('I', n_trans)
+        self.transmissao_ativa = self._secao('B', n_trans)
+        self.inicio_requisicoes = self._secao('Q', n_slots + 1)
+        self.requisicao_dispositivo = self._secao('I', n_req)
+        self.requisicao_libera = self._secao('B', n_req)
+        self.quantidade_dispositivos = quantidade
+        self.quantidade_slots = n_slots
+    
+    def _secao(self, formato: str, quantidade: int) -> memoryview:
+        tamanho = quantidade * struct.calcsize(formato)
+        bruta = memoryview(self._mapa)[self._posicao:self._posicao + tamanho]
+        visao = bruta.cast(formato)
+        self._visoes.extend((bruta, visao))
+        self._posicao += tamanho + (-tamanho % 8)
+        return visao
+    
+    def frota(self) -> FrotaDispositivos:
+        return FrotaDispositivos.de_colunas(self.ids, self.x, self.y, self.potencia, self.frequencia_uso)
+    
+    def slots(self) -> Iterator[SlotTempo]:
+        # Materializa um slot por vez a partir dos buffers mapeados
+        ids = self._nomes
+        for s in range(self.quantidade_slots):
+            transmissoes = [
+                TransmissaoAtiva(ids[self.transmissao_dispositivo[t]], bool(self.transmissao_ativa[t]))
+                for t in range(self.inicio_transmissoes[s], self.inicio_transmissoes[s + 1])
+            ]
+            requisicoes = [
+                RequisicaoCanal(ids[self.requisicao_dispositivo[r]], bool(self.requisicao_libera[r]))
+                for r in range(self.inicio_requisicoes[s], self.inicio_requisicoes[s + 1])
+            ]
+            yield SlotTempo(_TIPOS_SLOT[self.tipos_slot[s]], transmissoes, requisicoes, self.pesos_slot[s])
+    
+    def fechar(self):
+        for visao in reversed(self._visoes):
+            visao.release()
+        self._visoes = []
+        self._mapa.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def abrir_snapshot(caminho: str) -> SnapshotCenario:
+    return SnapshotCenario(caminho)
+
+
+class _BlocoSlots:
+    # Slots de um ou mais frames em colunas de ids internados, no layout do snapshot
+    # (tipo 0 = 'inicio_frame', 1 = slot normal; operandos delimitados por deslocamentos)
+    def __init__(self):
+        self.tipos_slot = bytearray()
+        self.inicio_transmissoes = array('q', [0])
+        self.transmissao_dispositivo = array('i')
+        self.transmissao_ativa = bytearray()
+        self.inicio_requisicoes = array('q', [0])
+        self.requisicao_dispositivo = array('i')
+        self.requisicao_libera = bytearray()
+    
+    def adicionar(self, slot: SlotTempo, internar: Callable[[str], int]):
+        self.tipos_slot.append(0 if slot.tipo == 'inicio_frame' else 1)
+        # Compreensões em vez de append por operando: a codificação pesa tanto quanto a varredura
+        transmissoes = slot.transmissoes
+        if transmissoes:
+            self.transmissao_dispositivo.extend([internar(trans.dispositivo_id) for trans in transmissoes])
+            self.transmissao_ativa.extend([1 if trans.ativa else 0 for trans in transmissoes])
+        self.inicio_transmissoes.append(len(self.transmissao_dispositivo))
+        requisicoes = slot.requisicoes
+        if requisicoes:
+            self.requisicao_dispositivo.extend([internar(req.dispositivo_id) for req in requisicoes])
+            self.requisicao_libera.extend([1 if req.libera else 0 for req in requisicoes])
+        self.inicio_requisicoes.append(len(self.requisicao_dispositivo))
+    
+    def __len__(self):
+        return len(self.tipos_slot)
+
+
+def _blocos_slots(slots: Iterable[SlotTempo], internar: Callable[[str], int], frames_por_bloco: int) -> Iterator[_BlocoSlots]:
+    # Cada 'inicio_frame' abre um frame; slots anteriores ao primeiro formam um frame próprio
+    bloco = _BlocoSlots()
+    frames = 0
+    for slot in slots:
+        if slot.tipo == 'inicio_frame' and len(bloco):
+            frames += 1
+            if frames >= frames_por_bloco:
+                yield bloco
+                bloco = _BlocoSlots()
+                frames = 0
+        bloco.adicionar(slot, internar)
+    if len(bloco):
+        yield bloco
+
+
+def _fechar_frame(adjacencia: Dict[int, Dict[int, float]], abertos: Dict[int, list], intervalos: List[Tuple[int, int, int]],
+                  tempos: List[int], transmissores: List[int], tempo: int):
+    for disp, (_, inicio) in abertos.items():
+        intervalos.append((inicio, tempo, disp))
+    
+    # Lado do intervalo: d recebe, em lote, quem transmitiu durante (inicio, fim)
+    for inicio, fim, disp in intervalos:
+        primeiro = bisect_right(tempos, inicio)
+        ultimo = bisect_left(tempos, fim)
+        if primeiro < ultimo:
+            novos = dict.fromkeys(transmissores[primeiro:ultimo], 1.0)
+            vizinhos = adjacencia.get(disp)
+            if vizinhos is None:
+                adjacencia[disp] = novos
+            else:
+                vizinhos.update(novos)
+
+
+def _varrer_bloco(bloco: _BlocoSlots) -> Dict[int, Dict[int, float]]:
+    # Varredura por intervalos sobre ids: cada evento (liberação ou transmissão) recebe um instante
+    # único e crescente, e uma transmissão no instante t interfere com todo dispositivo cujo
+    # intervalo de atividade [inicio, fim) contém t depois da ativação. Devolve a adjacência
+    # simétrica do bloco; os dois lados de cada aresta são preenchidos com atualizações de dict em lote
+    tipos = bloco.tipos_slot
+    inicio_transmissoes, transmissao_dispositivo, transmissao_ativa = (
+        bloco.inicio_transmissoes, bloco.transmissao_dispositivo, bloco.transmissao_ativa)
+    inicio_requisicoes, requisicao_dispositivo, requisicao_libera = (
+        bloco.inicio_requisicoes, bloco.requisicao_dispositivo, bloco.requisicao_libera)
+    
+    adjacencia = {}
+    abertos = {}  # id -> [ativações abertas, instante da primeira]
+    ativos = {}  # Mesmas chaves de abertos, com o peso pronto para dict.update
+    intervalos = []
+    tempos = []
+    transmissores = []
+    tempo = 0
+    
+    for s in range(len(tipos)):
+        if tipos[s] == 0:
+            if s:
+                if tempos:
+                    _fechar_frame(adjacencia, abertos, intervalos, tempos, transmissores, tempo)
+                abertos, ativos, intervalos, tempos, transmissores = {}, {}, [], [], []
+            for t in range(inicio_transmissoes[s], inicio_transmissoes[s + 1]):
+                if transmissao_ativa[t]:
+                    disp = transmissao_dispositivo[t]
+                    estado = abertos.get(disp)
+                    if estado is None:
+                        abertos[disp] = [1, tempo]
+                        ativos[disp] = 1.0
+                    else:
+                        estado[0] += 1
+                tempo += 1
+            continue
+        
+        for r in range(inicio_requisicoes[s], inicio_requisicoes[s + 1]):
+            if requisicao_libera[r]:
+                disp = requisicao_dispositivo[r]
+                estado = abertos.get(disp)
+                if estado is not None:
+                    if estado[0] == 1:
+                        del abertos[disp]
+                        del ativos[disp]
+                        intervalos.append((estado[1], tempo, disp))
+                    else:
+                        estado[0] -= 1
+            tempo += 1
+        
+        for t in range(inicio_transmissoes[s], inicio_transmissoes[s + 1]):
+            disp = transmissao_dispositivo[t]
+            tempos.append(tempo)
+            transmissores.append(disp)
+            # Lado da transmissão: recebe, em lote, todos os ativos neste instante
+            if ativos:
+                vizinhos = adjacencia.get(disp)
+                if vizinhos is None:
+                    adjacencia[disp] = dict(ativos)
+                else:
+                    vizinhos.update(ativos)
+            if transmissao_ativa[t]:
+                estado = abertos.get(disp)
+                if estado is None:
+                    abertos[disp] = [1, tempo]
+                    ativos[disp] = 1.0
+                else:
+                    estado[0] += 1
+            tempo += 1
+    
+    _fechar_frame(adjacencia, abertos, intervalos, tempos, transmissores, tempo)
+    
+    # Os lotes incluem o próprio dispositivo quando ele estava ativo; nós só com laço somem
+    for disp in list(adjacencia):
+        vizinhos = adjacencia[disp]
+        vizinhos.pop(disp, None)
+        if not vizinhos:
+            del adjacencia[disp]
+    return adjacencia
+
+
+def _varrer_bloco_em_colunas(bloco: _BlocoSlots) -> Tuple[array, array, array]:
+    # Resultado de um processo: nós, deslocamentos e vizinhos em arrays planos de ids, que
+    # atravessam o pickle como bytes; o processo principal traduz ids em nomes uma vez só
+    nos = array('i')
+    inicio_vizinhos = array('q', [0])
+    vizinhos = array('i')
+    for no, vizinhos_no in _varrer_bloco(bloco).items():
+        nos.append(no)
+        vizinhos.extend(vizinhos_no)
+        inicio_vizinhos.append(len(vizinhos))
+    return nos, inicio_vizinhos, vizinhos
+
+
+def _adjacencia_de_colunas(colunas: Tuple[array, array, array]) -> Dict[int, Dict[int, float]]:
+    nos, inicio_vizinhos, vizinhos = colunas
+    return {
+        no: dict.fromkeys(vizinhos[inicio_vizinhos[k]:inicio_vizinhos[k + 1]], 1.0)
+        for k, no in enumerate(nos)
+    }
+
+
+def construir_grafo_interferencia_temporal_fluxo(slots: Iterable[SlotTempo], modo: str = 'sequencial', processos: Optional[int] = None, frames_por_tarefa: int = 256) -> GrafoInterferencia:
+    if modo not in ('sequencial', 'intervalos', 'paralelo'):
+        raise ValueError(f"Modo de construção desconhecido: {modo}")
+    
+    if modo == 'paralelo':
+        # Frames são independentes (conjunto_ativos zera a cada inicio_frame). Os blocos vão aos
+        # processos já em colunas de ids da tabela do grafo, e voltam como adjacência em ids
+        grafo = GrafoInterferencia()
+        processos = processos or os.cpu_count() or 1
+        blocos = _blocos_slots(slots, grafo.simbolos.internar, frames_por_tarefa)
+        if processos == 1:
+            for bloco in blocos:
+                grafo.mesclar_adjacencia_indices(_varrer_bloco(bloco))
+            return grafo
+        
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            # Limita as tarefas em voo para não materializar o escalonamento inteiro
+            pendentes = []
+            for bloco in blocos:
+                pendentes.append(executor.submit(_varrer_bloco_em_colunas, bloco))
+                if len(pendentes) >= 2 * processos:
+                    grafo.mesclar_adjacencia_indices(_adjacencia_de_colunas(pendentes.pop(0).result()))
+            for pendente in pendentes:
+                grafo.mesclar_adjacencia_indices(_adjacencia_de_colunas(pendente.result()))
+        return grafo
+    
+    if modo == 'intervalos':
+        # Blocos de frames em ids da própria tabela do grafo: a adjacência volta pronta para mesclar
+        grafo = GrafoInterferencia()
+        for bloco in _blocos_slots(slots, grafo.simbolos.internar, frames_por_tarefa):
+            grafo.mesclar_adjacencia_indices(_varrer_bloco(bloco))
+        return grafo
+    
+    # Consome os slots um a um: só o estado do frame corrente fica em memória
     grafo = GrafoInterferencia()
     conjunto_ativos = {}
-    for slot in escalonamento.slots:
+    for slot in slots:
         if slot.tipo == 'inicio_frame':
             # Inicia novo frame
             conjunto_ativos = {}
@@ -254,82 +1159,217 @@ def construir_grafo_interferencia_temporal(escalonamento: EscalonamentoRede) ->
     return grafo
 
 
+def construir_grafo_interferencia_temporal(escalonamento: EscalonamentoRede, modo: str = 'sequencial', processos: Optional[int] = None) -> GrafoInterferencia:
+    return construir_grafo_interferencia_temporal_fluxo(escalonamento.slots, modo, processos)
+
+
+class GrafoInterferenciaJanela:
+    # Grafo temporal dos últimos tamanho_janela frames, com contagem de referências por aresta
+    def __init__(self, tamanho_janela: int):
+        if tamanho_janela < 1:
+            raise ValueError("A janela precisa ter ao menos um frame")
+        
+        self.tamanho_janela = tamanho_janela
+        self.grafo = GrafoInterferencia()
+        self._frames = deque()
+        self._contagens = {}
+        self._frame_aberto = []  # Slots recebidos do frame corrente, ainda fora da janela
+    
+    def adicionar_frame(self, frame: List[SlotTempo]):
+        # Um frame completo vem depois dos slots já recebidos: fecha o frame aberto antes
+        self.fechar_frame()
+        self._registrar_frame(frame)
+    
+    def adicionar_slots(self, slots: Iterable[SlotTempo]):
+        # Slots chegam em fluxo contínuo: o frame só entra na janela quando o próximo
+        # 'inicio_frame' chega ou quando fechar_frame é chamado
+        for slot in slots:
+            if slot.tipo == 'inicio_frame' and self._frame_aberto:
+                self._registrar_frame(self._frame_aberto)
+                self._frame_aberto = []
+            self._frame_aberto.append(slot)
+    
+    def fechar_frame(self):
+        if self._frame_aberto:
+            self._registrar_frame(self._frame_aberto)
+            self._frame_aberto = []
+    
+    def _registrar_frame(self, frame: List[SlotTempo]):
+        bloco = _BlocoSlots()
+        for slot in frame:
+            bloco.adicionar(slot, self.grafo.simbolos.internar)
+        # Pares por nome: a contagem sobrevive à compactação da tabela do grafo
+        nomes = self.grafo.simbolos.nomes
+        arestas = {
+            (nomes[i], nomes[j]) if nomes[i] < nomes[j] else (nomes[j], nomes[i])
+            for i, vizinhos in _varrer_bloco(bloco).items() for j in vizinhos if i < j
+        }
+        for a, b in arestas:
+            contador = self._contagens.get((a, b), 0)
+            if contador == 0:
+                self.grafo.adicionar_aresta(a, b)
+            self._contagens[(a, b)] = contador + 1
+        self._frames.append(arestas)
+        
+        while len(self._frames) > self.tamanho_janela:
+            self._remover_frame_mais_antigo()
+    
+    def _remover_frame_mais_antigo(self):
+        for a, b in self._frames.popleft():
+            contador = self._contagens[(a, b)] - 1
+            if contador > 0:
+                self._contagens[(a, b)] = contador
+                continue
+            
+            self._contagens.pop((a, b))
+            self.grafo.remover_aresta(a, b)
+            # Nós sem arestas não existiriam numa reconstrução da janela
+            for no in (a, b):
+                if self.grafo.calcular_grau(no) == 0:
+                    self.grafo.remover_no(no)
+        # Frames antigos levam nomes que talvez não voltem: descarta os que saíram da janela
+        self.grafo.compactar_simbolos()
+    
+    def obter_grafo(self) -> GrafoInterferencia:
+        return self.grafo
+
+
 def colorir_grafo(grafo: GrafoInterferencia, dispositivos: List[str], canais: List[str]) -> Optional[Dict[str, str]]:
-    if len(dispositivos) == 0:
-        return {}
-    # Encontra nó com grau < k
-    no_escolhido = None
-    for no in dispositivos:
-        if len(grafo.obter_vizinhos(no)) < len(canais):
-            no_escolhido = no
-            break
-    if no_escolhido is None:
+    k = len(canais)
+    # Trabalha com posições locais; o grau conta todos os vizinhos no grafo, mesmo os fora da lista
+    nomes = list(dict.fromkeys(dispositivos))
+    indices = [grafo.simbolos.indice(nome) for nome in nomes]
+    posicao_local = {indice: posicao for posicao, indice in enumerate(indices) if indice is not None}
+    grau = [len(grafo.vizinhos_indices(indice)) if indice is not None else 0 for indice in indices]
+    removido = bytearray(len(nomes))
+    
+    # Simplificação: balde de nós com grau < k, realimentado quando um vizinho cai para k - 1
+    baixo_grau = [posicao for posicao in range(len(nomes)) if grau[posicao] < k]
+    pilha = []
+    while baixo_grau:
+        posicao = baixo_grau.pop()
+        removido[posicao] = 1
+        pilha.append(posicao)
+        if indices[posicao] is None:
+            continue
+        for vizinho in grafo.vizinhos_indices(indices[posicao]):
+            vizinho = posicao_local.get(vizinho)
+            if vizinho is None or removido[vizinho]:
+                continue
+            grau[vizinho] -= 1
+            if grau[vizinho] == k - 1:
+                baixo_grau.append(vizinho)
+    
+    if len(pilha) < len(nomes):
         # Não há nó com grau suficientemente baixo
         return None
     
-    # Remove nó e colore recursivamente
-    grafo_copia = copy.copy(grafo)
-    grafo_copia.remover_no(no_escolhido)
+    # Seleção: desempilha e escolhe aleatoriamente um canal livre entre os vizinhos já coloridos
+    cor = [None] * len(nomes)
+    while pilha:
+        posicao = pilha.pop()
+        canais_vizinhos = set()
+        if indices[posicao] is not None:
+            for vizinho in grafo.vizinhos_indices(indices[posicao]):
+                vizinho = posicao_local.get(vizinho)
+                if vizinho is not None and cor[vizinho] is not None:
+                    canais_vizinhos.add(cor[vizinho])
+        canais_disponiveis = [c for c in range(k) if c not in canais_vizinhos]
+        if not canais_disponiveis:
+            return None
+        cor[posicao] = choice(canais_disponiveis)
     
-    dispositivos_restantes = [d for d in dispositivos if d != no_escolhido]
-    coloracao = colorir_grafo(grafo_copia, dispositivos_restantes, canais)
-    if coloracao is None:
-        return None
-    # Atribui canal ao nó
-    canais_vizinhos = [
-        coloracao[vizinho]
-        for vizinho in grafo.obter_vizinhos(no_escolhido)
-        if vizinho in coloracao
-    ]
-    canais_disponiveis = [canal for canal in canais if canal not in canais_vizinhos]
-    if not canais_disponiveis:
-        return None
-    # Escolhe canal
-    coloracao[no_escolhido] = choice(canais_disponiveis)
-    return coloracao
+    return {nome: canais[c] for nome, c in zip(nomes, cor)}
 
 
-def estimar_custos_spill(dispositivos: List[DispositivoMovel]) -> Dict[str, float]:
+def estimar_custos_spill(dispositivos: ConjuntoDispositivos) -> Dict[str, float]:
+    if isinstance(dispositivos, FrotaDispositivos):
+        return {
+            disp_id: potencia * frequencia
+            for disp_id, potencia, frequencia in zip(dispositivos.ids, dispositivos.potencia, dispositivos.frequencia_uso)
+        }
+    
     custos = {}
     for disp in dispositivos:
         custos[disp.id] = disp.potencia * disp.frequencia_uso
     return custos
 
 
-def decidir_spills(grafo: GrafoInterferencia, dispositivos: List[DispositivoMovel], canais: List[str], custos: Dict[str, float]) -> Set[str]:
-    dispositivos_spill = set()
-    grafo_copia = copy.copy(grafo)
-    dispositivos_restantes = set(d.id for d in dispositivos)
+def decidir_spills(grafo: GrafoInterferencia, dispositivos: ConjuntoDispositivos, canais: List[str], custos: Dict[str, float], ponderado: bool = False) -> Set[str]:
+    k = len(canais)
+    nomes = grafo.simbolos.nomes
     
-    while len(dispositivos_restantes) != 0:
-        # Tenta encontrar nó com grau < k
-        no_facil = None
-        
-        for no in dispositivos_restantes:
-            if len(grafo_copia.obter_vizinhos(no)) < len(canais):
-                no_facil = no
-                break
-        
-        if no_facil is None:
-            # Não há nó fácil, escolhe o de menor custo para spill
-            no_spill = min(
-                dispositivos_restantes,
-                key=lambda x: custos.get(x, 0)
-            )
-            dispositivos_spill.add(no_spill)
-            no_escolhido = no_spill
+    # Trabalha com os índices internados do grafo; dispositivos fora dele têm grau 0 e nunca vão para spill
+    restantes = set()
+    for disp_id in _ids_dispositivos(dispositivos):
+        indice = grafo.simbolos.indice(disp_id)
+        if indice is not None:
+            restantes.add(indice)
+    
+    # Graus no grafo reduzido, mantidos sem copiar nem alterar o grafo original
+    grau = {}
+    grau_ponderado = {}
+    custo = {}
+    for no in restantes:
+        vizinhos = grafo.vizinhos_indices(no)
+        grau[no] = len(vizinhos)
+        if ponderado:
+            grau_ponderado[no] = sum(vizinhos.values())
+        custo[no] = custos.get(nomes[no], 0)
+    
+    def metrica(no: int) -> float:
+        # Custo de spill por interferência evitada (Chaitin)
+        divisor = grau_ponderado[no] if ponderado else grau[no]
+        return custo[no] / divisor if divisor > 0 else float('inf')
+    
+    # Nós com grau < k ficam na pilha; os demais no heap, com versão para descartar entradas velhas
+    faceis = [no for no in restantes if grau[no] < k]
+    versao = dict.fromkeys(restantes, 0)
+    candidatos_spill = [(metrica(no), nomes[no], no, 0) for no in restantes if grau[no] >= k]
+    heapq.heapify(candidatos_spill)
+    
+    spills = []
+    while restantes:
+        if faceis:
+            no_escolhido = faceis.pop()
+            if no_escolhido not in restantes:
+                continue
         else:
-            no_escolhido = no_facil
+            # Não há nó fácil, escolhe o de menor custo por grau para spill
+            _, _, no_escolhido, versao_entrada = heapq.heappop(candidatos_spill)
+            if no_escolhido not in restantes or versao_entrada != versao[no_escolhido]:
+                continue
+            spills.append(no_escolhido)
         
-        # Remove o nó processado
-        grafo_copia.remover_no(no_escolhido)
-        dispositivos_restantes.remove(no_escolhido)
-    return dispositivos_spill
+        # Remove o nó processado e atualiza os vizinhos restantes
+        restantes.remove(no_escolhido)
+        for vizinho, peso in grafo.vizinhos_indices(no_escolhido).items():
+            if vizinho not in restantes:
+                continue
+            grau[vizinho] -= 1
+            if ponderado:
+                grau_ponderado[vizinho] -= peso
+            versao[vizinho] += 1
+            if grau[vizinho] == k - 1:
+                faceis.append(vizinho)
+            elif grau[vizinho] >= k:
+                heapq.heappush(candidatos_spill, (metrica(vizinho), nomes[vizinho], vizinho, versao[vizinho]))
+    return {nomes[no] for no in spills}
 
 
-def alocar_canais_com_spilling(dispositivos: List[DispositivoMovel], grafo: GrafoInterferencia, canais: List[str]) -> Tuple[Dict[str, str], Set[str]]:
+def alocar_canais_com_spilling(dispositivos: ConjuntoDispositivos, grafo: GrafoInterferencia, canais: List[str], ponderado: bool = False,
+                               cache: Optional[CacheAlocacao] = None) -> Tuple[Dict[str, str], Set[str]]:
     custos = estimar_custos_spill(dispositivos)
-    spills = decidir_spills(grafo, dispositivos, canais, custos)
+    
+    if cache is not None:
+        ids = _ids_dispositivos(dispositivos)
+        chave = impressao_digital(grafo, ids, canais, custos, f"canais:ponderado={ponderado}")
+        resultado = cache.obter(chave)
+        # Só reaproveita se a coloração guardada ainda for própria para este grafo
+        if resultado is not None and coloracao_valida(grafo, resultado[0], canais, ids, resultado[1]):
+            return resultado
+    
+    spills = decidir_spills(grafo, dispositivos, canais, custos, ponderado)
     
     # Remove dispositivos em spill
     grafo_reduzido = copy.copy(grafo)
@@ -337,16 +1377,202 @@ def alocar_canais_com_spilling(dispositivos: List[DispositivoMovel], grafo: Graf
         grafo_reduzido.remover_no(disp_id)
     
     # Colore grafo reduzido
-    dispositivos_restantes = [d.id for d in dispositivos if d.id not in spills]
+    dispositivos_restantes = [disp_id for disp_id in _ids_dispositivos(dispositivos) if disp_id not in spills]
     alocacao = colorir_grafo(grafo_reduzido, dispositivos_restantes, canais)
+    
+    if cache is not None and alocacao is not None:
+        cache.guardar(chave, alocacao, spills)
     return alocacao or {}, spills
 
 
-def aplicar_alocacao(dispositivos: List[DispositivoMovel], alocacao: Dict[str, str], spills: Set[str]) -> None:
+def _alocar_cenario(cenario: Tuple[ConjuntoDispositivos, GrafoInterferencia, List[str]]) -> Tuple[Dict[str, str], Set[str], float]:
+    dispositivos, grafo, canais = cenario
+    inicio = time.perf_counter()
+    alocacao, spills = alocar_canais_com_spilling(dispositivos, grafo, canais)
+    return alocacao, spills, time.perf_counter() - inicio
+
+
+def alocar_canais_em_lote(cenarios: Sequence[Tuple[ConjuntoDispositivos, GrafoInterferencia, List[str]]], processos: Optional[int] = None,
+                          tamanho_bloco: Optional[int] = None) -> Tuple[List[Tuple[Dict[str, str], Set[str]]], List[float]]:
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(cenarios) <= 1:
+        saidas = [_alocar_cenario(cenario) for cenario in cenarios]
+    else:
+        # Blocos grandes amortizam o custo de serializar cada cenário para os processos
+        if tamanho_bloco is None:
+            tamanho_bloco = max(1, len(cenarios) // (4 * processos))
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            saidas = list(executor.map(_alocar_cenario, cenarios, chunksize=tamanho_bloco))
+    
+    # Resultados na mesma ordem dos cenários de entrada
+    resultados = [(alocacao, spills) for alocacao, spills, _ in saidas]
+    tempos = [tempo for _, _, tempo in saidas]
+    return resultados, tempos
+
+
+def aplicar_alocacao(dispositivos: ConjuntoDispositivos, alocacao: Dict[str, str], spills: Set[str]) -> None:
+    if isinstance(dispositivos, FrotaDispositivos):
+        # Escreve direto nas colunas, sem materializar visões
+        canal_alocado = dispositivos.canal_alocado
+        em_spill = dispositivos.em_spill
+        for indice, disp_id in enumerate(dispositivos.ids):
+            if disp_id in spills:
+                em_spill[indice] = 1
+                canal_alocado[indice] = None
+            else:
+                em_spill[indice] = 0
+                canal_alocado[indice] = alocacao.get(disp_id)
+        return
+    
     for disp in dispositivos:
         if disp.id in spills:
             disp.em_spill = True
             disp.canal_alocado = None
         else:
             disp.em_spill = False
-            disp.canal_alocado = alocacao.get(disp.id)
\ No newline at end of file
+            disp.canal_alocado = alocacao.get(disp.id)
+
+
+class AlocadorCanaisOnline:
+    # Mantém uma alocação válida e repara só a vizinhança afetada a cada evento
+    def __init__(self, grafo: GrafoInterferencia, canais: List[str], alocacao: Optional[Dict[str, str]] = None,
+                 spills: Optional[Set[str]] = None, custos: Optional[Dict[str, float]] = None, limite_cadeia: int = 64):
+        self.grafo = grafo
+        self.canais = list(canais)
+        self.alocacao = dict(alocacao or {})
+        self.spills = set(spills or ())
+        self.custos = dict(custos or {})
+        self.limite_cadeia = limite_cadeia
+    
+    @classmethod
+    def de_dispositivos(cls, dispositivos: ConjuntoDispositivos, grafo: GrafoInterferencia, canais: List[str], limite_cadeia: int = 64) -> 'AlocadorCanaisOnline':
+        alocacao, spills = alocar_canais_com_spilling(dispositivos, grafo, canais)
+        return cls(grafo, canais, alocacao, spills, estimar_custos_spill(dispositivos), limite_cadeia)
+    
+    def _canais_vizinhos(self, no: str) -> Dict[str, List[str]]:
+        canais_vizinhos = {}
+        for vizinho in self.grafo.obter_vizinhos(no):
+            canal = self.alocacao.get(vizinho)
+            if canal is not None:
+                canais_vizinhos.setdefault(canal, []).append(vizinho)
+        return canais_vizinhos
+    
+    def _canal_livre(self, no: str) -> Optional[str]:
+        canais_vizinhos = self._canais_vizinhos(no)
+        for canal in self.canais:
+            if canal not in canais_vizinhos:
+                return canal
+        return None
+    
+    def _cadeia_kempe(self, inicio: List[str], canal_a: str, canal_b: str) -> Optional[Set[str]]:
+        # Componente do subgrafo {canal_a, canal_b} alcançável a partir de inicio
+        componente = set(inicio)
+        pilha = list(inicio)
+        while pilha:
+            no = pilha.pop()
+            for vizinho in self.grafo.obter_vizinhos(no):
+                if vizinho not in componente and self.alocacao.get(vizinho) in (canal_a, canal_b):
+                    if len(componente) >= self.limite_cadeia:
+                        return None
+                    componente.add(vizinho)
+                    pilha.append(vizinho)
+        return componente
+    
+    def _liberar_por_kempe(self, no: str) -> Optional[str]:
+        canais_vizinhos = self._canais_vizinhos(no)
+        # Canais com menos vizinhos geram cadeias menores
+        for canal_a in sorted(canais_vizinhos, key=lambda canal: len(canais_vizinhos[canal])):
+            for canal_b in self.canais:
+                if canal_b == canal_a:
+                    continue
+                cadeia = self._cadeia_kempe(canais_vizinhos[canal_a], canal_a, canal_b)
+                if cadeia is None:
+                    continue
+                # Se a cadeia alcança um vizinho em canal_b, a troca só move o conflito
+                if any(vizinho in cadeia for vizinho in canais_vizinhos.get(canal_b, ())):
+                    continue
+                
+                for membro in cadeia:
+                    self.alocacao[membro] = canal_b if self.alocacao[membro] == canal_a else canal_a
+                return canal_a
+        return None
+    
+    def _reparar(self, no: str):
+        self.alocacao.pop(no, None)
+        self.spills.discard(no)
+        
+        # Compara com None: um canal pode ter nome falso (0, '') e não deve disparar a troca de Kempe
+        canal = self._canal_livre(no)
+        if canal is None:
+            canal = self._liberar_por_kempe(no)
+        if canal is not None:
+            self.alocacao[no] = canal
+            return
+        
+        # Spill local: libera o canal cujos ocupantes vizinhos custam menos que o próprio nó
+        canais_vizinhos = self._canais_vizinhos(no)
+        melhor_canal = min(
+            self.canais,
+            key=lambda c: sum(self.custos.get(v, 0) for v in canais_vizinhos.get(c, ())),
+            default=None
+        )
+        if melhor_canal is not None:
+            custo_vizinhos = sum(self.custos.get(v, 0) for v in canais_vizinhos.get(melhor_canal, ()))
+            if custo_vizinhos < self.custos.get(no, 0):
+                for vizinho in canais_vizinhos.get(melhor_canal, ()):
+                    self.alocacao.pop(vizinho)
+                    self.spills.add(vizinho)
+                self.alocacao[no] = melhor_canal
+                return
+        self.spills.add(no)
+    
+    def _reparar_desconhecidos(self, nos: Iterable[str]):
+        # Nós vistos pela primeira vez numa aresta ficam sem canal e fora dos spills até serem reparados
+        for no in nos:
+            if no not in self.alocacao and no not in self.spills:
+                self._reparar(no)
+    
+    def _tentar_sair_do_spill(self, nos: Iterable[str]):
+        for no in nos:
+            if no in self.spills:
+                canal = self._canal_livre(no)
+                if canal is not None:
+                    self.spills.discard(no)
+                    self.alocacao[no] = canal
+    
+    def adicionar_dispositivo(self, disp_id: str, vizinhos: Dict[str, float], custo: float = 0.0):
+        self.custos[disp_id] = custo
+        for vizinho, peso in vizinhos.items():
+            self.grafo.adicionar_aresta(disp_id, vizinho, peso)
+        self._reparar(disp_id)
+        self._reparar_desconhecidos(vizinhos)
+    
+    def remover_dispositivo(self, disp_id: str):
+        vizinhos = list(self.grafo.obter_vizinhos(disp_id))
+        self.grafo.remover_no(disp_id)
+        self.alocacao.pop(disp_id, None)
+        self.spills.discard(disp_id)
+        self.custos.pop(disp_id, None)
+        self._tentar_sair_do_spill(vizinhos)
+        self.grafo.compactar_simbolos()
+    
+    def adicionar_aresta(self, x: str, y: str, peso: float = 1.0):
+        self.grafo.adicionar_aresta(x, y, peso)
+        self._reparar_desconhecidos((x, y))
+        canal_x = self.alocacao.get(x)
+        if canal_x is not None and canal_x == self.alocacao.get(y):
+            # Repara o de menor custo: se acabar em spill, perde-se menos
+            self._reparar(min((x, y), key=lambda no: self.custos.get(no, 0)))
+    
+    def remover_aresta(self, x: str, y: str):
+        self.grafo.remover_aresta(x, y)
+        self._tentar_sair_do_spill((x, y))
+    
+    def validar(self) -> bool:
+        for no, canal in self.alocacao.items():
+            if canal not in self.canais or no in self.spills:
+                return False
+            for vizinho in self.grafo.obter_vizinhos(no):
+                if self.alocacao.get(vizinho) == canal:
+                    return False
+        return True
@@ -1,6 +1,12 @@
 import copy
+import heapq
+import time
+from array import array
 from random import choice
-from typing import List, Set, Collection, Dict, Optional, Tuple
+from typing import Iterable, List, Set, Collection, Dict, Optional, Sequence, Tuple, Union
+
+from cache_alocacao import CacheAlocacao, coloracao_valida, impressao_digital
+from estruturas_alocacao import IndiceOcorrencias, TabelaSimbolos
 
 
 class Declaracao:
@@ -34,13 +40,54 @@ class Instrucao:
 
 
 class LinguagemIntermediaria:
-    def __init__(self, instrucoes: List[Instrucao]):
+    def __init__(self, instrucoes: List[Instrucao], indexado: bool = False):
         self.instrucoes = instrucoes
+        # Índice opcional mantido pelas operações da LI; alterações feitas
+        # direto em self.instrucoes precisam passar por sobrescrever_instrucoes
+        self.indice = self._construir_indice() if indexado else None
+
+    def ativar_indice(self) -> IndiceOcorrencias:
+        if self.indice is None:
+            self.indice = self._construir_indice()
+        return self.indice
 
     def sobrescrever_instrucoes(self, novas_instrucoes: List[Instrucao]):
         self.instrucoes = novas_instrucoes
+        if self.indice is not None:
+            self.indice = self._construir_indice()
+
+    def _substituir_instrucoes(self, novas_instrucoes: List[Instrucao], removidas: List[Instrucao], adicionadas: List[Instrucao]):
+        # Atualiza o índice só com as instruções que mudaram
+        self.instrucoes = novas_instrucoes
+        if self.indice is None:
+            return
+        for instrucao in removidas:
+            for declaracao in instrucao.declaracoes:
+                self.indice.remover(declaracao.registrador, declaracao)
+            for uso in instrucao.usos:
+                self.indice.remover(uso.registrador, uso)
+        for instrucao in adicionadas:
+            for declaracao in instrucao.declaracoes:
+                self.indice.adicionar(declaracao.registrador, instrucao, declaracao)
+            for uso in instrucao.usos:
+                self.indice.adicionar(uso.registrador, instrucao, uso)
+
+    def _construir_indice(self) -> IndiceOcorrencias:
+        indice = IndiceOcorrencias()
+        for instrucao in self.instrucoes:
+            for declaracao in instrucao.declaracoes:
+                indice.adicionar(declaracao.registrador, instrucao, declaracao)
+            for uso in instrucao.usos:
+                indice.adicionar(uso.registrador, instrucao, uso)
+        return indice
+
+    def reescrever_registradores(self, mapeamento: Dict[str, str], no_local: bool = False) -> None:
+        if no_local:
+            # O índice construído na primeira chamada fica ativo para as próximas renomeações;
+            # altera só os operandos que referenciam registradores do mapeamento
+            self.ativar_indice().renomear(mapeamento, 'registrador')
+            return
 
-    def reescrever_registradores(self, mapeamento: Dict[str, str]) -> None:
         novas_instrucoes = []
         
         for instrucao in self.instrucoes:
@@ -68,9 +115,18 @@ class LinguagemIntermediaria:
                 )
             )
         
-        self.instrucoes = novas_instrucoes
+        self.sobrescrever_instrucoes(novas_instrucoes)
+
+    def contar_ocorrencias(self, registrador: str) -> int:
+        return self.ativar_indice().contagem(registrador)
+
+    def obter_posicoes(self, registrador: str) -> List[Instrucao]:
+        return self.ativar_indice().posicoes(registrador)
 
     def obter_registradores(self) -> Set[str]:
+        if self.indice is not None:
+            return set(self.indice.chaves())
+
         registradores = set()
         for instrucao in self.instrucoes:
             for declaracao in instrucao.declaracoes:
@@ -80,79 +136,368 @@ class LinguagemIntermediaria:
         return registradores
     
 
+class _OperandoCompacto:
+    # Visão de um operando nas colunas da LinguagemCompacta; leituras e escritas vão direto
+    # aos arrays. Como em DispositivoFrota, a visão vale para a posição, não para o operando:
+    # inserir_codigo_spill desloca as posições e invalida visões tomadas antes
+    __slots__ = ('_linguagem', '_posicao')
+    _coluna = ''
+    _coluna_mortos = ''
+
+    def __init__(self, linguagem: 'LinguagemCompacta', posicao: int):
+        self._linguagem = linguagem
+        self._posicao = posicao
+
+    @property
+    def registrador(self) -> str:
+        return self._linguagem.registradores.nomes[getattr(self._linguagem, self._coluna)[self._posicao]]
+
+    @registrador.setter
+    def registrador(self, nome: str):
+        getattr(self._linguagem, self._coluna)[self._posicao] = self._linguagem.registradores.internar(nome)
+
+    @property
+    def morto(self) -> bool:
+        return bool(getattr(self._linguagem, self._coluna_mortos)[self._posicao])
+
+    @morto.setter
+    def morto(self, valor: bool):
+        getattr(self._linguagem, self._coluna_mortos)[self._posicao] = 1 if valor else 0
+
+
+class DeclaracaoCompacta(_OperandoCompacto):
+    __slots__ = ()
+    _coluna = 'declaracoes'
+    _coluna_mortos = 'declaracoes_mortas'
+
+    def __repr__(self):
+        return f"Declaracao({self.registrador}, morto={self.morto})"
+
+
+class UsoCompacto(_OperandoCompacto):
+    __slots__ = ()
+    _coluna = 'usos'
+    _coluna_mortos = 'usos_mortos'
+
+    def __repr__(self):
+        return f"Uso({self.registrador}, morto={self.morto})"
+
+
+class InstrucaoCompacta:
+    # Visão leve de uma instrução da LinguagemCompacta, compatível com Instrucao
+    __slots__ = ('_linguagem', '_posicao')
+
+    def __init__(self, linguagem: 'LinguagemCompacta', posicao: int):
+        self._linguagem = linguagem
+        self._posicao = posicao
+
+    @property
+    def codigo_operacao(self) -> str:
+        return self._linguagem.operacoes.nomes[self._linguagem.codigos[self._posicao]]
+
+    @codigo_operacao.setter
+    def codigo_operacao(self, valor: str):
+        self._linguagem.codigos[self._posicao] = self._linguagem.operacoes.internar(valor)
+
+    @property
+    def declaracoes(self) -> Tuple[DeclaracaoCompacta, ...]:
+        # Tupla: operandos podem ser alterados pela visão, mas a quantidade é fixa nas colunas
+        linguagem = self._linguagem
+        return tuple(
+            DeclaracaoCompacta(linguagem, d)
+            for d in range(linguagem.inicio_declaracoes[self._posicao], linguagem.inicio_declaracoes[self._posicao + 1])
+        )
+
+    @property
+    def usos(self) -> Tuple[UsoCompacto, ...]:
+        linguagem = self._linguagem
+        return tuple(
+            UsoCompacto(linguagem, u)
+            for u in range(linguagem.inicio_usos[self._posicao], linguagem.inicio_usos[self._posicao + 1])
+        )
+
+    @property
+    def frequencia(self) -> float:
+        return self._linguagem.frequencias[self._posicao]
+
+    @frequencia.setter
+    def frequencia(self, valor: float):
+        self._linguagem.frequencias[self._posicao] = valor
+
+    def __repr__(self):
+        return f"Instrucao({self.codigo_operacao})"
+
+
+class LinguagemCompacta:
+    # LI em colunas tipadas: operandos de todas as instruções em arrays planos de ids,
+    # a instrução i ocupa inicio[i]..inicio[i + 1] em cada coluna
+    def __init__(self, operacoes: Optional[TabelaSimbolos] = None, registradores: Optional[TabelaSimbolos] = None):
+        self.operacoes = operacoes if operacoes is not None else TabelaSimbolos()
+        self.registradores = registradores if registradores is not None else TabelaSimbolos()
+        self.codigos = array('i')
+        self.frequencias = array('d')
+        self.inicio_declaracoes = array('q', [0])
+        self.declaracoes = array('i')
+        self.declaracoes_mortas = bytearray()  # 1 se o registrador morre após a declaração
+        self.inicio_usos = array('q', [0])
+        self.usos = array('i')
+        self.usos_mortos = bytearray()
+
+    @classmethod
+    def de_instrucoes(cls, instrucoes: Iterable[Instrucao]) -> 'LinguagemCompacta':
+        linguagem = cls()
+        for instrucao in instrucoes:
+            linguagem.adicionar(instrucao.codigo_operacao, instrucao.declaracoes, instrucao.usos, instrucao.frequencia)
+        return linguagem
+
+    @classmethod
+    def de_linguagem(cls, linguagem: LinguagemIntermediaria) -> 'LinguagemCompacta':
+        return cls.de_instrucoes(linguagem.instrucoes)
+
+    def adicionar(self, codigo_operacao: str, declaracoes: List[Declaracao], usos: List[Uso],
+                  frequencia=1.0) -> InstrucaoCompacta:
+        internar = self.registradores.internar
+        self._anexar(
+            self.operacoes.internar(codigo_operacao), frequencia,
+            [internar(declaracao.registrador) for declaracao in declaracoes],
+            [1 if declaracao.morto else 0 for declaracao in declaracoes],
+            [internar(uso.registrador) for uso in usos],
+            [1 if uso.morto else 0 for uso in usos],
+        )
+        return InstrucaoCompacta(self, len(self.codigos) - 1)
+
+    def _anexar(self, codigo: int, frequencia: float, declaracoes: Sequence[int], declaracoes_mortas: Sequence[int],
+                usos: Sequence[int], usos_mortos: Sequence[int]):
+        self.codigos.append(codigo)
+        self.frequencias.append(frequencia)
+        self.declaracoes.extend(declaracoes)
+        self.declaracoes_mortas.extend(declaracoes_mortas)
+        self.inicio_declaracoes.append(len(self.declaracoes))
+        self.usos.extend(usos)
+        self.usos_mortos.extend(usos_mortos)
+        self.inicio_usos.append(len(self.usos))
+
+    def _adotar_colunas(self, outra: 'LinguagemCompacta'):
+        self.codigos = outra.codigos
+        self.frequencias = outra.frequencias
+        self.inicio_declaracoes = outra.inicio_declaracoes
+        self.declaracoes = outra.declaracoes
+        self.declaracoes_mortas = outra.declaracoes_mortas
+        self.inicio_usos = outra.inicio_usos
+        self.usos = outra.usos
+        self.usos_mortos = outra.usos_mortos
+
+    def para_linguagem(self) -> LinguagemIntermediaria:
+        return LinguagemIntermediaria([
+            Instrucao(
+                instrucao.codigo_operacao,
+                [Declaracao(declaracao.registrador, declaracao.morto) for declaracao in instrucao.declaracoes],
+                [Uso(uso.registrador, uso.morto) for uso in instrucao.usos],
+                instrucao.frequencia
+            )
+            for instrucao in self
+        ])
+
+    @property
+    def instrucoes(self) -> List[InstrucaoCompacta]:
+        return list(self)
+
+    def reescrever_registradores(self, mapeamento: Dict[str, str]) -> None:
+        # Tradução id -> id aplicada às duas colunas de operandos
+        traducao = list(range(len(self.registradores)))
+        for antigo, novo in mapeamento.items():
+            indice = self.registradores.indice(antigo)
+            if indice is not None:
+                traducao[indice] = self.registradores.internar(novo)
+        self.declaracoes = array('i', [traducao[r] for r in self.declaracoes])
+        self.usos = array('i', [traducao[r] for r in self.usos])
+
+    def obter_registradores(self) -> Set[str]:
+        nomes = self.registradores.nomes
+        return {nomes[r] for r in set(self.declaracoes).union(self.usos)}
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __getitem__(self, posicao: int) -> InstrucaoCompacta:
+        if posicao < 0:
+            posicao += len(self.codigos)
+        if not 0 <= posicao < len(self.codigos):
+            raise IndexError("Posição fora da LI")
+        return InstrucaoCompacta(self, posicao)
+
+    def __iter__(self):
+        for posicao in range(len(self.codigos)):
+            yield InstrucaoCompacta(self, posicao)
+
+    def __repr__(self):
+        return f"LinguagemCompacta({len(self.codigos)} instruções, {len(self.registradores)} registradores)"
+
+
+ProgramaIntermediario = Union[LinguagemIntermediaria, LinguagemCompacta]
+
+
 class GrafoInterferencia:
     def __init__(self):
-        self._lista_adjacencia = {}
+        self.simbolos = TabelaSimbolos()
+        # Adjacência por índice; o dict de vizinhos funciona como conjunto ordenado
+        self._adjacencia = {}
 
     def __copy__(self):
         nova_classe = self.__class__
         novo_grafo = nova_classe.__new__(nova_classe)
-        novo_grafo._lista_adjacencia = copy.deepcopy(self._lista_adjacencia)
+        # A tabela só cresce e é consistente entre cópias, então pode ser compartilhada
+        novo_grafo.simbolos = self.simbolos
+        novo_grafo._adjacencia = {no: dict(vizinhos) for no, vizinhos in self._adjacencia.items()}
         return novo_grafo
 
     def adicionar_aresta(self, x: str, y: str):
         if x == y:
             return  # Não adiciona auto-loops
-        
-        # Adiciona y à lista de adjacência de x
-        lista_x = self._lista_adjacencia.get(x, [])
-        if y not in lista_x:
-            lista_x.append(y)
-        self._lista_adjacencia[x] = lista_x
-
-        # Adiciona x à lista de adjacência de y
-        lista_y = self._lista_adjacencia.get(y, [])
-        if x not in lista_y:
-            lista_y.append(x)
-        self._lista_adjacencia[y] = lista_y
+
+        self.adicionar_aresta_indices(self.simbolos.internar(x), self.simbolos.internar(y))
+
+    def adicionar_aresta_indices(self, i: int, j: int):
+        if i == j:
+            return
+        self._adjacencia.setdefault(i, {})[j] = None
+        self._adjacencia.setdefault(j, {})[i] = None
 
     def contem_aresta(self, x: str, y: str) -> bool:
-        return y in self._lista_adjacencia.get(x, [])
+        return self.simbolos.indice(y) in self._adjacencia.get(self.simbolos.indice(x), ())
+
+    def remover_aresta(self, x: str, y: str):
+        i = self.simbolos.indice(x)
+        j = self.simbolos.indice(y)
+        if j not in self._adjacencia.get(i, ()):
+            return
+        self._adjacencia[i].pop(j)
+        self._adjacencia[j].pop(i)
 
     def remover_no(self, no: str):
-        if no in self._lista_adjacencia:
-            self._lista_adjacencia.pop(no)
-        
-        # Remove o nó das listas de adjacência de outros nós
-        for chave in list(self._lista_adjacencia.keys()):
-            if no in self._lista_adjacencia[chave]:
-                self._lista_adjacencia[chave].remove(no)
+        i = self.simbolos.indice(no)
+        # Adjacência é simétrica: só os vizinhos referenciam o nó removido
+        for vizinho in self._adjacencia.pop(i, ()):
+            self._adjacencia[vizinho].pop(i)
 
     def renomear_no(self, nome_antigo: str, nome_novo: str):
-        lista_antiga = self._lista_adjacencia.pop(nome_antigo, [])
-        lista_nova = self._lista_adjacencia.get(nome_novo, [])
-        
-        # Combina as listas e remove duplicatas
-        self._lista_adjacencia[nome_novo] = list(set(lista_antiga + lista_nova))
-        
-        # Remove nome_novo de si mesmo se existir
-        if nome_novo in self._lista_adjacencia[nome_novo]:
-            self._lista_adjacencia[nome_novo].remove(nome_novo)
-
-        # Atualiza todas as referências ao nome_antigo para nome_novo
-        for chave in self._lista_adjacencia.keys():
-            self._lista_adjacencia[chave] = list(set([
-                nome_novo if valor == nome_antigo else valor 
-                for valor in self._lista_adjacencia[chave]
-            ]))
-            if chave in self._lista_adjacencia[chave]:
-                self._lista_adjacencia[chave].remove(chave)
+        novo = self.simbolos.internar(nome_novo)
+        antigo = self.simbolos.indice(nome_antigo)
+        vizinhos_novo = self._adjacencia.setdefault(novo, {})
+        if antigo is None or antigo == novo:
+            return
+
+        # Só os vizinhos do nó antigo são tocados
+        for vizinho in self._adjacencia.pop(antigo, ()):
+            vizinhos_vizinho = self._adjacencia[vizinho]
+            vizinhos_vizinho.pop(antigo)
+            if vizinho == novo:
+                continue
+            vizinhos_vizinho[novo] = None
+            vizinhos_novo[vizinho] = None
+
+    def vizinhos_indices(self, indice: int) -> Dict[int, None]:
+        return self._adjacencia.get(indice, {})
 
     def obter_vizinhos(self, x: str) -> List[str]:
-        return self._lista_adjacencia.get(x, [])
-    
+        nomes = self.simbolos.nomes
+        return [nomes[j] for j in self._adjacencia.get(self.simbolos.indice(x), ())]
+
     def obter_nos(self) -> List[str]:
-        return list(self._lista_adjacencia.keys())
-    
+        nomes = self.simbolos.nomes
+        return [nomes[i] for i in self._adjacencia]
+
     def calcular_grau(self, no: str) -> int:
-        return len(self.obter_vizinhos(no))
+        return len(self._adjacencia.get(self.simbolos.indice(no), ()))
+
+
+class GrafoInterferenciaMatrizBits(GrafoInterferencia):
+    # Matriz de bits triangular sobre os índices internados, para testes de
+    # interferência sem hashing; a adjacência da classe base serve para iteração
+    def __init__(self):
+        super().__init__()
+        self._matriz = bytearray()
+
+    def __copy__(self):
+        novo_grafo = super().__copy__()
+        novo_grafo._matriz = bytearray(self._matriz)
+        return novo_grafo
+
+    def _garantir_linha(self, indice: int):
+        # A linha j fica depois de todas as linhas menores: basta estender a matriz
+        bits = (indice + 1) * indice // 2
+        falta = (bits + 7) // 8 - len(self._matriz)
+        if falta > 0:
+            self._matriz.extend(bytes(falta))
 
+    @staticmethod
+    def _posicao(i: int, j: int) -> int:
+        if i > j:
+            i, j = j, i
+        return j * (j - 1) // 2 + i
 
-def construir_grafo_interferencia(linguagem: LinguagemIntermediaria) -> GrafoInterferencia:
-    grafo = GrafoInterferencia()
+    def _testar_bit(self, i: int, j: int) -> bool:
+        posicao = self._posicao(i, j)
+        if posicao >> 3 >= len(self._matriz):
+            return False
+        return bool(self._matriz[posicao >> 3] & (1 << (posicao & 7)))
+
+    def _definir_bit(self, i: int, j: int, valor: bool):
+        posicao = self._posicao(i, j)
+        if valor:
+            self._matriz[posicao >> 3] |= 1 << (posicao & 7)
+        else:
+            self._matriz[posicao >> 3] &= ~(1 << (posicao & 7)) & 0xFF
+
+    def adicionar_aresta_indices(self, i: int, j: int):
+        if i == j:
+            return
+        self._adjacencia.setdefault(i, {})
+        self._adjacencia.setdefault(j, {})
+        if self._testar_bit(i, j):
+            return
+
+        self._garantir_linha(max(i, j))
+        self._definir_bit(i, j, True)
+        self._adjacencia[i][j] = None
+        self._adjacencia[j][i] = None
+
+    def contem_aresta(self, x: str, y: str) -> bool:
+        i = self.simbolos.indice(x)
+        j = self.simbolos.indice(y)
+        if i is None or j is None or i == j:
+            return False
+        return self._testar_bit(i, j)
+
+    def remover_aresta(self, x: str, y: str):
+        if self.contem_aresta(x, y):
+            self._definir_bit(self.simbolos.indice(x), self.simbolos.indice(y), False)
+        super().remover_aresta(x, y)
+
+    def remover_no(self, no: str):
+        i = self.simbolos.indice(no)
+        for vizinho in self._adjacencia.get(i, ()):
+            self._definir_bit(i, vizinho, False)
+        super().remover_no(no)
+
+    def renomear_no(self, nome_antigo: str, nome_novo: str):
+        antigo = self.simbolos.indice(nome_antigo)
+        if antigo is not None and nome_antigo != nome_novo:
+            for vizinho in self._adjacencia.get(antigo, ()):
+                self._definir_bit(antigo, vizinho, False)
+        super().renomear_no(nome_antigo, nome_novo)
+
+        novo = self.simbolos.indice(nome_novo)
+        for vizinho in self._adjacencia[novo]:
+            self._garantir_linha(max(novo, vizinho))
+            self._definir_bit(novo, vizinho, True)
+
+
+def _pares_interferencia(instrucoes: List[Instrucao]):
+    # Gera (declarado, vivo) na ordem da análise de liveness; o conjunto de vivos zera a cada bloco
     conjunto_vivos = None
 
-    for instrucao in linguagem.instrucoes:
+    for instrucao in instrucoes:
         if instrucao.codigo_operacao == 'bloco_basico':
             # Inicia um novo bloco básico
             conjunto_vivos = {}
@@ -175,13 +520,59 @@ def construir_grafo_interferencia(linguagem: LinguagemIntermediaria) -> GrafoInt
             for declaracao in instrucao.declaracoes:
                 for reg_vivo in conjunto_vivos.keys():
                     if reg_vivo != declaracao.registrador:
-                        grafo.adicionar_aresta(declaracao.registrador, reg_vivo)
+                        yield declaracao.registrador, reg_vivo
 
                 # Adiciona o registrador declarado ao conjunto de vivos
                 if not declaracao.morto:
                     contador = conjunto_vivos.get(declaracao.registrador, 0)
                     conjunto_vivos[declaracao.registrador] = contador + 1
-    
+
+
+def _pares_interferencia_compacta(linguagem: LinguagemCompacta):
+    # Mesma análise de _pares_interferencia, sobre ids de registrador lidos direto das colunas
+    bloco_basico = linguagem.operacoes.indice('bloco_basico')
+    inicio_declaracoes, declaracoes, declaracoes_mortas = (
+        linguagem.inicio_declaracoes, linguagem.declaracoes, linguagem.declaracoes_mortas)
+    inicio_usos, usos, usos_mortos = linguagem.inicio_usos, linguagem.usos, linguagem.usos_mortos
+    conjunto_vivos = None
+
+    for posicao, codigo in enumerate(linguagem.codigos):
+        if codigo == bloco_basico:
+            conjunto_vivos = {}
+            for d in range(inicio_declaracoes[posicao], inicio_declaracoes[posicao + 1]):
+                if not declaracoes_mortas[d]:
+                    registrador = declaracoes[d]
+                    conjunto_vivos[registrador] = conjunto_vivos.get(registrador, 0) + 1
+
+        else:
+            for u in range(inicio_usos[posicao], inicio_usos[posicao + 1]):
+                if usos_mortos[u] and usos[u] in conjunto_vivos:
+                    registrador = usos[u]
+                    conjunto_vivos[registrador] -= 1
+                    if conjunto_vivos[registrador] == 0:
+                        conjunto_vivos.pop(registrador)
+
+            for d in range(inicio_declaracoes[posicao], inicio_declaracoes[posicao + 1]):
+                registrador = declaracoes[d]
+                for reg_vivo in conjunto_vivos:
+                    if reg_vivo != registrador:
+                        yield registrador, reg_vivo
+
+                if not declaracoes_mortas[d]:
+                    conjunto_vivos[registrador] = conjunto_vivos.get(registrador, 0) + 1
+
+
+def construir_grafo_interferencia(linguagem: ProgramaIntermediario, matriz_bits: bool = False) -> GrafoInterferencia:
+    grafo = GrafoInterferenciaMatrizBits() if matriz_bits else GrafoInterferencia()
+    if isinstance(linguagem, LinguagemCompacta):
+        # O grafo adota a tabela de registradores da LI: os ids das colunas já são índices do grafo
+        grafo.simbolos = linguagem.registradores
+        for declarado, vivo in _pares_interferencia_compacta(linguagem):
+            grafo.adicionar_aresta_indices(declarado, vivo)
+        return grafo
+
+    for declarado, vivo in _pares_interferencia(linguagem.instrucoes):
+        grafo.adicionar_aresta(declarado, vivo)
     return grafo
 
 
@@ -197,76 +588,202 @@ def copia_desnecessaria(instrucao: Instrucao, grafo: GrafoInterferencia) -> bool
             not grafo.contem_aresta(destino, origem))
 
 
-def fazer_coalescing(linguagem: LinguagemIntermediaria, grafo: GrafoInterferencia) -> None:
-    houve_modificacao = True
-    while houve_modificacao:
-        # Procura primeira instrução de cópia desnecessária
-        instrucao_encontrada = None
-        
-        for instrucao in linguagem.instrucoes:
-            if copia_desnecessaria(instrucao, grafo):
-                instrucao_encontrada = instrucao
-                break
-        
-        if instrucao_encontrada is not None:
-            destino = instrucao_encontrada.declaracoes[0].registrador
-            origem = instrucao_encontrada.usos[0].registrador
+def _representante(representantes: Dict[str, str], registrador: str) -> str:
+    # Busca da união-busca com compressão de caminho
+    raiz = registrador
+    while raiz in representantes:
+        raiz = representantes[raiz]
+    while registrador != raiz:
+        proximo = representantes[registrador]
+        representantes[registrador] = raiz
+        registrador = proximo
+    return raiz
+
+
+def _fusao_conservadora(grafo: GrafoInterferencia, destino: str, origem: str, k: int) -> bool:
+    # Graus vêm direto do tamanho da adjacência, mantida a cada fusão
+    indice_destino = grafo.simbolos.indice(destino)
+    indice_origem = grafo.simbolos.indice(origem)
+    vizinhos_destino = grafo.vizinhos_indices(indice_destino) if indice_destino is not None else {}
+    vizinhos_origem = grafo.vizinhos_indices(indice_origem) if indice_origem is not None else {}
+
+    # George: todo vizinho do destino já interfere com a origem ou tem grau < k
+    if all(t in vizinhos_origem or len(grafo.vizinhos_indices(t)) < k for t in vizinhos_destino):
+        return True
+
+    # Briggs: o nó fundido fica com menos de k vizinhos de grau significativo (>= k)
+    significativos = 0
+    for t in {**vizinhos_destino, **vizinhos_origem}:
+        grau = len(grafo.vizinhos_indices(t))
+        if t in vizinhos_destino and t in vizinhos_origem:
+            grau -= 1  # Vizinho comum perde uma aresta quando os dois viram um só nó
+        if grau >= k:
+            significativos += 1
+            if significativos >= k:
+                return False
+    return True
+
+
+def _coletar_copias(linguagem: ProgramaIntermediario) -> List[Tuple[str, str, float]]:
+    # Cópias (destino, origem, frequência do bloco) na ordem do programa
+    copias = []
+    frequencia_atual = 1.0
+    if isinstance(linguagem, LinguagemCompacta):
+        bloco_basico = linguagem.operacoes.indice('bloco_basico')
+        copia = linguagem.operacoes.indice('copia')
+        nomes = linguagem.registradores.nomes
+        inicio_declaracoes, inicio_usos = linguagem.inicio_declaracoes, linguagem.inicio_usos
+        for posicao, codigo in enumerate(linguagem.codigos):
+            if codigo == bloco_basico:
+                frequencia_atual = linguagem.frequencias[posicao]
+            elif (codigo == copia and inicio_declaracoes[posicao] < inicio_declaracoes[posicao + 1]
+                  and inicio_usos[posicao] < inicio_usos[posicao + 1]):
+                copias.append((nomes[linguagem.declaracoes[inicio_declaracoes[posicao]]],
+                               nomes[linguagem.usos[inicio_usos[posicao]]], frequencia_atual))
+        return copias
+
+    for instrucao in linguagem.instrucoes:
+        if instrucao.codigo_operacao == 'bloco_basico':
+            frequencia_atual = instrucao.frequencia
+        elif instrucao.codigo_operacao == 'copia' and instrucao.declaracoes and instrucao.usos:
+            copias.append((instrucao.declaracoes[0].registrador, instrucao.usos[0].registrador, frequencia_atual))
+    return copias
+
+
+def fazer_coalescing(linguagem: ProgramaIntermediario, grafo: GrafoInterferencia, cores: Optional[List[str]] = None,
+                     modo: str = 'agressivo') -> None:
+    if modo not in ('agressivo', 'conservador'):
+        raise ValueError(f"Modo de coalescing desconhecido: {modo}")
+    if modo == 'conservador' and cores is None:
+        raise ValueError("Coalescing conservador precisa das cores disponíveis")
 
-            # Cria mapeamento de renomeação
-            mapeamento = {destino: origem}
+    # Coleta as cópias uma vez, com a frequência do bloco em que estão
+    copias = _coletar_copias(linguagem)
 
-            # Atualiza grafo e linguagem intermediária
+    if modo == 'conservador':
+        # Cópias de blocos quentes primeiro: são as que mais custam se virarem spill
+        copias.sort(key=lambda copia: -copia[2])
+
+    representantes = {}
+    pendentes = copias
+    while pendentes:
+        adiadas = []
+        houve_fusao = False
+        for destino, origem, frequencia in pendentes:
+            destino = _representante(representantes, destino)
+            origem = _representante(representantes, origem)
+            # Interferência só cresce com as fusões: cópia com interferência nunca volta a ser candidata
+            if destino == origem or grafo.contem_aresta(destino, origem):
+                continue
+            if modo == 'conservador' and not _fusao_conservadora(grafo, destino, origem, len(cores)):
+                adiadas.append((destino, origem, frequencia))
+                continue
+
+            # O nome da origem sobrevive, como na renomeação destino -> origem
             grafo.renomear_no(destino, origem)
-            linguagem.reescrever_registradores(mapeamento)
-        else:
-            houve_modificacao = False
+            representantes[destino] = origem
+            houve_fusao = True
 
+        # Fusões podem baixar o grau de vizinhos comuns; tenta de novo as adiadas enquanto houver progresso
+        pendentes = adiadas if houve_fusao else []
 
-def colorir_grafo(grafo: GrafoInterferencia, registradores: Collection[str], cores: List[str]) -> Optional[Dict[str, str]]:
-    if len(registradores) == 0:
-        return {}
+    if not representantes:
+        return
 
-    # Encontra nó com grau < k
-    no_escolhido = None
-    for no in registradores:
-        if len(grafo.obter_vizinhos(no)) < len(cores):
-            no_escolhido = no
-            break
-    
-    if no_escolhido is None:
+    # Reescreve a LI uma única vez com o representante final de cada registrador fundido
+    mapeamento = {registrador: _representante(representantes, registrador) for registrador in list(representantes)}
+    linguagem.reescrever_registradores(mapeamento)
+
+
+def colorir_grafo(grafo: GrafoInterferencia, registradores: Collection[str], cores: List[str],
+                  cache: Optional[CacheAlocacao] = None) -> Optional[Dict[str, str]]:
+    if cache is not None:
+        chave = impressao_digital(grafo, registradores, cores, extra='registradores')
+        resultado = cache.obter(chave)
+        # Só reaproveita se a coloração guardada ainda for própria para este grafo
+        if resultado is not None and coloracao_valida(grafo, resultado[0], cores, registradores):
+            return resultado[0]
+        coloracao = colorir_grafo(grafo, registradores, cores)
+        if coloracao is not None:
+            cache.guardar(chave, coloracao)
+        return coloracao
+
+    k = len(cores)
+    # Trabalha com posições locais; o grau conta todos os vizinhos no grafo, mesmo os fora da lista
+    nomes = list(dict.fromkeys(registradores))
+    indices = [grafo.simbolos.indice(nome) for nome in nomes]
+    posicao_local = {indice: posicao for posicao, indice in enumerate(indices) if indice is not None}
+    grau = [len(grafo.vizinhos_indices(indice)) if indice is not None else 0 for indice in indices]
+    removido = bytearray(len(nomes))
+
+    # Simplificação: balde de nós com grau < k, realimentado quando um vizinho cai para k - 1
+    baixo_grau = [posicao for posicao in range(len(nomes)) if grau[posicao] < k]
+    pilha = []
+    while baixo_grau:
+        posicao = baixo_grau.pop()
+        removido[posicao] = 1
+        pilha.append(posicao)
+        if indices[posicao] is None:
+            continue
+        for vizinho in grafo.vizinhos_indices(indices[posicao]):
+            vizinho = posicao_local.get(vizinho)
+            if vizinho is None or removido[vizinho]:
+                continue
+            grau[vizinho] -= 1
+            if grau[vizinho] == k - 1:
+                baixo_grau.append(vizinho)
+
+    if len(pilha) < len(nomes):
         # Não há nó com grau suficientemente baixo
         return None
 
-    # Remove nó e colore recursivamente
-    grafo_copia = copy.copy(grafo)
-    grafo_copia.remover_no(no_escolhido)
-    
-    registradores_restantes = [r for r in registradores if r != no_escolhido]
-    coloracao = colorir_grafo(grafo_copia, registradores_restantes, cores)
-    
-    if coloracao is None:
-        return None
+    # Seleção: desempilha e escolhe aleatoriamente uma cor livre entre os vizinhos já coloridos
+    cor = [None] * len(nomes)
+    while pilha:
+        posicao = pilha.pop()
+        cores_vizinhos = set()
+        if indices[posicao] is not None:
+            for vizinho in grafo.vizinhos_indices(indices[posicao]):
+                vizinho = posicao_local.get(vizinho)
+                if vizinho is not None and cor[vizinho] is not None:
+                    cores_vizinhos.add(cor[vizinho])
+        cores_disponiveis = [c for c in range(k) if c not in cores_vizinhos]
+        if not cores_disponiveis:
+            return None
+        cor[posicao] = choice(cores_disponiveis)
+
+    return {nome: cores[c] for nome, c in zip(nomes, cor)}
+
+
+def _estimar_custos_spill_compacta(linguagem: LinguagemCompacta) -> Dict[str, float]:
+    # Custos acumulados por id; a última posição que contou cada id evita somar duas vezes na mesma instrução
+    quantidade = len(linguagem.registradores)
+    custos = [0.0] * quantidade
+    ultima_posicao = [-1] * quantidade
+    bloco_basico = linguagem.operacoes.indice('bloco_basico')
+    inicio_declaracoes, declaracoes = linguagem.inicio_declaracoes, linguagem.declaracoes
+    inicio_usos, usos = linguagem.inicio_usos, linguagem.usos
+    frequencia_atual = 1.0
+
+    for posicao, codigo in enumerate(linguagem.codigos):
+        if codigo == bloco_basico:
+            frequencia_atual = linguagem.frequencias[posicao]
+            continue
+        for colunas in (declaracoes[inicio_declaracoes[posicao]:inicio_declaracoes[posicao + 1]],
+                        usos[inicio_usos[posicao]:inicio_usos[posicao + 1]]):
+            for reg in colunas:
+                if ultima_posicao[reg] != posicao:
+                    ultima_posicao[reg] = posicao
+                    custos[reg] += frequencia_atual
+
+    nomes = linguagem.registradores.nomes
+    return {nomes[reg]: custos[reg] for reg in range(quantidade) if ultima_posicao[reg] >= 0}
 
-    # Atribui cor ao nó
-    # Usa grafo original (não a cópia) para obter vizinhos corretos
-    cores_vizinhos = [
-        coloracao[vizinho] 
-        for vizinho in grafo.obter_vizinhos(no_escolhido)
-        if vizinho in coloracao
-    ]
-    
-    cores_disponiveis = [cor for cor in cores if cor not in cores_vizinhos]
-    
-    if not cores_disponiveis:
-        return None
-    
-    # Escolhe aleatoriamente uma cor disponível
-    coloracao[no_escolhido] = choice(cores_disponiveis)
-    
-    return coloracao
 
+def estimar_custos_spill(linguagem: ProgramaIntermediario) -> Dict[str, float]:
+    if isinstance(linguagem, LinguagemCompacta):
+        return _estimar_custos_spill_compacta(linguagem)
 
-def estimar_custos_spill(linguagem: LinguagemIntermediaria) -> Dict[str, float]:
     custos = {}
     frequencia_atual = 1.0
 
@@ -291,108 +808,361 @@ def estimar_custos_spill(linguagem: LinguagemIntermediaria) -> Dict[str, float]:
     return custos
 
 
-def decidir_spills(linguagem: LinguagemIntermediaria, grafo: GrafoInterferencia, cores: List[str], custos: Dict[str, float]) -> Set[str]:
-    registradores_spill = set()
+def decidir_spills(linguagem: ProgramaIntermediario, grafo: GrafoInterferencia, cores: List[str], custos: Dict[str, float]) -> Set[str]:
+    k = len(cores)
+    # Posições locais em ordem de nome (desempate determinístico); o grau conta todos os vizinhos no grafo
+    nomes = sorted(linguagem.obter_registradores())
+    indices = [grafo.simbolos.indice(nome) for nome in nomes]
+    posicao_local = {indice: posicao for posicao, indice in enumerate(indices) if indice is not None}
+    grau = [len(grafo.vizinhos_indices(indice)) if indice is not None else 0 for indice in indices]
+    removido = bytearray(len(nomes))
 
-    grafo_copia = copy.copy(grafo)
-    registradores_restantes = set(linguagem.obter_registradores())
+    def metrica(posicao: int) -> float:
+        # Custo de spill por interferência evitada (Chaitin); sem custo conhecido nunca é preferido
+        custo = custos.get(nomes[posicao], float('inf'))
+        return custo / grau[posicao] if grau[posicao] > 0 else float('inf')
 
-    while len(registradores_restantes) != 0:
-        # Tenta encontrar nó com grau < k
-        no_facil = None
-        
-        for no in registradores_restantes:
-            if len(grafo_copia.obter_vizinhos(no)) < len(cores):
-                no_facil = no
-                break
-        
-        if no_facil is None:
-            # Não há nó fácil, escolhe o de menor custo para spill
-            no_spill = min(
-                registradores_restantes, 
-                key=lambda x: custos.get(x, float('inf'))
-            )
-            registradores_spill.add(no_spill)
-            no_escolhido = no_spill
+    # Nós com grau < k ficam na pilha; os demais no heap. A métrica só cresce quando o grau cai,
+    # então a entrada guardada é um limite inferior: ao sair desatualizada, é recalculada e reinserida
+    faceis = [posicao for posicao in range(len(nomes)) if grau[posicao] < k]
+    candidatos_spill = [(metrica(posicao), posicao, grau[posicao]) for posicao in range(len(nomes)) if grau[posicao] >= k]
+    heapq.heapify(candidatos_spill)
+
+    registradores_spill = set()
+    restantes = len(nomes)
+    while restantes:
+        if faceis:
+            no_escolhido = faceis.pop()
         else:
-            no_escolhido = no_facil
+            # Não há nó fácil, escolhe o de menor custo por grau para spill
+            _, no_escolhido, grau_entrada = heapq.heappop(candidatos_spill)
+            if removido[no_escolhido]:
+                continue
+            if grau_entrada != grau[no_escolhido]:
+                heapq.heappush(candidatos_spill, (metrica(no_escolhido), no_escolhido, grau[no_escolhido]))
+                continue
+            registradores_spill.add(nomes[no_escolhido])
 
-        # Remove o nó processado
-        grafo_copia.remover_no(no_escolhido)
-        registradores_restantes.remove(no_escolhido)
+        # Remove o nó processado e atualiza os vizinhos restantes
+        removido[no_escolhido] = 1
+        restantes -= 1
+        if indices[no_escolhido] is None:
+            continue
+        for vizinho in grafo.vizinhos_indices(indices[no_escolhido]):
+            vizinho = posicao_local.get(vizinho)
+            if vizinho is None or removido[vizinho]:
+                continue
+            grau[vizinho] -= 1
+            if grau[vizinho] == k - 1:
+                faceis.append(vizinho)
 
     return registradores_spill
 
 
-def inserir_codigo_spill(linguagem: LinguagemIntermediaria, registradores_spill: Set[str]) -> None:
-    novas_instrucoes = []
-    
-    for instrucao in linguagem.instrucoes:
-        if instrucao.codigo_operacao == 'bloco_basico':
-            # Remove declarações de registradores que vão para spill
-            novas_declaracoes = [
-                dec for dec in instrucao.declaracoes 
-                if dec.registrador not in registradores_spill
-            ]
+def _reescrever_com_spill(instrucao: Instrucao, registradores_spill: Set[str]) -> List[Instrucao]:
+    if instrucao.codigo_operacao == 'bloco_basico':
+        # Remove declarações de registradores que vão para spill
+        novas_declaracoes = [
+            dec for dec in instrucao.declaracoes 
+            if dec.registrador not in registradores_spill
+        ]
+        
+        return [
+            Instrucao(
+                'bloco_basico',
+                novas_declaracoes,
+                instrucao.usos.copy(),
+                instrucao.frequencia
+            )
+        ]
+
+    instrucoes_antes = []
+    instrucoes_depois = []
+    novas_declaracoes = []
+    novos_usos = []
+
+    for uso in instrucao.usos:
+        if uso.registrador in registradores_spill:
+            # Marca como morto após reload
+            novos_usos.append(Uso(uso.registrador, True))
             
-            novas_instrucoes.append(
+            # Adiciona instrução de reload
+            instrucoes_antes.append(
                 Instrucao(
-                    'bloco_basico',
-                    novas_declaracoes,
-                    instrucao.usos.copy(),
+                    'recarregar',
+                    [Declaracao(uso.registrador, False)],
+                    [],
                     instrucao.frequencia
                 )
             )
         else:
-            instrucoes_antes = []
-            instrucoes_depois = []
-            novas_declaracoes = []
-            novos_usos = []
-
-            for uso in instrucao.usos:
-                if uso.registrador in registradores_spill:
-                    # Marca como morto após reload
-                    novos_usos.append(Uso(uso.registrador, True))
-                    
-                    # Adiciona instrução de reload
-                    instrucoes_antes.append(
-                        Instrucao(
-                            'recarregar',
-                            [Declaracao(uso.registrador, False)],
-                            [],
-                            instrucao.frequencia
-                        )
-                    )
-                else:
-                    novos_usos.append(Uso(uso.registrador, uso.morto))
+            novos_usos.append(Uso(uso.registrador, uso.morto))
+    
+    for declaracao in instrucao.declaracoes:
+        if declaracao.registrador in registradores_spill:
+            # Marca como não-morto
+            novas_declaracoes.append(Declaracao(declaracao.registrador, False))
             
-            for declaracao in instrucao.declaracoes:
-                if declaracao.registrador in registradores_spill:
-                    # Marca como não-morto
-                    novas_declaracoes.append(Declaracao(declaracao.registrador, False))
-                    
-                    # Adiciona instrução de spill
-                    instrucoes_depois.append(
-                        Instrucao(
-                            'despejar',
-                            [],
-                            [Uso(declaracao.registrador, True)],
-                            instrucao.frequencia
-                        )
-                    )
-                else:
-                    novas_declaracoes.append(Declaracao(declaracao.registrador, declaracao.morto))
-
-            # Monta instrução modificada
-            instrucao_modificada = Instrucao(
-                instrucao.codigo_operacao, 
-                novas_declaracoes, 
-                novos_usos, 
-                instrucao.frequencia
+            # Adiciona instrução de spill
+            instrucoes_depois.append(
+                Instrucao(
+                    'despejar',
+                    [],
+                    [Uso(declaracao.registrador, True)],
+                    instrucao.frequencia
+                )
             )
-            
-            novas_instrucoes.extend(instrucoes_antes)
-            novas_instrucoes.append(instrucao_modificada)
-            novas_instrucoes.extend(instrucoes_depois)
+        else:
+            novas_declaracoes.append(Declaracao(declaracao.registrador, declaracao.morto))
+
+    # Monta instrução modificada
+    instrucao_modificada = Instrucao(
+        instrucao.codigo_operacao, 
+        novas_declaracoes, 
+        novos_usos, 
+        instrucao.frequencia
+    )
+    
+    return instrucoes_antes + [instrucao_modificada] + instrucoes_depois
+
+
+def _inserir_codigo_spill_compacta(linguagem: LinguagemCompacta, registradores_spill: Set[str]) -> None:
+    # Mesma reescrita de _reescrever_com_spill, gerando colunas novas numa única passada
+    em_spill = bytearray(len(linguagem.registradores))
+    for registrador in registradores_spill:
+        indice = linguagem.registradores.indice(registrador)
+        if indice is not None:
+            em_spill[indice] = 1
+
+    bloco_basico = linguagem.operacoes.indice('bloco_basico')
+    recarregar = linguagem.operacoes.internar('recarregar')
+    despejar = linguagem.operacoes.internar('despejar')
+    inicio_declaracoes, declaracoes, declaracoes_mortas = (
+        linguagem.inicio_declaracoes, linguagem.declaracoes, linguagem.declaracoes_mortas)
+    inicio_usos, usos, usos_mortos = linguagem.inicio_usos, linguagem.usos, linguagem.usos_mortos
+    nova = LinguagemCompacta(linguagem.operacoes, linguagem.registradores)
+
+    for posicao, codigo in enumerate(linguagem.codigos):
+        frequencia = linguagem.frequencias[posicao]
+        d0, d1 = inicio_declaracoes[posicao], inicio_declaracoes[posicao + 1]
+        u0, u1 = inicio_usos[posicao], inicio_usos[posicao + 1]
+        if not any(em_spill[r] for r in declaracoes[d0:d1]) and not any(em_spill[r] for r in usos[u0:u1]):
+            # Instrução sem registrador em spill: colunas copiadas em fatia
+            nova._anexar(codigo, frequencia, declaracoes[d0:d1], declaracoes_mortas[d0:d1],
+                         usos[u0:u1], usos_mortos[u0:u1])
+            continue
+
+        if codigo == bloco_basico:
+            # Remove declarações de registradores que vão para spill
+            mantidas = [d for d in range(d0, d1) if not em_spill[declaracoes[d]]]
+            nova._anexar(codigo, frequencia, [declaracoes[d] for d in mantidas],
+                         [declaracoes_mortas[d] for d in mantidas], usos[u0:u1], usos_mortos[u0:u1])
+            continue
+
+        novos_usos_mortos = []
+        for u in range(u0, u1):
+            if em_spill[usos[u]]:
+                # Recarga antes da instrução; o uso passa a matar o registrador
+                nova._anexar(recarregar, frequencia, [usos[u]], [0], (), ())
+                novos_usos_mortos.append(1)
+            else:
+                novos_usos_mortos.append(usos_mortos[u])
+
+        novas_declaracoes_mortas = [0 if em_spill[declaracoes[d]] else declaracoes_mortas[d] for d in range(d0, d1)]
+        nova._anexar(codigo, frequencia, declaracoes[d0:d1], novas_declaracoes_mortas, usos[u0:u1], novos_usos_mortos)
+
+        for d in range(d0, d1):
+            if em_spill[declaracoes[d]]:
+                nova._anexar(despejar, frequencia, (), (), [declaracoes[d]], [1])
+
+    linguagem._adotar_colunas(nova)
+
+
+def inserir_codigo_spill(linguagem: ProgramaIntermediario, registradores_spill: Set[str]) -> None:
+    if isinstance(linguagem, LinguagemCompacta):
+        _inserir_codigo_spill_compacta(linguagem, registradores_spill)
+        return
+
+    if linguagem.indice is not None:
+        # Com índice, só as instruções que citam registradores em spill são reescritas
+        afetadas = {
+            id(instrucao)
+            for registrador in registradores_spill
+            for instrucao in linguagem.indice.posicoes(registrador)
+        }
+        novas_instrucoes = []
+        removidas = []
+        adicionadas = []
+        for instrucao in linguagem.instrucoes:
+            if id(instrucao) not in afetadas:
+                novas_instrucoes.append(instrucao)
+                continue
+            reescritas = _reescrever_com_spill(instrucao, registradores_spill)
+            removidas.append(instrucao)
+            adicionadas.extend(reescritas)
+            novas_instrucoes.extend(reescritas)
+        linguagem._substituir_instrucoes(novas_instrucoes, removidas, adicionadas)
+        return
+
+    novas_instrucoes = []
+    for instrucao in linguagem.instrucoes:
+        novas_instrucoes.extend(_reescrever_com_spill(instrucao, registradores_spill))
 
     linguagem.sobrescrever_instrucoes(novas_instrucoes)
+
+
+def _agrupar_blocos(instrucoes: List[Instrucao]) -> List[List[Instrucao]]:
+    # Cada 'bloco_basico' abre um bloco; instruções anteriores ao primeiro formam um bloco próprio
+    blocos = []
+    for instrucao in instrucoes:
+        if instrucao.codigo_operacao == 'bloco_basico' or not blocos:
+            blocos.append([])
+        blocos[-1].append(instrucao)
+    return blocos
+
+
+def _registradores_bloco(bloco: List[Instrucao]) -> Set[str]:
+    registradores = set()
+    for instrucao in bloco:
+        for declaracao in instrucao.declaracoes:
+            registradores.add(declaracao.registrador)
+        for uso in instrucao.usos:
+            registradores.add(uso.registrador)
+    return registradores
+
+
+class GrafoInterferenciaBlocos:
+    # Grafo mantido por bloco básico, com contagem de blocos que geram cada aresta,
+    # para reconstruir só os blocos alterados por spill ou coalescing
+    def __init__(self, blocos: List[List[Instrucao]], matriz_bits: bool = False):
+        self.grafo = GrafoInterferenciaMatrizBits() if matriz_bits else GrafoInterferencia()
+        self.blocos = []
+        self._arestas_blocos = []
+        self._contagens = {}
+        self._blocos_registrador = {}
+        for bloco in blocos:
+            self.blocos.append(bloco)
+            self._arestas_blocos.append(set())
+            self._indexar_bloco(len(self.blocos) - 1)
+
+    def _indexar_bloco(self, posicao: int):
+        for registrador in _registradores_bloco(self.blocos[posicao]):
+            self._blocos_registrador.setdefault(registrador, set()).add(posicao)
+
+        arestas = {(a, b) if a < b else (b, a) for a, b in _pares_interferencia(self.blocos[posicao])}
+        for aresta in arestas:
+            contador = self._contagens.get(aresta, 0)
+            if contador == 0:
+                self.grafo.adicionar_aresta(*aresta)
+            self._contagens[aresta] = contador + 1
+        self._arestas_blocos[posicao] = arestas
+
+    def _desindexar_bloco(self, posicao: int):
+        for registrador in _registradores_bloco(self.blocos[posicao]):
+            self._blocos_registrador[registrador].discard(posicao)
+
+        for aresta in self._arestas_blocos[posicao]:
+            contador = self._contagens[aresta] - 1
+            if contador > 0:
+                self._contagens[aresta] = contador
+                continue
+            self._contagens.pop(aresta)
+            self.grafo.remover_aresta(*aresta)
+            # Nós sem arestas não existiriam numa reconstrução completa
+            for no in aresta:
+                if self.grafo.calcular_grau(no) == 0:
+                    self.grafo.remover_no(no)
+
+    def blocos_com(self, registradores: Collection[str]) -> Set[int]:
+        return {posicao for registrador in registradores for posicao in self._blocos_registrador.get(registrador, ())}
+
+    def substituir_bloco(self, posicao: int, bloco: List[Instrucao]):
+        self._desindexar_bloco(posicao)
+        self.blocos[posicao] = bloco
+        self._indexar_bloco(posicao)
+
+    def instrucoes(self) -> List[Instrucao]:
+        return [instrucao for bloco in self.blocos for instrucao in bloco]
+
+
+class ResultadoAlocacao:
+    def __init__(self, coloracao: Optional[Dict[str, str]], spills: Set[str], rodadas: int, tempos: Dict[str, float],
+                 grafo: GrafoInterferencia):
+        self.coloracao = coloracao  # None se não convergiu
+        self.spills = spills
+        self.grafo = grafo  # Grafo final, já com o código de spill
+        self.rodadas = rodadas
+        self.tempos = tempos  # Segundos acumulados por fase
+
+    def __repr__(self):
+        estado = "colorido" if self.coloracao is not None else "sem coloração"
+        return f"ResultadoAlocacao({estado}, {len(self.spills)} spills, {self.rodadas} rodadas)"
+
+
+def alocar_registradores(linguagem: LinguagemIntermediaria, cores: List[str], coalescing: bool = True,
+                         modo_coalescing: str = 'conservador', max_rodadas: int = 16,
+                         matriz_bits: bool = False) -> ResultadoAlocacao:
+    tempos = dict.fromkeys(('construcao', 'coalescing', 'custos', 'spill', 'insercao', 'reconstrucao', 'coloracao'), 0.0)
+
+    def medir(fase: str, inicio: float):
+        tempos[fase] += time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    estrutura = GrafoInterferenciaBlocos(_agrupar_blocos(linguagem.instrucoes), matriz_bits)
+    medir('construcao', inicio)
+
+    if coalescing:
+        # Só na primeira rodada: decide as fusões numa cópia e reconstrói os blocos que citavam os fundidos
+        inicio = time.perf_counter()
+        registradores_antes = linguagem.obter_registradores()
+        fazer_coalescing(linguagem, copy.copy(estrutura.grafo), cores, modo_coalescing)
+        fundidos = registradores_antes - linguagem.obter_registradores()
+        medir('coalescing', inicio)
+
+        if fundidos:
+            inicio = time.perf_counter()
+            blocos = _agrupar_blocos(linguagem.instrucoes)
+            for posicao in estrutura.blocos_com(fundidos):
+                estrutura.substituir_bloco(posicao, blocos[posicao])
+            # Blocos não afetados também foram recriados pela reescrita; adota as novas instruções
+            estrutura.blocos = blocos
+            medir('reconstrucao', inicio)
+
+    spills_total = set()
+    rodadas = 0
+    while rodadas < max_rodadas:
+        rodadas += 1
+
+        inicio = time.perf_counter()
+        custos = estimar_custos_spill(linguagem)
+        # Registradores já em spill só têm faixas curtas de recarga/despejo: não vale despejar de novo
+        for registrador in spills_total:
+            custos[registrador] = float('inf')
+        medir('custos', inicio)
+
+        inicio = time.perf_counter()
+        spills = decidir_spills(linguagem, estrutura.grafo, cores, custos) - spills_total
+        medir('spill', inicio)
+
+        if not spills:
+            inicio = time.perf_counter()
+            coloracao = colorir_grafo(estrutura.grafo, linguagem.obter_registradores(), cores)
+            medir('coloracao', inicio)
+            return ResultadoAlocacao(coloracao, spills_total, rodadas, tempos, estrutura.grafo)
+
+        inicio = time.perf_counter()
+        afetados = estrutura.blocos_com(spills)
+        novos_blocos = {
+            posicao: [nova for instrucao in estrutura.blocos[posicao] for nova in _reescrever_com_spill(instrucao, spills)]
+            for posicao in afetados
+        }
+        medir('insercao', inicio)
+
+        inicio = time.perf_counter()
+        for posicao, bloco in novos_blocos.items():
+            estrutura.substituir_bloco(posicao, bloco)
+        linguagem.sobrescrever_instrucoes(estrutura.instrucoes())
+        medir('reconstrucao', inicio)
+        spills_total |= spills
+
+    return ResultadoAlocacao(None, spills_total, rodadas, tempos, estrutura.grafo)
@@ -0,0 +1,305 @@
+import argparse
+import copy
+import csv
+import math
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from random import Random
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from alocacao_canais import (
+    EscalonamentoRede, FrotaDispositivos, RequisicaoCanal, SlotTempo, TransmissaoAtiva,
+    colorir_grafo, construir_grafo_interferencia_espacial, construir_grafo_interferencia_temporal,
+    construir_grafo_interferencia_temporal_fluxo, decidir_spills, estimar_custos_spill
+)
+
+
+LAYOUTS = ('uniforme', 'hotspot', 'rodovia')
+FASES = ('gerar_frota', 'espacial', 'gerar_escalonamento', 'temporal', 'custos', 'decidir_spills', 'colorir')
+MODOS_TEMPORAIS = ('sequencial', 'intervalos', 'paralelo')
+COLUNAS = ('layout', 'dispositivos', 'fase', 'segundos', 'pico_mb', 'nos', 'arestas', 'status')
+
+
+def _gerador(semente: int, *partes) -> Random:
+    # Semente derivada por cenário: o mesmo (layout, tamanho) gera sempre a mesma frota
+    return Random(':'.join(str(parte) for parte in (semente,) + partes))
+
+
+def lado_area(quantidade: int, limiar_distancia: float = 150.0, vizinhos_medios: float = 8.0) -> float:
+    # Área cresce com a frota para manter a densidade (e o grau médio) constante
+    area_por_dispositivo = math.pi * limiar_distancia**2 / vizinhos_medios
+    return math.sqrt(quantidade * area_por_dispositivo)
+
+
+def gerar_frota(quantidade: int, layout: str = 'uniforme', semente: int = 0, limiar_distancia: float = 150.0,
+                vizinhos_medios: float = 8.0) -> FrotaDispositivos:
+    if layout not in LAYOUTS:
+        raise ValueError(f"Layout desconhecido: {layout}")
+
+    gerador = _gerador(semente, layout, quantidade)
+    lado = lado_area(quantidade, limiar_distancia, vizinhos_medios)
+    xs = array('d')
+    ys = array('d')
+
+    def limitar(valor: float) -> float:
+        return min(max(valor, 0.0), lado)
+
+    if layout == 'uniforme':
+        for _ in range(quantidade):
+            xs.append(gerador.uniform(0, lado))
+            ys.append(gerador.uniform(0, lado))
+
+    elif layout == 'hotspot':
+        # 70% dos dispositivos em aglomerados gaussianos (centros comerciais, estádios), o resto espalhado
+        centros = [(gerador.uniform(0, lado), gerador.uniform(0, lado)) for _ in range(max(1, quantidade // 1000))]
+        dispersao = lado / (4 * math.sqrt(len(centros)))
+        for _ in range(quantidade):
+            if gerador.random() < 0.7:
+                cx, cy = gerador.choice(centros)
+                xs.append(limitar(gerador.gauss(cx, dispersao)))
+                ys.append(limitar(gerador.gauss(cy, dispersao)))
+            else:
+                xs.append(gerador.uniform(0, lado))
+                ys.append(gerador.uniform(0, lado))
+
+    else:
+        # Vias retas atravessando a área; dispositivos ao longo delas com pequeno desvio lateral
+        vias = []
+        for _ in range(max(1, int(math.sqrt(quantidade) / 10))):
+            if gerador.random() < 0.5:
+                y = gerador.uniform(0, lado)
+                vias.append((0.0, y, lado, gerador.uniform(0, lado)))
+            else:
+                x = gerador.uniform(0, lado)
+                vias.append((x, 0.0, gerador.uniform(0, lado), lado))
+        for _ in range(quantidade):
+            x0, y0, x1, y1 = gerador.choice(vias)
+            t = gerador.random()
+            comprimento = math.hypot(x1 - x0, y1 - y0) or 1.0
+            desvio = gerador.gauss(0, 5.0)
+            xs.append(limitar(x0 + t * (x1 - x0) - desvio * (y1 - y0) / comprimento))
+            ys.append(limitar(y0 + t * (y1 - y0) + desvio * (x1 - x0) / comprimento))
+
+    potencias = array('d', (gerador.uniform(10, 100) for _ in range(quantidade)))
+    frequencias = array('d', (gerador.uniform(0.5, 2.0) for _ in range(quantidade)))
+    ids = [f"D{i}" for i in range(quantidade)]
+    return FrotaDispositivos.de_colunas(ids, xs, ys, potencias, frequencias)
+
+
+def gerar_escalonamento(ids: Sequence[str], semente: int = 0, quantidade_frames: Optional[int] = None,
+                        dispositivos_por_frame: int = 16, slots_por_frame: int = 8) -> Iterator[SlotTempo]:
+    # Cada frame atende uma célula (bloco contíguo de ids); gerado sob demanda
+    gerador = _gerador(semente, 'escalonamento', len(ids))
+    celulas = max(1, math.ceil(len(ids) / dispositivos_por_frame))
+    if quantidade_frames is None:
+        quantidade_frames = celulas
+
+    for frame in range(quantidade_frames):
+        inicio = (frame % celulas) * dispositivos_por_frame
+        celula = ids[inicio:inicio + dispositivos_por_frame]
+        ativos = gerador.sample(celula, min(len(celula), max(1, len(celula) // 4)))
+        yield SlotTempo("inicio_frame", [TransmissaoAtiva(disp_id, True) for disp_id in ativos], [])
+
+        for _ in range(slots_por_frame):
+            liberados = gerador.sample(ativos, min(len(ativos), gerador.randint(0, 2)))
+            for disp_id in liberados:
+                ativos.remove(disp_id)
+            transmissoes = []
+            for _ in range(gerador.randint(1, 2)):
+                disp_id = gerador.choice(celula)
+                ativa = gerador.random() < 0.7
+                transmissoes.append(TransmissaoAtiva(disp_id, ativa))
+                if ativa:
+                    ativos.append(disp_id)
+            yield SlotTempo(
+                "slot_normal",
+                transmissoes,
+                [RequisicaoCanal(disp_id, True) for disp_id in liberados],
+                gerador.uniform(0.5, 2.0)
+            )
+
+
+def gerar_frames_ocupados(quantidade_frames: int = 1, slots_por_frame: int = 1000, dispositivos: int = 1000,
+                          semente: int = 0) -> Iterator[SlotTempo]:
+    # Frames longos com quase todos os dispositivos ativos ao mesmo tempo e poucas liberações:
+    # o pior caso dos construtores temporais, com arestas quadráticas no tamanho do frame
+    gerador = _gerador(semente, 'ocupado', quantidade_frames, slots_por_frame, dispositivos)
+    for _ in range(quantidade_frames):
+        yield SlotTempo("inicio_frame", [TransmissaoAtiva(f"D{gerador.randrange(dispositivos)}", True) for _ in range(5)], [])
+        for _ in range(slots_por_frame):
+            yield SlotTempo(
+                "slot_normal",
+                [TransmissaoAtiva(f"D{gerador.randrange(dispositivos)}", gerador.random() < 0.9)],
+                [RequisicaoCanal(f"D{gerador.randrange(dispositivos)}", gerador.random() < 0.1)]
+            )
+
+
+def comparar_modos_temporais(slots: Sequence[SlotTempo], modos: Sequence[str] = MODOS_TEMPORAIS,
+                             repeticoes: int = 3, **opcoes) -> Dict[str, float]:
+    # Melhor tempo de cada modo sobre os mesmos slots; o melhor de várias rodadas filtra ruído da máquina
+    tempos = {}
+    for modo in modos:
+        melhor = float('inf')
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            construir_grafo_interferencia_temporal_fluxo(slots, modo, **opcoes)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        tempos[modo] = melhor
+    return tempos
+
+
+def medir(funcao: Callable, memoria: bool = True):
+    # Retorna (resultado, segundos, pico em MB); o pico é relativo ao início da fase
+    if memoria:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    try:
+        resultado = funcao()
+        segundos = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1] / 2**20 if memoria else None
+    finally:
+        if memoria:
+            tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def _tamanho_grafo(grafo) -> Tuple[int, int]:
+    nos = grafo.obter_nos()
+    return len(nos), sum(len(grafo.obter_vizinhos(no)) for no in nos) // 2
+
+
+def executar_cenario(quantidade: int, layout: str, canais: List[str], semente: int = 0, modo_espacial: str = 'grade',
+                     modo_temporal: str = 'intervalos', memoria: bool = True, pular: Sequence[str] = ()) -> List[Dict]:
+    linhas = []
+
+    def registrar(fase: str, funcao: Callable, grafo_resultado: bool = False):
+        linha = {'layout': layout, 'dispositivos': quantidade, 'fase': fase, 'segundos': None,
+                 'pico_mb': None, 'nos': None, 'arestas': None, 'status': 'ok'}
+        linhas.append(linha)
+        if fase in pular:
+            linha['status'] = 'pulado'
+            return None
+        inicio = time.perf_counter()
+        try:
+            resultado, linha['segundos'], linha['pico_mb'] = medir(funcao, memoria)
+        except (RecursionError, MemoryError) as erro:
+            # É justamente o ponto de quebra que o benchmark quer registrar
+            linha['segundos'] = time.perf_counter() - inicio
+            linha['status'] = f"falhou: {type(erro).__name__}"
+            return None
+        if grafo_resultado:
+            linha['nos'], linha['arestas'] = _tamanho_grafo(resultado)
+        return resultado
+
+    frota = registrar('gerar_frota', lambda: gerar_frota(quantidade, layout, semente))
+    if frota is None:
+        return linhas
+    grafo = registrar('espacial', lambda: construir_grafo_interferencia_espacial(frota, modo=modo_espacial), True)
+    slots = registrar('gerar_escalonamento', lambda: list(gerar_escalonamento(frota.ids, semente)))
+    if slots is not None:
+        registrar('temporal', lambda: construir_grafo_interferencia_temporal(EscalonamentoRede(slots), modo_temporal), True)
+        del slots
+
+    custos = registrar('custos', lambda: estimar_custos_spill(frota))
+    if grafo is None or custos is None:
+        return linhas
+    spills = registrar('decidir_spills', lambda: decidir_spills(grafo, frota, canais, custos))
+    if spills is None:
+        return linhas
+
+    def colorir():
+        # Mesmo caminho de alocar_canais_com_spilling: remove os spills e colore o restante
+        grafo_reduzido = copy.copy(grafo)
+        for disp_id in spills:
+            grafo_reduzido.remover_no(disp_id)
+        restantes = [disp_id for disp_id in frota.ids if disp_id not in spills]
+        return colorir_grafo(grafo_reduzido, restantes, canais)
+
+    registrar('colorir', colorir)
+    return linhas
+
+
+def executar_benchmark(tamanhos: Sequence[int], layouts: Sequence[str] = LAYOUTS, canais: Optional[List[str]] = None,
+                       semente: int = 0, modo_espacial: str = 'grade', modo_temporal: str = 'intervalos',
+                       memoria: bool = True, limite_segundos: Optional[float] = None,
+                       ao_medir: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+    canais = canais or [f"C{i}" for i in range(1, 9)]
+    linhas = []
+    for layout in layouts:
+        # Fase que falhou ou passou do limite não é repetida em tamanhos maiores
+        pular = set()
+        for quantidade in sorted(tamanhos):
+            for linha in executar_cenario(quantidade, layout, canais, semente, modo_espacial, modo_temporal, memoria, sorted(pular)):
+                linhas.append(linha)
+                if ao_medir is not None:
+                    ao_medir(linha)
+                if linha['status'].startswith('falhou') or (
+                        limite_segundos is not None and linha['segundos'] is not None and linha['segundos'] > limite_segundos):
+                    pular.add(linha['fase'])
+    return linhas
+
+
+def _formatar(valor) -> str:
+    if valor is None:
+        return '-'
+    if isinstance(valor, float):
+        return f"{valor:.4f}"
+    return str(valor)
+
+
+def imprimir_tabela(linhas: List[Dict], saida=sys.stdout) -> None:
+    larguras = [max([len(coluna)] + [len(_formatar(linha[coluna])) for linha in linhas]) for coluna in COLUNAS]
+    print('  '.join(coluna.ljust(largura) for coluna, largura in zip(COLUNAS, larguras)), file=saida)
+    print('  '.join('-' * largura for largura in larguras), file=saida)
+    for linha in linhas:
+        print('  '.join(_formatar(linha[coluna]).ljust(largura) for coluna, largura in zip(COLUNAS, larguras)), file=saida)
+
+
+def escrever_csv(linhas: List[Dict], saida=sys.stdout) -> None:
+    escritor = csv.DictWriter(saida, fieldnames=COLUNAS)
+    escritor.writeheader()
+    for linha in linhas:
+        escritor.writerow(linha)
+
+
+def main(argumentos: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de escala da alocação de canais com cenários sintéticos")
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10**2, 10**3, 10**4, 10**5, 10**6])
+    parser.add_argument('--layouts', nargs='+', choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument('--canais', type=int, default=8, help="quantidade de canais disponíveis")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--modo-espacial', default='grade', choices=('forca_bruta', 'grade', 'lote', 'paralelo'))
+    parser.add_argument('--modo-temporal', default='intervalos', choices=('sequencial', 'intervalos', 'paralelo'))
+    parser.add_argument('--limite-segundos', type=float, default=60.0,
+                        help="fases mais lentas que isso não são repetidas nos tamanhos seguintes")
+    parser.add_argument('--sem-memoria', action='store_true', help="desliga o tracemalloc (tempos sem sobrecarga)")
+    parser.add_argument('--csv', action='store_true', help="imprime CSV em vez de tabela")
+    parser.add_argument('--comparar-temporal', type=int, metavar='SLOTS',
+                        help="só compara os modos temporais em frames ocupados com SLOTS slots cada")
+    parser.add_argument('--frames-ocupados', type=int, default=os.cpu_count() or 1,
+                        help="frames da comparação temporal; um por tarefa do modo paralelo")
+    args = parser.parse_args(argumentos)
+
+    if args.comparar_temporal is not None:
+        slots = list(gerar_frames_ocupados(args.frames_ocupados, args.comparar_temporal, args.comparar_temporal, args.semente))
+        for modo, segundos in comparar_modos_temporais(slots, frames_por_tarefa=1).items():
+            print(f"{modo}: {segundos:.4f}s")
+        return
+
+    linhas = executar_benchmark(
+        args.tamanhos, args.layouts, [f"C{i}" for i in range(1, args.canais + 1)], args.semente,
+        args.modo_espacial, args.modo_temporal, not args.sem_memoria, args.limite_segundos,
+        # Progresso no stderr para não misturar com a tabela/CSV
+        lambda linha: print(f"{linha['layout']} {linha['dispositivos']} {linha['fase']}: {linha['status']}", file=sys.stderr, flush=True)
+    )
+    if args.csv:
+        escrever_csv(linhas)
+    else:
+        imprimir_tabela(linhas)
+
+
+if __name__ == "__main__":
+    main()
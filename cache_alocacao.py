@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def impressao_digital(grafo, nos: Iterable[str], cores: List[str], custos: Optional[Dict[str, float]] = None, extra: str = '') -> str:
+    # Forma canônica: nós, arestas e custos ordenados, independente da ordem de construção
+    arestas = []
+    obter_peso = getattr(grafo, 'obter_peso_aresta', None)
+    for origem in grafo.obter_nos():
+        for destino in grafo.obter_vizinhos(origem):
+            if origem < destino:
+                peso = obter_peso(origem, destino) if obter_peso is not None else 1.0
+                arestas.append((origem, destino, repr(peso)))
+    arestas.sort()
+
+    conteudo = {
+        'nos': sorted(set(nos)),
+        'arestas': arestas,
+        'cores': sorted(cores),
+        'custos': sorted((no, repr(custo)) for no, custo in (custos or {}).items()),
+        'extra': extra,
+    }
+    texto = json.dumps(conteudo, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def coloracao_valida(grafo, coloracao: Dict[str, str], cores: List[str], nos: Collection[str], spills: Collection[str] = ()) -> bool:
+    conjunto_cores = set(cores)
+    for no in nos:
+        if no in spills:
+            if no in coloracao:
+                return False
+            continue
+        cor = coloracao.get(no)
+        if cor not in conjunto_cores:
+            return False
+        for vizinho in grafo.obter_vizinhos(no):
+            if coloracao.get(vizinho) == cor:
+                return False
+    return True
+
+
+class CacheAlocacao:
+    # LRU em memória, opcionalmente espelhado em disco (um arquivo JSON por impressão digital)
+    def __init__(self, capacidade: int = 1024, diretorio: Optional[str] = None, capacidade_disco: Optional[int] = None):
+        self.capacidade = capacidade
+        self.diretorio = diretorio
+        self.capacidade_disco = capacidade_disco if capacidade_disco is not None else capacidade
+        self._memoria = OrderedDict()
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, f"{chave}.json")
+
+    def obter(self, chave: str) -> Optional[Tuple[Dict[str, str], Set[str]]]:
+        if chave in self._memoria:
+            self._memoria.move_to_end(chave)
+            coloracao, spills = self._memoria[chave]
+            return dict(coloracao), set(spills)
+
+        if self.diretorio is None:
+            return None
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, 'r', encoding='utf-8') as arquivo:
+                registro = json.load(arquivo)
+            # Marca como usado recentemente para a poda do disco
+            os.utime(caminho)
+        except (OSError, ValueError):
+            return None
+
+        coloracao, spills = registro['coloracao'], set(registro['spills'])
+        self._guardar_memoria(chave, coloracao, spills)
+        return dict(coloracao), set(spills)
+
+    def guardar(self, chave: str, coloracao: Dict[str, str], spills: Collection[str] = ()):
+        self._guardar_memoria(chave, dict(coloracao), set(spills))
+        if self.diretorio is None:
+            return
+
+        caminho = self._caminho(chave)
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump({'coloracao': coloracao, 'spills': sorted(spills)}, arquivo)
+        os.replace(temporario, caminho)
+        self._podar_disco()
+
+    def _guardar_memoria(self, chave: str, coloracao: Dict[str, str], spills: Set[str]):
+        self._memoria[chave] = (coloracao, spills)
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > self.capacidade:
+            self._memoria.popitem(last=False)
+
+    def _podar_disco(self):
+        arquivos = [
+            os.path.join(self.diretorio, nome)
+            for nome in os.listdir(self.diretorio)
+            if nome.endswith('.json')
+        ]
+        if len(arquivos) <= self.capacidade_disco:
+            return
+        arquivos.sort(key=os.path.getmtime)
+        for caminho in arquivos[:len(arquivos) - self.capacidade_disco]:
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+
+    def __len__(self):
+        return len(self._memoria)
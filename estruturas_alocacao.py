@@ -0,0 +1,74 @@
+from typing import Dict, Iterable, Optional
+
+
+class IndiceOcorrencias:
+    # Mapeia cada chave (id de dispositivo ou registrador) para os operandos que a
+    # referenciam e a posição (slot ou instrução) de cada um
+    def __init__(self):
+        self._ocorrencias = {}
+
+    def adicionar(self, chave: str, posicao, operando):
+        self._ocorrencias.setdefault(chave, {})[id(operando)] = (posicao, operando)
+
+    def remover(self, chave: str, operando):
+        ocorrencias = self._ocorrencias.get(chave)
+        if ocorrencias is None:
+            return
+        ocorrencias.pop(id(operando), None)
+        if not ocorrencias:
+            self._ocorrencias.pop(chave)
+
+    def contagem(self, chave: str) -> int:
+        return len(self._ocorrencias.get(chave, ()))
+
+    def operandos(self, chave: str) -> list:
+        return [operando for _, operando in self._ocorrencias.get(chave, {}).values()]
+
+    def posicoes(self, chave: str) -> list:
+        return [posicao for posicao, _ in self._ocorrencias.get(chave, {}).values()]
+
+    def chaves(self):
+        return self._ocorrencias.keys()
+
+    def renomear(self, mapeamento: Dict[str, str], atributo: str):
+        # Renomeação simultânea: coleta tudo antes de reescrever, como o mapeamento completo
+        coletados = [
+            (novo, self._ocorrencias.pop(antigo))
+            for antigo, novo in mapeamento.items()
+            if antigo != novo and antigo in self._ocorrencias
+        ]
+        for novo, ocorrencias in coletados:
+            for _, operando in ocorrencias.values():
+                setattr(operando, atributo, novo)
+            self._ocorrencias.setdefault(novo, {}).update(ocorrencias)
+
+
+class TabelaSimbolos:
+    # Interna nomes em inteiros densos; o nome só é recuperado na fronteira da API.
+    # A tabela só cresce: quem remove nós por tempo indeterminado troca a tabela por uma
+    # nova com os nomes vivos (ver GrafoInterferencia.compactar_simbolos em alocacao_canais)
+    def __init__(self, nomes: Iterable[str] = ()):
+        self._indices = {}
+        self.nomes = []
+        for nome in nomes:
+            self.internar(nome)
+
+    def internar(self, nome: str) -> int:
+        indice = self._indices.get(nome)
+        if indice is None:
+            indice = len(self.nomes)
+            self._indices[nome] = indice
+            self.nomes.append(nome)
+        return indice
+
+    def indice(self, nome: str) -> Optional[int]:
+        return self._indices.get(nome)
+
+    def nome(self, indice: int) -> str:
+        return self.nomes[indice]
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self._indices
+
+    def __len__(self):
+        return len(self.nomes)
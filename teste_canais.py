@@ -1,5 +1,16 @@
+import copy
+import os
+import tempfile
+from random import Random
+
+import benchmark_canais
 from alocacao_canais import *
 
+
+# Arestas como {(menor, maior): peso}, independente da ordem de construção
+def arestas_normalizadas(grafo):
+    return {tuple(sorted((a, b))): peso for a, b, peso in grafo.obter_arestas()}
+
 # Teste 1 – Construção do grafo de interferência espacial
 def test_construir_grafo_interferencia_espacial():
     print("Teste 1: Construção do Grafo de Interferência Espacial")
@@ -372,6 +383,877 @@ def test_calcular_distancia():
     assert abs(distancia - 5.0) < 0.001
 
 
+# Teste 13 – Construção espacial com grade equivale à força bruta
+def test_grafo_espacial_grade_igual_forca_bruta():
+    print("\n-----------------------------------------\n")
+    print("Teste 13: Grafo Espacial com Índice em Grade")
+    print("\nCenário:")
+    print("  • 300 dispositivos aleatórios em uma área de 2000 x 2000")
+    print("  • Grafo construído por força bruta e pela grade espacial")
+    print("\nResultado esperado:")
+    print("  • Mesmas arestas e mesmos pesos nos dois modos")
+    
+    gerador = Random(13)
+    dispositivos = [
+        DispositivoMovel(f"D{i}", gerador.uniform(-1000, 1000), gerador.uniform(-1000, 1000), gerador.uniform(10, 100))
+        for i in range(300)
+    ]
+    
+    grafo_bruto = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=150.0)
+    grafo_grade = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=150.0, modo="grade")
+    
+    print(f"\nArestas (força bruta): {len(grafo_bruto.obter_arestas())}")
+    print(f"Arestas (grade):       {len(grafo_grade.obter_arestas())}")
+    
+    assert grafo_grade.obter_arestas() == grafo_bruto.obter_arestas()
+
+
+# Teste 14 – Núcleo em lote produz as mesmas arestas
+def test_grafo_espacial_lote():
+    print("\n-----------------------------------------\n")
+    print("Teste 14: Grafo Espacial com Núcleo em Lote")
+    print("\nCenário:")
+    print("  • 200 dispositivos aleatórios com potências variadas")
+    print("  • Cálculo em lote sobre as colunas de coordenadas e potências")
+    print("\nResultado esperado:")
+    print("  • Mesmas arestas e pesos da construção por força bruta")
+    print("  • Pesos do lote iguais a calcular_interferencia")
+    
+    gerador = Random(14)
+    dispositivos = [
+        DispositivoMovel(f"D{i}", gerador.uniform(0, 800), gerador.uniform(0, 800), gerador.uniform(10, 150))
+        for i in range(200)
+    ]
+    
+    grafo_bruto = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=120.0)
+    grafo_lote = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=120.0, modo="lote")
+    
+    xs = [d.x for d in dispositivos]
+    ys = [d.y for d in dispositivos]
+    potencias = [d.potencia for d in dispositivos]
+    arestas = calcular_arestas_lote(xs, ys, potencias, 120.0, 0.1, [(0, range(1, 200))])
+    
+    print(f"\nArestas (força bruta): {len(grafo_bruto.obter_arestas())}")
+    print(f"Arestas (lote):        {len(grafo_lote.obter_arestas())}")
+    
+    assert grafo_lote.obter_arestas() == grafo_bruto.obter_arestas()
+    for i, j, peso in arestas:
+        assert i == 0
+        assert peso == calcular_interferencia(dispositivos[0], dispositivos[j], 120.0)
+
+# Teste 15 – Frota em colunas aceita pelas funções de alocação
+def test_frota_dispositivos():
+    print("\n-----------------------------------------\n")
+    print("Teste 15: Frota de Dispositivos em Colunas")
+    print("\nCenário:")
+    print("  • Mesmos 4 dispositivos do Teste 5, guardados em uma FrotaDispositivos")
+    print("  • Apenas 2 canais disponíveis")
+    print("\nResultado esperado:")
+    print("  • Mesmo grafo e mesmos custos da lista de objetos")
+    print("  • Alocação aplicada direto nas colunas da frota")
+    
+    dispositivos = [
+        DispositivoMovel("D1", 0, 0, 50, frequencia_uso=1.0),
+        DispositivoMovel("D2", 30, 0, 50, frequencia_uso=2.0),
+        DispositivoMovel("D3", 60, 0, 50, frequencia_uso=1.5),
+        DispositivoMovel("D4", 90, 0, 50, frequencia_uso=0.5)
+    ]
+    frota = FrotaDispositivos.de_dispositivos(dispositivos)
+    
+    grafo_lista = construir_grafo_interferencia_espacial(dispositivos)
+    for modo in ("forca_bruta", "grade", "lote"):
+        grafo_frota = construir_grafo_interferencia_espacial(frota, modo=modo)
+        assert grafo_frota.obter_arestas() == grafo_lista.obter_arestas()
+    assert estimar_custos_spill(frota) == estimar_custos_spill(dispositivos)
+    
+    alocacao, spills = alocar_canais_com_spilling(frota, grafo_lista, ["C1", "C2"])
+    aplicar_alocacao(frota, alocacao, spills)
+    
+    print("\nEstado da frota:")
+    for disp in frota:
+        print(f"  • {disp.id}: canal={disp.canal_alocado}, em_spill={disp.em_spill}")
+    
+    assert len(alocacao) + len(spills) == 4
+    for disp in frota:
+        assert disp.em_spill == (disp.id in spills)
+        assert disp.canal_alocado == alocacao.get(disp.id)
+    assert frota.obter("D3").x == 60.0
+
+# Teste 16 – Grafo espacial incremental igual à reconstrução completa
+def test_grafo_incremental():
+    print("\n-----------------------------------------\n")
+    print("Teste 16: Atualização Incremental do Grafo Espacial")
+    print("\nCenário:")
+    print("  • 150 dispositivos aleatórios")
+    print("  • Sequência de movimentos, entradas e saídas")
+    print("\nResultado esperado:")
+    print("  • Após cada evento, mesmas arestas e pesos da reconstrução completa")
+    
+    gerador = Random(16)
+    dispositivos = {
+        f"D{i}": DispositivoMovel(f"D{i}", gerador.uniform(0, 600), gerador.uniform(0, 600), gerador.uniform(10, 100))
+        for i in range(150)
+    }
+    incremental = GrafoInterferenciaIncremental(list(dispositivos.values()), limiar_distancia=100.0)
+    
+    for passo in range(60):
+        evento = passo % 3
+        if evento == 0:
+            disp = dispositivos[gerador.choice(sorted(dispositivos))]
+            disp.x += gerador.uniform(-150, 150)
+            disp.y += gerador.uniform(-150, 150)
+            incremental.mover_dispositivo(disp.id, disp.x, disp.y)
+        elif evento == 1:
+            novo = DispositivoMovel(f"N{passo}", gerador.uniform(0, 600), gerador.uniform(0, 600), 60)
+            dispositivos[novo.id] = novo
+            incremental.adicionar_dispositivo(novo.id, novo.x, novo.y, novo.potencia)
+        else:
+            disp_id = gerador.choice(sorted(dispositivos))
+            dispositivos.pop(disp_id)
+            incremental.remover_dispositivo(disp_id)
+        
+        completo = construir_grafo_interferencia_espacial(list(dispositivos.values()), limiar_distancia=100.0)
+        assert arestas_normalizadas(incremental.obter_grafo()) == arestas_normalizadas(completo)
+        assert set(incremental.obter_grafo().obter_nos()) == set(completo.obter_nos())
+    
+    print(f"\nArestas finais: {len(incremental.obter_grafo().obter_arestas())}")
+
+# Teste 17 – Construção paralela por tiles sem arestas duplicadas
+def test_grafo_espacial_paralelo():
+    print("\n-----------------------------------------\n")
+    print("Teste 17: Grafo Espacial Paralelo por Tiles")
+    print("\nCenário:")
+    print("  • 400 dispositivos aleatórios divididos em tiles com halo")
+    print("  • Tiles processados por 2 processos")
+    print("\nResultado esperado:")
+    print("  • Mesmas arestas, pesos e ordem da força bruta, sem duplicatas")
+    
+    gerador = Random(17)
+    dispositivos = [
+        DispositivoMovel(f"D{i}", gerador.uniform(0, 1500), gerador.uniform(0, 1500), gerador.uniform(10, 100))
+        for i in range(400)
+    ]
+    
+    grafo_bruto = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=150.0)
+    grafo_paralelo = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=150.0, modo="paralelo", processos=2)
+    
+    print(f"\nArestas (força bruta): {len(grafo_bruto.obter_arestas())}")
+    print(f"Arestas (paralelo):    {len(grafo_paralelo.obter_arestas())}")
+    
+    assert grafo_paralelo.obter_arestas() == grafo_bruto.obter_arestas()
+
+# Teste 18 – Grafo temporal construído a partir de um fluxo de slots
+def test_grafo_temporal_fluxo():
+    print("\n-----------------------------------------\n")
+    print("Teste 18: Grafo Temporal a partir de Fluxo de Slots")
+    print("\nCenário:")
+    print("  • Escalonamento do Teste 2 gravado em arquivo, um slot por linha")
+    print("  • Slots lidos de forma preguiçosa por um gerador")
+    print("\nResultado esperado:")
+    print("  • Mesmo grafo da construção a partir do EscalonamentoRede")
+    
+    slots = [
+        SlotTempo("inicio_frame", [TransmissaoAtiva("D1", True)], []),
+        SlotTempo("slot_normal", [TransmissaoAtiva("D2", True)], []),
+        SlotTempo("slot_normal", [TransmissaoAtiva("D3", True)], [RequisicaoCanal("D1", True)]),
+        SlotTempo("inicio_frame", [TransmissaoAtiva("D4", True)], []),
+        SlotTempo("slot_normal", [TransmissaoAtiva("D1", False)], [])
+    ]
+    
+    descritor, caminho = tempfile.mkstemp(suffix=".jsonl")
+    os.close(descritor)
+    try:
+        escrever_slots(caminho, slots)
+        grafo_fluxo = construir_grafo_interferencia_temporal_fluxo(ler_slots(caminho))
+    finally:
+        os.remove(caminho)
+    grafo = construir_grafo_interferencia_temporal(EscalonamentoRede(slots))
+    
+    print(f"\nArestas (fluxo): {sorted(tuple(sorted((a, b))) for a, b, _ in grafo_fluxo.obter_arestas())}")
+    
+    assert grafo_fluxo.obter_arestas() == grafo.obter_arestas()
+    assert grafo_fluxo.contem_aresta("D1", "D4")
+    assert not grafo_fluxo.contem_aresta("D1", "D3")
+
+# Teste 19 – Motor de intervalos equivale à varredura sequencial
+def test_grafo_temporal_intervalos():
+    print("\n-----------------------------------------\n")
+    print("Teste 19: Grafo Temporal por Intervalos de Atividade")
+    print("\nCenário:")
+    print("  • Escalonamentos aleatórios com vários frames")
+    print("  • Transmissões ativas e inativas, liberações repetidas")
+    print("\nResultado esperado:")
+    print("  • Mesmas arestas e nós da construção sequencial")
+    
+    gerador = Random(19)
+    for _ in range(50):
+        slots = []
+        for _ in range(gerador.randrange(1, 4)):
+            slots.append(SlotTempo("inicio_frame", [TransmissaoAtiva(f"D{gerador.randrange(8)}", gerador.random() < 0.7) for _ in range(gerador.randrange(3))], []))
+            for _ in range(gerador.randrange(5)):
+                transmissoes = [TransmissaoAtiva(f"D{gerador.randrange(8)}", gerador.random() < 0.7) for _ in range(gerador.randrange(3))]
+                requisicoes = [RequisicaoCanal(f"D{gerador.randrange(8)}", gerador.random() < 0.8) for _ in range(gerador.randrange(3))]
+                slots.append(SlotTempo("slot_normal", transmissoes, requisicoes))
+        escalonamento = EscalonamentoRede(slots)
+        
+        grafo_sequencial = construir_grafo_interferencia_temporal(escalonamento)
+        grafo_intervalos = construir_grafo_interferencia_temporal(escalonamento, modo="intervalos")
+        
+        assert arestas_normalizadas(grafo_intervalos) == arestas_normalizadas(grafo_sequencial)
+        assert set(grafo_intervalos.obter_nos()) == set(grafo_sequencial.obter_nos())
+    
+    print("\n50 escalonamentos comparados sem diferenças")
+
+# Teste 20 – Construção temporal com frames em paralelo
+def test_grafo_temporal_paralelo():
+    print("\n-----------------------------------------\n")
+    print("Teste 20: Grafo Temporal com Frames em Paralelo")
+    print("\nCenário:")
+    print("  • 40 frames aleatórios divididos entre 2 processos")
+    print("\nResultado esperado:")
+    print("  • União das arestas por frame igual à construção sequencial")
+    
+    gerador = Random(20)
+    slots = []
+    for _ in range(40):
+        slots.append(SlotTempo("inicio_frame", [TransmissaoAtiva(f"D{gerador.randrange(30)}", True)], []))
+        for _ in range(4):
+            transmissoes = [TransmissaoAtiva(f"D{gerador.randrange(30)}", gerador.random() < 0.7) for _ in range(2)]
+            requisicoes = [RequisicaoCanal(f"D{gerador.randrange(30)}", True)]
+            slots.append(SlotTempo("slot_normal", transmissoes, requisicoes))
+    escalonamento = EscalonamentoRede(slots)
+    
+    grafo_sequencial = construir_grafo_interferencia_temporal(escalonamento)
+    grafo_paralelo = construir_grafo_interferencia_temporal_fluxo(iter(slots), modo="paralelo", processos=2, frames_por_tarefa=5)
+    
+    print(f"\nArestas (sequencial): {len(grafo_sequencial.obter_arestas())}")
+    print(f"Arestas (paralelo):   {len(grafo_paralelo.obter_arestas())}")
+    
+    assert arestas_normalizadas(grafo_paralelo) == arestas_normalizadas(grafo_sequencial)
+
+# Teste 21 – Janela deslizante de frames com remoção dos mais antigos
+def test_grafo_janela_deslizante():
+    print("\n-----------------------------------------\n")
+    print("Teste 21: Grafo Temporal em Janela Deslizante")
+    print("\nCenário:")
+    print("  • 30 frames aleatórios chegando um a um")
+    print("  • Janela com os 5 frames mais recentes")
+    print("\nResultado esperado:")
+    print("  • A cada frame, grafo igual à reconstrução dos últimos 5 frames")
+    
+    gerador = Random(21)
+    frames = []
+    for _ in range(30):
+        frame = [SlotTempo("inicio_frame", [TransmissaoAtiva(f"D{gerador.randrange(12)}", True)], [])]
+        for _ in range(3):
+            transmissoes = [TransmissaoAtiva(f"D{gerador.randrange(12)}", gerador.random() < 0.7) for _ in range(2)]
+            requisicoes = [RequisicaoCanal(f"D{gerador.randrange(12)}", True)]
+            frame.append(SlotTempo("slot_normal", transmissoes, requisicoes))
+        frames.append(frame)
+    
+    janela = GrafoInterferenciaJanela(5)
+    for indice, frame in enumerate(frames):
+        janela.adicionar_frame(frame)
+        
+        slots_janela = [slot for f in frames[max(0, indice - 4):indice + 1] for slot in f]
+        completo = construir_grafo_interferencia_temporal(EscalonamentoRede(slots_janela))
+        assert arestas_normalizadas(janela.obter_grafo()) == arestas_normalizadas(completo)
+        assert set(janela.obter_grafo().obter_nos()) == set(completo.obter_nos())
+    
+    print(f"\nArestas na janela final: {len(janela.obter_grafo().obter_arestas())}")
+
+# Teste 22 – Realocação online mantém a alocação válida
+def test_alocador_online():
+    print("\n-----------------------------------------\n")
+    print("Teste 22: Realocação Online de Canais")
+    print("\nCenário:")
+    print("  • 80 dispositivos aleatórios e 4 canais")
+    print("  • Sequência de entradas, saídas e novas interferências")
+    print("\nResultado esperado:")
+    print("  • Alocação válida após cada evento")
+    print("  • Todo dispositivo presente alocado ou em spill")
+    
+    gerador = Random(22)
+    dispositivos = [
+        DispositivoMovel(f"D{i}", gerador.uniform(0, 600), gerador.uniform(0, 600), gerador.uniform(10, 100))
+        for i in range(80)
+    ]
+    grafo = construir_grafo_interferencia_espacial(dispositivos, limiar_distancia=120.0)
+    alocador = AlocadorCanaisOnline.de_dispositivos(dispositivos, grafo, ["C1", "C2", "C3", "C4"])
+    presentes = {d.id for d in dispositivos}
+    assert alocador.validar()
+    
+    for passo in range(60):
+        evento = passo % 3
+        if evento == 0:
+            novo = f"N{passo}"
+            vizinhos = {v: 0.5 for v in gerador.sample(sorted(presentes), 5)}
+            alocador.adicionar_dispositivo(novo, vizinhos, custo=gerador.uniform(10, 100))
+            presentes.add(novo)
+        elif evento == 1:
+            removido = gerador.choice(sorted(presentes))
+            alocador.remover_dispositivo(removido)
+            presentes.discard(removido)
+        else:
+            x, y = gerador.sample(sorted(presentes), 2)
+            alocador.adicionar_aresta(x, y, 0.5)
+        
+        assert alocador.validar()
+        assert presentes == set(alocador.alocacao) | alocador.spills
+        assert not set(alocador.alocacao) & alocador.spills
+    
+    print(f"\nAlocados: {len(alocador.alocacao)}, em spill: {len(alocador.spills)}")
+
+# Teste 23 – Alocação em lote de células independentes
+def test_alocacao_em_lote():
+    print("\n-----------------------------------------\n")
+    print("Teste 23: Alocação em Lote de Várias Células")
+    print("\nCenário:")
+    print("  • 12 células independentes com tamanhos diferentes")
+    print("  • Alocação distribuída entre 2 processos")
+    print("\nResultado esperado:")
+    print("  • Um resultado por célula, na ordem de entrada")
+    print("  • Cada célula com todos os dispositivos alocados ou em spill")
+    
+    gerador = Random(23)
+    cenarios = []
+    for celula in range(12):
+        dispositivos = [
+            DispositivoMovel(f"C{celula}_D{i}", gerador.uniform(0, 300), gerador.uniform(0, 300), 50)
+            for i in range(5 + celula)
+        ]
+        grafo = construir_grafo_interferencia_espacial(dispositivos)
+        cenarios.append((dispositivos, grafo, ["C1", "C2", "C3"]))
+    
+    resultados, tempos = alocar_canais_em_lote(cenarios, processos=2)
+    
+    print(f"\nCélulas processadas: {len(resultados)}")
+    print(f"Tempo total de alocação: {sum(tempos):.4f}s")
+    
+    assert len(resultados) == len(tempos) == 12
+    for (dispositivos, grafo, _), (alocacao, spills) in zip(cenarios, resultados):
+        assert set(alocacao) | spills == {d.id for d in dispositivos}
+        for x, y, _ in grafo.obter_arestas():
+            assert x in spills or y in spills or alocacao[x] != alocacao[y]
+
+# Teste 24 – Spill por custo dividido pelo grau (ponderado ou não)
+def test_decidir_spill_ponderado():
+    print("\n-----------------------------------------\n")
+    print("Teste 24: Spill por Custo / Grau de Interferência")
+    print("\nCenário:")
+    print("  • Grafo completo K4: H, A, B, C e 3 canais")
+    print("  • H tem custo 100 e interferência forte (0.9) com todos")
+    print("  • A, B e C têm custo 60 e interferência fraca (0.1) entre si")
+    print("\nResultado esperado:")
+    print("  • Apenas 1 dispositivo vai para spill")
+    print("  • Pelo grau simples: um dos baratos (A, B ou C)")
+    print("  • Pelo grau ponderado: H, que concentra a interferência")
+    
+    grafo = GrafoInterferencia()
+    for outro in ("A", "B", "C"):
+        grafo.adicionar_aresta("H", outro, 0.9)
+    grafo.adicionar_aresta("A", "B", 0.1)
+    grafo.adicionar_aresta("B", "C", 0.1)
+    grafo.adicionar_aresta("A", "C", 0.1)
+    
+    dispositivos = [
+        DispositivoMovel("H", 0, 0, 100),
+        DispositivoMovel("A", 0, 0, 60),
+        DispositivoMovel("B", 0, 0, 60),
+        DispositivoMovel("C", 0, 0, 60)
+    ]
+    canais = ["C1", "C2", "C3"]
+    custos = estimar_custos_spill(dispositivos)
+    
+    spills_grau = decidir_spills(grafo, dispositivos, canais, custos)
+    spills_ponderado = decidir_spills(grafo, dispositivos, canais, custos, ponderado=True)
+    
+    print(f"\nSpill pelo grau:          {spills_grau}")
+    print(f"Spill pelo grau ponderado: {spills_ponderado}")
+    
+    assert len(spills_grau) == 1 and spills_grau <= {"A", "B", "C"}
+    assert spills_ponderado == {"H"}
+
+# Teste 25 – Remapeamento no local, sem recriar slots
+def test_remapear_dispositivos_no_local():
+    print("\n-----------------------------------------\n")
+    print("Teste 25: Remapeamento de Dispositivos no Local")
+    print("\nCenário:")
+    print("  • Escalonamento com D1, D2 e D3")
+    print("  • Mapeamento simultâneo: D1 → D2, D2 → D_new")
+    print("\nResultado esperado:")
+    print("  • Mesmo resultado do remapeamento que recria os slots")
+    print("  • Slots e operandos originais reaproveitados")
+    
+    def criar_escalonamento():
+        return EscalonamentoRede([
+            SlotTempo("inicio_frame", [TransmissaoAtiva("D1", True)], []),
+            SlotTempo("slot_normal", [TransmissaoAtiva("D2", True)], [RequisicaoCanal("D1", True)]),
+            SlotTempo("slot_normal", [TransmissaoAtiva("D3", True)], [RequisicaoCanal("D2", True)])
+        ])
+    
+    mapeamento = {"D1": "D2", "D2": "D_new"}
+    copia = criar_escalonamento()
+    copia.remapear_dispositivos(mapeamento)
+    
+    escalonamento = criar_escalonamento()
+    slots_originais = list(escalonamento.slots)
+    transmissao_d3 = escalonamento.slots[2].transmissoes[0]
+    escalonamento.remapear_dispositivos(mapeamento, no_local=True)
+    
+    def ids(esc):
+        return [
+            ([t.dispositivo_id for t in slot.transmissoes], [r.dispositivo_id for r in slot.requisicoes])
+            for slot in esc.slots
+        ]
+    
+    print(f"\nDispositivos após remapeamento: {ids(escalonamento)}")
+    
+    assert ids(escalonamento) == ids(copia)
+    assert all(a is b for a, b in zip(escalonamento.slots, slots_originais))
+    assert escalonamento.slots[2].transmissoes[0] is transmissao_d3
+    
+    # O índice construído na primeira renomeação fica ativo para as seguintes
+    indice = escalonamento.indice
+    assert indice is not None
+    escalonamento.remapear_dispositivos({"D3": "D4"}, no_local=True)
+    assert escalonamento.indice is indice and escalonamento.contar_ocorrencias("D4") == 1
+
+# Teste 26 – Índice de ocorrências mantido no escalonamento
+def test_indice_ocorrencias():
+    print("\n-----------------------------------------\n")
+    print("Teste 26: Índice de Ocorrências de Dispositivos")
+    print("\nCenário:")
+    print("  • Escalonamento indexado com D1 e D2")
+    print("  • Novo slot com D3 e remapeamento no local D1 → D3")
+    print("\nResultado esperado:")
+    print("  • obter_dispositivos e contagens iguais a uma varredura completa")
+    
+    escalonamento = EscalonamentoRede([
+        SlotTempo("inicio_frame", [TransmissaoAtiva("D1", True)], []),
+        SlotTempo("slot_normal", [TransmissaoAtiva("D2", True)], [RequisicaoCanal("D1", True)])
+    ], indexado=True)
+    
+    novo_slot = SlotTempo("slot_normal", [TransmissaoAtiva("D3", True)], [RequisicaoCanal("D2", True)])
+    escalonamento.adicionar_slot(novo_slot)
+    assert escalonamento.obter_dispositivos() == {"D1", "D2", "D3"}
+    
+    escalonamento.remapear_dispositivos({"D1": "D3"}, no_local=True)
+    
+    print(f"\nDispositivos: {escalonamento.obter_dispositivos()}")
+    print(f"Ocorrências de D3: {escalonamento.contar_ocorrencias('D3')}")
+    
+    assert escalonamento.obter_dispositivos() == {"D2", "D3"}
+    assert escalonamento.contar_ocorrencias("D3") == 3
+    assert escalonamento.contar_ocorrencias("D1") == 0
+    assert novo_slot in escalonamento.obter_posicoes("D3")
+    
+    escalonamento.remapear_dispositivos({"D2": "D4"})
+    assert escalonamento.obter_dispositivos() == {"D3", "D4"}
+    assert escalonamento.contar_ocorrencias("D4") == 2
+
+# Teste 27 – Snapshot binário mapeado em memória
+def test_snapshot_binario():
+    print("\n-----------------------------------------\n")
+    print("Teste 27: Snapshot Binário com mmap")
+    print("\nCenário:")
+    print("  • Frota de 200 dispositivos e escalonamento de 30 frames gravados em disco")
+    print("  • Snapshot reaberto com mmap, sem recriar objetos na abertura")
+    print("\nResultado esperado:")
+    print("  • Grafos espacial e temporal iguais aos dos objetos originais")
+    
+    gerador = Random(27)
+    dispositivos = [
+        DispositivoMovel(f"D{i}", gerador.uniform(0, 800), gerador.uniform(0, 800), gerador.uniform(10, 100), gerador.uniform(0.5, 2.0))
+        for i in range(200)
+    ]
+    slots = []
+    for _ in range(30):
+        slots.append(SlotTempo("inicio_frame", [TransmissaoAtiva(f"D{gerador.randrange(200)}", True)], []))
+        for _ in range(3):
+            slots.append(SlotTempo(
+                "slot_normal",
+                [TransmissaoAtiva(f"D{gerador.randrange(210)}", gerador.random() < 0.7)],
+                [RequisicaoCanal(f"D{gerador.randrange(200)}", True)],
+                gerador.uniform(0.5, 2.0)
+            ))
+    
+    descritor, caminho = tempfile.mkstemp(suffix=".bin")
+    os.close(descritor)
+    try:
+        salvar_snapshot(caminho, dispositivos, slots)
+        with abrir_snapshot(caminho) as snapshot:
+            frota = snapshot.frota()
+            grafo_espacial = construir_grafo_interferencia_espacial(frota, modo="lote")
+            grafo_temporal = construir_grafo_interferencia_temporal_fluxo(snapshot.slots())
+            pesos = [slot.peso for slot in snapshot.slots()]
+            
+            print(f"\nDispositivos no snapshot: {len(frota)}")
+            print(f"Slots no snapshot: {snapshot.quantidade_slots}")
+            
+            assert estimar_custos_spill(frota) == estimar_custos_spill(dispositivos)
+            
+            # A primeira inserção copia as colunas mapeadas; o arquivo não muda
+            frota.adicionar("Novo", 1.0, 2.0, 30.0)
+            assert len(frota) == 201 and frota[-1].id == "Novo" and frota[0].id == "D0"
+            assert len(snapshot.frota()) == 200
+            del frota
+            
+            try:
+                FrotaDispositivos.de_colunas(snapshot.ids, snapshot.x, list(snapshot.y)[:10], snapshot.potencia, snapshot.frequencia_uso)
+                assert False, "Colunas com tamanhos diferentes deveriam ser rejeitadas"
+            except ValueError:
+                pass
+    finally:
+        os.remove(caminho)
+    
+    assert grafo_espacial.obter_arestas() == construir_grafo_interferencia_espacial(dispositivos).obter_arestas()
+    assert grafo_temporal.obter_arestas() == construir_grafo_interferencia_temporal(EscalonamentoRede(slots)).obter_arestas()
+    assert pesos == [slot.peso for slot in slots]
+    
+    # Tipos de slot fora dos dois nomes conhecidos são gravados como slot normal
+    slots_outros = [
+        SlotTempo("inicio_frame", [TransmissaoAtiva("A", True)], []),
+        SlotTempo("slot_dados", [TransmissaoAtiva("B", True)], [])
+    ]
+    descritor, caminho = tempfile.mkstemp(suffix=".bin")
+    os.close(descritor)
+    try:
+        salvar_snapshot(caminho, slots=slots_outros)
+        with abrir_snapshot(caminho) as snapshot:
+            assert [slot.tipo for slot in snapshot.slots()] == ["inicio_frame", "slot_normal"]
+            grafo_outros = construir_grafo_interferencia_temporal_fluxo(snapshot.slots())
+    finally:
+        os.remove(caminho)
+    assert grafo_outros.obter_arestas() == construir_grafo_interferencia_temporal_fluxo(slots_outros).obter_arestas()
+
+# Teste 28 – Cache de alocação em memória e em disco
+def test_cache_alocacao():
+    print("\n-----------------------------------------\n")
+    print("Teste 28: Cache de Alocação por Impressão Digital")
+    print("\nCenário:")
+    print("  • Frota de 60 dispositivos alocada duas vezes com o mesmo cache")
+    print("  • Mesma topologia reconstruída com os dispositivos em outra ordem")
+    print("  • Novo cache apontando para o mesmo diretório em disco")
+    print("\nResultado esperado:")
+    print("  • Impressão digital independente da ordem de construção")
+    print("  • Resultado do cache igual ao calculado e aceito pela validação")
+    
+    gerador = Random(28)
+    dispositivos = [
+        DispositivoMovel(f"D{i}", gerador.uniform(0, 400), gerador.uniform(0, 400), gerador.uniform(10, 100), gerador.uniform(0.5, 2.0))
+        for i in range(60)
+    ]
+    canais = ["C1", "C2", "C3"]
+    grafo = construir_grafo_interferencia_espacial(dispositivos)
+    grafo_invertido = construir_grafo_interferencia_espacial(list(reversed(dispositivos)))
+    custos = estimar_custos_spill(dispositivos)
+    ids = [d.id for d in dispositivos]
+    
+    assert impressao_digital(grafo, ids, canais, custos) == impressao_digital(grafo_invertido, ids[::-1], canais, custos)
+    assert impressao_digital(grafo, ids, canais, custos) != impressao_digital(grafo, ids, canais[:2], custos)
+    
+    esperado = alocar_canais_com_spilling(dispositivos, grafo, canais)
+    diretorio = tempfile.mkdtemp()
+    cache = CacheAlocacao(diretorio=diretorio)
+    primeira = alocar_canais_com_spilling(dispositivos, grafo, canais, cache=cache)
+    segunda = alocar_canais_com_spilling(dispositivos, grafo_invertido, canais, cache=cache)
+    do_disco = alocar_canais_com_spilling(dispositivos, grafo, canais, cache=CacheAlocacao(diretorio=diretorio))
+    
+    print(f"\nEntradas no cache: {len(cache)}")
+    print(f"Arquivos em disco: {len(os.listdir(diretorio))}")
+    print(f"Spills: {sorted(primeira[1])}")
+    
+    # A coloração sorteia canais, então o cache deve devolver exatamente a primeira
+    assert primeira == segunda == do_disco
+    assert primeira[1] == esperado[1]
+    assert len(cache) == 1 and len(os.listdir(diretorio)) == 1
+    assert coloracao_valida(grafo, primeira[0], canais, ids, primeira[1])
+    
+    # Coloração adulterada é rejeitada e recalculada
+    chave = impressao_digital(grafo, ids, canais, custos, "canais:ponderado=False")
+    cache.guardar(chave, {disp_id: "C1" for disp_id in ids}, set())
+    recalculada = alocar_canais_com_spilling(dispositivos, grafo, canais, cache=cache)
+    assert coloracao_valida(grafo, recalculada[0], canais, ids, recalculada[1])
+
+# Teste 29 – Gerador de cenários sintéticos e benchmark de escala
+def test_gerador_cenarios():
+    print("\n-----------------------------------------\n")
+    print("Teste 29: Gerador de Cenários em Escala de Cidade")
+    print("\nCenário:")
+    print("  • Frotas de 300 dispositivos nos layouts uniforme, hotspot e rodovia")
+    print("  • Escalonamento gerado para a mesma frota duas vezes")
+    print("  • Benchmark rodando em 100 e 200 dispositivos")
+    print("\nResultado esperado:")
+    print("  • Mesma semente gera exatamente a mesma frota e escalonamento")
+    print("  • Dispositivos dentro da área e uma linha por fase e tamanho")
+    
+    for layout in benchmark_canais.LAYOUTS:
+        frota = benchmark_canais.gerar_frota(300, layout, semente=7)
+        repetida = benchmark_canais.gerar_frota(300, layout, semente=7)
+        lado = benchmark_canais.lado_area(300)
+        
+        assert list(frota.x) == list(repetida.x) and list(frota.y) == list(repetida.y)
+        assert list(frota.potencia) == list(repetida.potencia)
+        assert list(frota.x) != list(benchmark_canais.gerar_frota(300, layout, semente=8).x)
+        assert all(0 <= x <= lado for x in frota.x) and all(0 <= y <= lado for y in frota.y)
+    
+    slots = list(benchmark_canais.gerar_escalonamento(frota.ids, semente=7))
+    repetidos = list(benchmark_canais.gerar_escalonamento(frota.ids, semente=7))
+    assert [repr(slot) for slot in slots] == [repr(slot) for slot in repetidos]
+    assert [[t.dispositivo_id for t in slot.transmissoes] for slot in slots] == [[t.dispositivo_id for t in slot.transmissoes] for slot in repetidos]
+    assert sum(slot.tipo == "inicio_frame" for slot in slots) == 19
+    
+    linhas = benchmark_canais.executar_benchmark([100, 200], ["hotspot"], semente=7)
+    benchmark_canais.imprimir_tabela(linhas)
+    
+    assert [(linha["dispositivos"], linha["fase"]) for linha in linhas] == [
+        (tamanho, fase) for tamanho in (100, 200) for fase in benchmark_canais.FASES
+    ]
+    assert all(linha["status"] == "ok" and linha["pico_mb"] is not None for linha in linhas)
+    espaciais = [linha for linha in linhas if linha["fase"] == "espacial"]
+    repetidas = [linha for linha in benchmark_canais.executar_benchmark([100, 200], ["hotspot"], semente=7, memoria=False) if linha["fase"] == "espacial"]
+    assert [(l["nos"], l["arestas"]) for l in espaciais] == [(l["nos"], l["arestas"]) for l in repetidas]
+
+# Teste 30 – Grafo com nomes internados em inteiros
+def test_grafo_indices_internados():
+    print("\n-----------------------------------------\n")
+    print("Teste 30: Grafo com Nomes Internados")
+    print("\nCenário:")
+    print("  • Grafo ponderado A-B (0.5), A-C (0.7), B-C (0.2), C-D (0.9)")
+    print("  • Renomeação de C para B e remoção de D")
+    print("\nResultado esperado:")
+    print("  • Nomes traduzidos só na interface; índices densos na tabela de símbolos")
+    print("  • Pesos e vizinhos preservados na fusão, sem auto-laço")
+    
+    grafo = GrafoInterferencia()
+    grafo.adicionar_arestas([("A", "B", 0.5), ("A", "C", 0.7), ("B", "C", 0.2), ("C", "D", 0.9)])
+    
+    assert [grafo.simbolos.indice(nome) for nome in "ABCD"] == [0, 1, 2, 3]
+    assert grafo.simbolos.nome(2) == "C" and "E" not in grafo.simbolos
+    assert grafo.vizinhos_indices(grafo.simbolos.indice("C")) == {0: 0.7, 1: 0.2, 3: 0.9}
+    assert grafo.obter_arestas() == [("A", "B", 0.5), ("A", "C", 0.7), ("B", "C", 0.2), ("C", "D", 0.9)]
+    
+    copia = copy.copy(grafo)
+    grafo.renomear_no("C", "B")
+    grafo.remover_no("D")
+    print("\nArestas após renomear C → B e remover D:", grafo.obter_arestas())
+    
+    assert sorted(grafo.obter_nos()) == ["A", "B"]
+    assert grafo.obter_peso_aresta("A", "B") == 0.5
+    assert not grafo.contem_aresta("B", "B") and not grafo.contem_aresta("C", "A")
+    assert grafo.obter_vizinhos("D") == [] and grafo.calcular_grau("inexistente") == 0
+    assert copia.obter_peso_aresta("C", "D") == 0.9 and copia.calcular_grau("C") == 3
+    
+    grafo.renomear_no("A", "E")
+    assert grafo.obter_arestas() == [("B", "E", 0.5)]
+    assert grafo.obter_peso_aresta("E", "B") == 0.5
+
+# Teste 31 – Coloração iterativa em grafo grande
+def test_coloracao_iterativa_grande():
+    print("\n-----------------------------------------\n")
+    print("Teste 31: Coloração Iterativa sem Cópias")
+    print("\nCenário:")
+    print("  • Grade 150 x 150 (22 500 dispositivos), bem acima do limite de recursão")
+    print("  • Clique de 4 dispositivos com 3 canais")
+    print("  • Dispositivo fora da lista ainda conta no grau dos vizinhos")
+    print("\nResultado esperado:")
+    print("  • Grade colorida com 3 canais sem conflitos")
+    print("  • Clique e nó preso pelo vizinho externo sem coloração (None)")
+    
+    lado = 150
+    grafo = GrafoInterferencia()
+    grafo.adicionar_arestas(
+        (f"D{i}_{j}", f"D{i + di}_{j + dj}", 1.0)
+        for i in range(lado) for j in range(lado)
+        for di, dj in ((1, 0), (0, 1)) if i + di < lado and j + dj < lado
+    )
+    canais = ["C1", "C2", "C3"]
+    dispositivos = grafo.obter_nos()
+    
+    coloracao = colorir_grafo(grafo, dispositivos, canais)
+    print(f"\nDispositivos coloridos: {len(coloracao)}")
+    
+    assert len(coloracao) == lado * lado
+    assert coloracao_valida(grafo, coloracao, canais, dispositivos)
+    
+    clique = GrafoInterferencia()
+    for a in "ABCD":
+        for b in "ABCD":
+            clique.adicionar_aresta(a, b)
+    assert colorir_grafo(clique, list("ABCD"), canais) is None
+    assert colorir_grafo(clique, list("ABC"), canais) is None
+    assert colorir_grafo(clique, list("AB"), canais[:2]) is None
+    assert set(colorir_grafo(clique, ["A", "Z"], canais + ["C4"])) == {"A", "Z"}
+
+# Teste 32 – Janela deslizante alimentada com slots em partes
+def test_grafo_janela_slots_em_partes():
+    print("\n-----------------------------------------\n")
+    print("Teste 32: Janela Deslizante com Slots em Fluxo")
+    print("\nCenário:")
+    print("  • 30 frames aleatórios enviados em pedaços que cortam os frames ao meio")
+    print("  • Janela com os 5 frames mais recentes")
+    print("\nResultado esperado:")
+    print("  • Frame aberto mantido entre chamadas e fechado no próximo 'inicio_frame'")
+    print("  • Grafo igual à reconstrução dos últimos 5 frames completos")
+    
+    # Caso mínimo: um slot por chamada ainda forma um único frame
+    janela = GrafoInterferenciaJanela(5)
+    janela.adicionar_slots([SlotTempo("inicio_frame", [TransmissaoAtiva("A", True)], [])])
+    janela.adicionar_slots([SlotTempo("slot_normal", [TransmissaoAtiva("B", True)], [])])
+    assert janela.obter_grafo().obter_arestas() == []
+    janela.fechar_frame()
+    assert janela.obter_grafo().contem_aresta("A", "B")
+    
+    gerador = Random(32)
+    frames = []
+    for _ in range(30):
+        frame = [SlotTempo("inicio_frame", [TransmissaoAtiva(f"D{gerador.randrange(12)}", True)], [])]
+        for _ in range(3):
+            transmissoes = [TransmissaoAtiva(f"D{gerador.randrange(12)}", gerador.random() < 0.7) for _ in range(2)]
+            requisicoes = [RequisicaoCanal(f"D{gerador.randrange(12)}", True)]
+            frame.append(SlotTempo("slot_normal", transmissoes, requisicoes))
+        frames.append(frame)
+    slots = [slot for frame in frames for slot in frame]
+    
+    janela = GrafoInterferenciaJanela(5)
+    posicao = 0
+    while posicao < len(slots):
+        passo = gerador.randrange(1, 7)
+        janela.adicionar_slots(slots[posicao:posicao + passo])
+        posicao += passo
+        
+        # Só os frames já seguidos por outro 'inicio_frame' estão completos
+        completos = sum(1 for slot in slots[1:posicao] if slot.tipo == "inicio_frame")
+        slots_janela = [slot for f in frames[max(0, completos - 5):completos] for slot in f]
+        completo = construir_grafo_interferencia_temporal(EscalonamentoRede(slots_janela))
+        assert arestas_normalizadas(janela.obter_grafo()) == arestas_normalizadas(completo)
+    
+    janela.fechar_frame()
+    slots_janela = [slot for f in frames[-5:] for slot in f]
+    completo = construir_grafo_interferencia_temporal(EscalonamentoRede(slots_janela))
+    assert arestas_normalizadas(janela.obter_grafo()) == arestas_normalizadas(completo)
+    assert set(janela.obter_grafo().obter_nos()) == set(completo.obter_nos())
+    
+    print(f"\nArestas na janela final: {len(janela.obter_grafo().obter_arestas())}")
+
+# Teste 33 – Tabela de símbolos limitada com dispositivos entrando e saindo
+def test_tabela_simbolos_rotatividade():
+    print("\n-----------------------------------------\n")
+    print("Teste 33: Tabela de Símbolos sob Rotatividade de Dispositivos")
+    print("\nCenário:")
+    print("  • 5000 entradas e saídas no grafo incremental e no alocador online")
+    print("  • 5000 frames com ids novos na janela deslizante")
+    print("\nResultado esperado:")
+    print("  • Tabela de nomes limitada, sem crescer com o histórico")
+    print("  • Grafo e alocação continuam corretos após as compactações")
+    
+    incremental = GrafoInterferenciaIncremental(limiar_distancia=50.0)
+    incremental.adicionar_dispositivo("fixo", 0.0, 0.0, 20.0)
+    for ciclo in range(5000):
+        incremental.adicionar_dispositivo(f"D{ciclo}", 10.0, 0.0, 20.0)
+        assert incremental.obter_grafo().contem_aresta("fixo", f"D{ciclo}")
+        incremental.remover_dispositivo(f"D{ciclo}")
+    assert incremental.obter_grafo().obter_nos() == []
+    assert len(incremental.obter_grafo().simbolos) <= 64
+    
+    janela = GrafoInterferenciaJanela(2)
+    for frame in range(5000):
+        janela.adicionar_frame([
+            SlotTempo("inicio_frame", [TransmissaoAtiva(f"A{frame}", True)], []),
+            SlotTempo("slot_normal", [TransmissaoAtiva(f"B{frame}", True)], [])
+        ])
+    assert set(janela.obter_grafo().obter_nos()) == {"A4998", "B4998", "A4999", "B4999"}
+    assert janela.obter_grafo().contem_aresta("A4999", "B4999")
+    assert len(janela.obter_grafo().simbolos) <= 64
+    
+    grafo = GrafoInterferencia()
+    grafo.adicionar_aresta("X", "Y")
+    alocador = AlocadorCanaisOnline(grafo, ["C1", "C2", "C3"], {"X": "C1", "Y": "C2"})
+    for ciclo in range(5000):
+        alocador.adicionar_dispositivo(f"D{ciclo}", {"X": 1.0, "Y": 1.0})
+        assert alocador.validar() and alocador.alocacao[f"D{ciclo}"] == "C3"
+        alocador.remover_dispositivo(f"D{ciclo}")
+    assert alocador.validar()
+    assert len(alocador.grafo.simbolos) <= 64
+    
+    print(f"\nNomes internados após 5000 ciclos: {len(alocador.grafo.simbolos)}")
+
+# Teste 34 – Motor de intervalos mais rápido que a varredura em frame ocupado
+def test_intervalos_mais_rapido_em_frame_ocupado():
+    print("\n-----------------------------------------\n")
+    print("Teste 34: Intervalos x Sequencial em Frame Ocupado")
+    print("\nCenário:")
+    print("  • Um frame com 1000 slots e quase todos os dispositivos ativos")
+    print("\nResultado esperado:")
+    print("  • Mesmo grafo nos dois modos")
+    print("  • Modo 'intervalos' mais rápido que o 'sequencial'")
+    
+    slots = list(benchmark_canais.gerar_frames_ocupados(1, 1000, 1000, semente=34))
+    sequencial = construir_grafo_interferencia_temporal_fluxo(slots, "sequencial")
+    intervalos = construir_grafo_interferencia_temporal_fluxo(slots, "intervalos")
+    assert arestas_normalizadas(intervalos) == arestas_normalizadas(sequencial)
+    
+    tempos = benchmark_canais.comparar_modos_temporais(slots, ("sequencial", "intervalos"))
+    print(f"\nArestas: {len(sequencial.obter_arestas())}")
+    for modo, segundos in tempos.items():
+        print(f"  • {modo}: {segundos:.4f}s")
+    assert tempos["intervalos"] < tempos["sequencial"]
+
+# Teste 35 – Modo paralelo mais rápido que o de intervalos com vários núcleos
+def test_paralelo_mais_rapido_com_varios_nucleos():
+    print("\n-----------------------------------------\n")
+    print("Teste 35: Paralelo x Intervalos em Frames Ocupados")
+    print("\nCenário:")
+    print("  • Um frame ocupado por núcleo, cada frame numa tarefa própria")
+    print("\nResultado esperado:")
+    print("  • Mesmo grafo nos dois modos")
+    print("  • Com dois ou mais núcleos, 'paralelo' mais rápido que 'intervalos'")
+    
+    nucleos = os.cpu_count() or 1
+    slots = list(benchmark_canais.gerar_frames_ocupados(max(nucleos, 2), 800, 800, semente=35))
+    intervalos = construir_grafo_interferencia_temporal_fluxo(slots, "intervalos")
+    paralelo = construir_grafo_interferencia_temporal_fluxo(slots, "paralelo", processos=2, frames_por_tarefa=1)
+    assert arestas_normalizadas(paralelo) == arestas_normalizadas(intervalos)
+    
+    if nucleos < 2:
+        print("\nMáquina com um núcleo: comparação de tempo ignorada")
+        return
+    tempos = benchmark_canais.comparar_modos_temporais(slots, ("intervalos", "paralelo"), frames_por_tarefa=1)
+    for modo, segundos in tempos.items():
+        print(f"  • {modo}: {segundos:.4f}s")
+    assert tempos["paralelo"] < tempos["intervalos"]
+
+# Teste 36 – Alocador online com nós desconhecidos e canais de nome falso
+def test_alocador_online_nos_desconhecidos():
+    print("\n-----------------------------------------\n")
+    print("Teste 36: Alocador Online com Nós Desconhecidos")
+    print("\nCenário:")
+    print("  • Novo dispositivo com vizinho nunca visto")
+    print("  • Nova aresta entre dois dispositivos nunca vistos")
+    print("  • Canal com nome vazio ('') livre para o novo nó")
+    print("\nResultado esperado:")
+    print("  • Todo nó do grafo alocado ou em spill")
+    print("  • Canal livre usado sem troca de Kempe")
+    
+    grafo = GrafoInterferencia()
+    grafo.adicionar_aresta("A", "B")
+    alocador = AlocadorCanaisOnline(grafo, ["C1", "C2"], {"A": "C1", "B": "C2"})
+    
+    alocador.adicionar_dispositivo("N", {"A": 1.0, "X": 1.0})
+    assert "X" in alocador.alocacao or "X" in alocador.spills
+    
+    alocador.adicionar_aresta("Y", "Z")
+    assert alocador.validar()
+    assert set(grafo.obter_nos()) == set(alocador.alocacao) | alocador.spills
+    print(f"\nAlocação: {dict(sorted(alocador.alocacao.items()))}")
+    
+    grafo = GrafoInterferencia()
+    grafo.adicionar_aresta("A", "B")
+    alocador = AlocadorCanaisOnline(grafo, ["", "C1"], {"A": "", "B": "C1"})
+    alocador.adicionar_dispositivo("X", {"B": 1.0})
+    assert alocador.alocacao == {"A": "", "B": "C1", "X": ""}
+
 if __name__ == "__main__":
     test_construir_grafo_interferencia_espacial()
     test_construir_grafo_interferencia_temporal()
@@ -384,4 +1266,28 @@ if __name__ == "__main__":
     test_coloracao_impossivel()
     test_estimar_custos()
     test_sem_interferencia_temporal()
-    test_calcular_distancia()
\ No newline at end of file
+    test_calcular_distancia()
+    test_grafo_espacial_grade_igual_forca_bruta()
+    test_grafo_espacial_lote()
+    test_frota_dispositivos()
+    test_grafo_incremental()
+    test_grafo_espacial_paralelo()
+    test_grafo_temporal_fluxo()
+    test_grafo_temporal_intervalos()
+    test_grafo_temporal_paralelo()
+    test_grafo_janela_deslizante()
+    test_alocador_online()
+    test_alocacao_em_lote()
+    test_decidir_spill_ponderado()
+    test_remapear_dispositivos_no_local()
+    test_indice_ocorrencias()
+    test_snapshot_binario()
+    test_cache_alocacao()
+    test_gerador_cenarios()
+    test_grafo_indices_internados()
+    test_coloracao_iterativa_grande()
+    test_grafo_janela_slots_em_partes()
+    test_tabela_simbolos_rotatividade()
+    test_intervalos_mais_rapido_em_frame_ocupado()
+    test_paralelo_mais_rapido_com_varios_nucleos()
+    test_alocador_online_nos_desconhecidos()
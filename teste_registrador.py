@@ -1,5 +1,19 @@
+import copy
+import tempfile
+from random import Random
+
 from alocacao_registradores import *
 
+
+# Arestas como conjuntos {a, b}; confere também que a adjacência é simétrica
+def arestas(grafo):
+    resultado = set()
+    for no in grafo.obter_nos():
+        for vizinho in grafo.obter_vizinhos(no):
+            assert grafo.contem_aresta(no, vizinho) and grafo.contem_aresta(vizinho, no)
+            resultado.add(frozenset((no, vizinho)))
+    return resultado
+
 # Teste 1 – Construção do grafo de interferência
 def test_construir_grafo_interferencia_basico():
     print("Teste 1: Construção do Grafo de Interferência")
@@ -276,6 +290,443 @@ def test_estimar_custos():
     assert custos["a"] == 3.0, f"a deveria ter custo 3.0 (custos={custos})"
     assert custos["b"] == 2.0, f"b deveria ter custo 2.0 (custos={custos})"
 
+# Teste 11 – Reescrita de registradores no local
+def test_reescrever_registradores_no_local():
+    print("\n-----------------------------------------\n")
+    print("Teste 11: Reescrita de Registradores no Local")
+    print("\nCenário:")
+    print("  • Programa com a, b e c")
+    print("  • Mapeamento simultâneo: a → b, b → x")
+    print("\nResultado esperado:")
+    print("  • Mesmo resultado da reescrita que recria as instruções")
+    print("  • Instruções originais reaproveitadas")
+    def criar_programa():
+        return LinguagemIntermediaria([
+            Instrucao("bloco_basico", [Declaracao("a", False)], []),
+            Instrucao("add", [Declaracao("b", False)], [Uso("a", True)]),
+            Instrucao("mul", [Declaracao("c", False)], [Uso("b", True)])
+        ])
+
+    def registradores(li):
+        return [
+            ([d.registrador for d in i.declaracoes], [u.registrador for u in i.usos])
+            for i in li.instrucoes
+        ]
+
+    mapeamento = {"a": "b", "b": "x"}
+    copia = criar_programa()
+    copia.reescrever_registradores(mapeamento)
+
+    li = criar_programa()
+    instrucoes_originais = list(li.instrucoes)
+    li.reescrever_registradores(mapeamento, no_local=True)
+    print("\nRegistradores após reescrita:", registradores(li))
+
+    assert registradores(li) == registradores(copia)
+    assert all(a is b for a, b in zip(li.instrucoes, instrucoes_originais))
+
+    # O índice construído na primeira renomeação fica ativo para as seguintes
+    indice = li.indice
+    assert indice is not None
+    li.reescrever_registradores({"x": "y"}, no_local=True)
+    assert li.indice is indice and li.contar_ocorrencias("y") == 2
+
+# Teste 12 – Índice de ocorrências mantido entre spill e renomeação
+def test_indice_ocorrencias():
+    print("\n-----------------------------------------\n")
+    print("Teste 12: Índice de Ocorrências de Registradores")
+    print("\nCenário:")
+    print("  • LI indexada com a, b e c")
+    print("  • Inserção de spill para 'b' e renomeação no local de 'a' → 'x'")
+    print("\nResultado esperado:")
+    print("  • Índice igual a uma reindexação completa após cada operação")
+    print("  • Instruções que não citam 'b' são reaproveitadas no spill")
+    li = LinguagemIntermediaria([
+        Instrucao("bloco_basico", [Declaracao("a", False)], []),
+        Instrucao("add", [Declaracao("b", False)], [Uso("a", False)]),
+        Instrucao("mul", [Declaracao("c", False)], [Uso("a", True)]),
+        Instrucao("sub", [Declaracao("a", False)], [Uso("b", True), Uso("c", True)])
+    ], indexado=True)
+
+    def contagens(linguagem):
+        reindexado = linguagem._construir_indice()
+        return {reg: reindexado.contagem(reg) for reg in reindexado.chaves()}
+
+    mul = li.instrucoes[2]
+    inserir_codigo_spill(li, {"b"})
+    assert li.instrucoes[li.instrucoes.index(mul)] is mul
+    assert {reg: li.contar_ocorrencias(reg) for reg in li.obter_registradores()} == contagens(li)
+    assert li.contar_ocorrencias("b") == 4
+
+    li.reescrever_registradores({"a": "x"}, no_local=True)
+    print("\nOcorrências após spill e renomeação:", contagens(li))
+
+    assert li.obter_registradores() == {"x", "b", "c"}
+    assert {reg: li.contar_ocorrencias(reg) for reg in li.obter_registradores()} == contagens(li)
+    assert mul in li.obter_posicoes("x")
+
+# Teste 13 – Cache de coloração em memória e em disco
+def test_cache_coloracao():
+    print("\n-----------------------------------------\n")
+    print("Teste 13: Cache de Coloração")
+    print("\nCenário:")
+    print("  • Grafo a-b, a-c, b-c, c-d colorido duas vezes com o mesmo cache")
+    print("  • Novo cache apontando para o mesmo diretório em disco")
+    print("  • Grafo impossível com 2 cores")
+    print("\nResultado esperado:")
+    print("  • Coloração do cache igual à calculada")
+    print("  • Falhas de coloração não são guardadas")
+    grafo = GrafoInterferencia()
+    for x, y in [("a", "b"), ("a", "c"), ("b", "c"), ("c", "d")]:
+        grafo.adicionar_aresta(x, y)
+    cores = ["R0", "R1", "R2"]
+    registradores = ["a", "b", "c", "d"]
+
+    diretorio = tempfile.mkdtemp()
+    cache = CacheAlocacao(diretorio=diretorio)
+    primeira = colorir_grafo(grafo, registradores, cores, cache=cache)
+    segunda = colorir_grafo(grafo, registradores, cores, cache=cache)
+    do_disco = colorir_grafo(grafo, registradores, cores, cache=CacheAlocacao(diretorio=diretorio))
+    print("\nColoração em cache:", primeira)
+
+    assert primeira == segunda == do_disco
+    assert coloracao_valida(grafo, primeira, cores, registradores)
+    assert len(cache) == 1
+
+    assert colorir_grafo(grafo, registradores, cores[:2], cache=cache) is None
+    assert len(cache) == 1
+
+# Teste 14 – Grafo com matriz de bits equivalente ao de listas
+def test_grafo_matriz_bits():
+    print("\n-----------------------------------------\n")
+    print("Teste 14: Grafo de Interferência com Matriz de Bits")
+    print("\nCenário:")
+    print("  • Programa aleatório com 40 registradores e cópias")
+    print("  • Mesmas operações aplicadas aos dois backends do grafo")
+    print("\nResultado esperado:")
+    print("  • Mesmas arestas após construção, remoção e renomeação")
+    print("  • Coalescing produz o mesmo código nos dois backends")
+    gerador = Random(14)
+
+    def criar_programa():
+        gerador.seed(14)
+        instrucoes = []
+        for i in range(300):
+            if i % 30 == 0:
+                instrucoes.append(Instrucao("bloco_basico", [Declaracao(f"r{gerador.randrange(40)}", False)], []))
+            elif gerador.random() < 0.3:
+                instrucoes.append(Instrucao("copia", [Declaracao(f"r{gerador.randrange(40)}", False)],
+                                            [Uso(f"r{gerador.randrange(40)}", gerador.random() < 0.5)]))
+            else:
+                instrucoes.append(Instrucao("add", [Declaracao(f"r{gerador.randrange(40)}", gerador.random() < 0.2)],
+                                            [Uso(f"r{gerador.randrange(40)}", gerador.random() < 0.5)]))
+        return LinguagemIntermediaria(instrucoes)
+
+    li_listas, li_bits = criar_programa(), criar_programa()
+    listas = construir_grafo_interferencia(li_listas)
+    bits = construir_grafo_interferencia(li_bits, matriz_bits=True)
+    print(f"\nArestas construídas: {len(arestas(bits))}")
+
+    assert isinstance(bits, GrafoInterferenciaMatrizBits)
+    assert arestas(listas) == arestas(bits)
+    assert set(listas.obter_nos()) == set(bits.obter_nos())
+    assert not bits.contem_aresta("r0", "r0") and not bits.contem_aresta("r0", "inexistente")
+
+    copia_bits = copy.copy(bits)
+    for grafo in (listas, bits):
+        grafo.remover_no("r3")
+        grafo.renomear_no("r5", "r6")
+        grafo.renomear_no("r7", "novo")
+    assert arestas(listas) == arestas(bits)
+    assert set(listas.obter_nos()) == set(bits.obter_nos())
+    assert all(listas.calcular_grau(no) == bits.calcular_grau(no) for no in listas.obter_nos())
+    assert copia_bits.contem_aresta("r3", copia_bits.obter_vizinhos("r3")[0])
+
+    li_listas, li_bits = criar_programa(), criar_programa()
+    fazer_coalescing(li_listas, construir_grafo_interferencia(li_listas))
+    fazer_coalescing(li_bits, construir_grafo_interferencia(li_bits, matriz_bits=True))
+    print(f"Registradores após coalescing: {len(li_bits.obter_registradores())}")
+
+    assert [repr(i) for i in li_listas.instrucoes] == [repr(i) for i in li_bits.instrucoes]
+
+# Teste 15 – Coloração iterativa em programa longo
+def test_coloracao_iterativa():
+    print("\n-----------------------------------------\n")
+    print("Teste 15: Coloração Iterativa sem Cópias")
+    print("\nCenário:")
+    print("  • Cadeia de 5000 registradores, cada um vivo só até a próxima instrução")
+    print("  • 2 cores disponíveis")
+    print("\nResultado esperado:")
+    print("  • Todos os registradores coloridos, sem estourar o limite de recursão")
+    print("  • Registradores consecutivos com cores diferentes")
+    instrucoes = [Instrucao("bloco_basico", [Declaracao("r0", False)], [])]
+    for i in range(1, 5000):
+        instrucoes.append(Instrucao("add", [Declaracao(f"r{i}", False)], [Uso(f"r{i - 1}", False)]))
+        instrucoes.append(Instrucao("mov", [], [Uso(f"r{i - 1}", True)]))
+    li = LinguagemIntermediaria(instrucoes)
+
+    grafo = construir_grafo_interferencia(li)
+    registradores = sorted(li.obter_registradores())
+    coloracao = colorir_grafo(grafo, registradores, ["R0", "R1"])
+    print(f"\nRegistradores coloridos: {len(coloracao)}")
+
+    assert len(coloracao) == 5000
+    assert all(coloracao[f"r{i}"] != coloracao[f"r{i - 1}"] for i in range(1, 5000))
+    assert colorir_grafo(grafo, registradores, ["R0"]) is None
+
+# Teste 16 – Coalescing de cadeia de cópias com união-busca
+def test_coalescing_cadeia_copias():
+    print("\n-----------------------------------------\n")
+    print("Teste 16: Coalescing de Cadeia de Cópias")
+    print("\nCenário:")
+    print("  • Cadeia b = copia(a), c = copia(b), d = copia(c) com a fonte morrendo")
+    print("  • 'x' vivo junto com 'a' e e = copia(x)")
+    print("\nResultado esperado:")
+    print("  • b, c e d fundidos em 'a' (o nome da origem sobrevive)")
+    print("  • Cópia com interferência ('x' e 'e' vivos juntos) preservada")
+    li = LinguagemIntermediaria([
+        Instrucao("bloco_basico", [Declaracao("a", False), Declaracao("x", False)], []),
+        Instrucao("copia", [Declaracao("b", False)], [Uso("a", True)]),
+        Instrucao("copia", [Declaracao("c", False)], [Uso("b", True)]),
+        Instrucao("copia", [Declaracao("d", False)], [Uso("c", True)]),
+        Instrucao("copia", [Declaracao("e", False)], [Uso("x", False)]),
+        Instrucao("add", [Declaracao("f", False)], [Uso("d", True), Uso("e", True), Uso("x", True)])
+    ])
+    grafo = construir_grafo_interferencia(li)
+    fazer_coalescing(li, grafo)
+
+    regs = li.obter_registradores()
+    print("\nRegistradores após coalescing:", regs)
+
+    assert regs == {"a", "x", "e", "f"}
+    assert [u.registrador for u in li.instrucoes[-1].usos] == ["a", "e", "x"]
+    assert grafo.contem_aresta("x", "e") and grafo.contem_aresta("a", "x")
+    assert not any(no in grafo.obter_nos() for no in "bcd")
+
+# Teste 17 – Coalescing conservador (Briggs/George)
+def test_coalescing_conservador():
+    print("\n-----------------------------------------\n")
+    print("Teste 17: Coalescing Conservador")
+    print("\nCenário:")
+    print("  • Caminho x-a-b-y com y = copia(x) e 2 cores")
+    print("  • Cópias concorrentes de 'x' em bloco frio (1.0) e quente (10.0)")
+    print("\nResultado esperado:")
+    print("  • Modo agressivo funde x e y e forma um triângulo sem 2-coloração")
+    print("  • Modo conservador recusa a fusão e o grafo continua 2-colorível")
+    print("  • Modo conservador prioriza a cópia do bloco quente")
+    cores = ["R0", "R1"]
+
+    def criar():
+        li = LinguagemIntermediaria([
+            Instrucao("bloco_basico", [], []),
+            Instrucao("copia", [Declaracao("y", False)], [Uso("x", False)])
+        ])
+        grafo = GrafoInterferencia()
+        for a, b in [("x", "a"), ("a", "b"), ("b", "y")]:
+            grafo.adicionar_aresta(a, b)
+        return li, grafo
+
+    li, grafo = criar()
+    fazer_coalescing(li, grafo)
+    assert li.obter_registradores() == {"x"}
+    assert colorir_grafo(grafo, grafo.obter_nos(), cores) is None
+
+    li, grafo = criar()
+    fazer_coalescing(li, grafo, cores, modo="conservador")
+    print("\nRegistradores após coalescing conservador:", li.obter_registradores())
+    assert li.obter_registradores() == {"x", "y"}
+    assert colorir_grafo(grafo, grafo.obter_nos(), cores) is not None
+
+    def criar_concorrentes():
+        li = LinguagemIntermediaria([
+            Instrucao("bloco_basico", [], [], frequencia=1.0),
+            Instrucao("copia", [Declaracao("frio", False)], [Uso("x", False)]),
+            Instrucao("bloco_basico", [], [], frequencia=10.0),
+            Instrucao("copia", [Declaracao("quente", False)], [Uso("x", False)])
+        ])
+        grafo = GrafoInterferencia()
+        grafo.adicionar_aresta("frio", "quente")
+        return li, grafo
+
+    li, grafo = criar_concorrentes()
+    fazer_coalescing(li, grafo)
+    assert li.obter_registradores() == {"x", "quente"}
+
+    li, grafo = criar_concorrentes()
+    fazer_coalescing(li, grafo, ["R0", "R1", "R2"], modo="conservador")
+    print("Registradores com prioridade ao bloco quente:", li.obter_registradores())
+    assert li.obter_registradores() == {"x", "frio"}
+
+    try:
+        fazer_coalescing(li, grafo, modo="conservador")
+        assert False, "modo conservador sem cores deveria falhar"
+    except ValueError:
+        pass
+
+# Teste 18 – Spill pela métrica de Chaitin (custo / grau)
+def test_decidir_spills_custo_por_grau():
+    print("\n-----------------------------------------\n")
+    print("Teste 18: Spill por Custo/Grau")
+    print("\nCenário:")
+    print("  • a, b, c, d interferem entre si; e interfere com a, b e c")
+    print("  • 3 cores; custos a=5 (grau 4), d=4 (grau 3), demais mais caros")
+    print("  • Função aleatória com 3000 registradores e 6 cores")
+    print("\nResultado esperado:")
+    print("  • 'a' vai para spill (5/4 < 4/3), embora 'd' seja o mais barato")
+    print("  • Registrador sem custo conhecido nunca é preferido")
+    print("  • Grafo sem os spills é colorível")
+    li = LinguagemIntermediaria([Instrucao("bloco_basico", [Declaracao(r, False) for r in "abcde"], [])])
+    grafo = GrafoInterferencia()
+    for x, y in [("a", "b"), ("a", "c"), ("a", "d"), ("b", "c"), ("b", "d"), ("c", "d"), ("e", "a"), ("e", "b"), ("e", "c")]:
+        grafo.adicionar_aresta(x, y)
+    custos = {"a": 5.0, "b": 6.0, "c": 6.0, "d": 4.0, "e": 4.5}
+    cores = ["R0", "R1", "R2"]
+
+    spills = decidir_spills(li, grafo, cores, custos)
+    print(f"\nSpills escolhidos: {spills}")
+    assert spills == {"a"}
+
+    # Sem custo para 'a', sobra o clique a-b-c-e depois de 'd' e 'e' (4.5/3) também vai para spill
+    custos.pop("a")
+    assert decidir_spills(li, grafo, cores, custos) == {"d", "e"}
+
+    gerador = Random(18)
+    instrucoes = []
+    for i in range(12000):
+        if i % 40 == 0:
+            instrucoes.append(Instrucao("bloco_basico", [Declaracao(f"r{gerador.randrange(3000)}", False)], [], gerador.choice([1.0, 10.0])))
+        else:
+            instrucoes.append(Instrucao("add", [Declaracao(f"r{gerador.randrange(3000)}", gerador.random() < 0.2)],
+                                        [Uso(f"r{gerador.randrange(3000)}", gerador.random() < 0.5)]))
+    li = LinguagemIntermediaria(instrucoes)
+    grafo = construir_grafo_interferencia(li)
+    cores = [f"R{i}" for i in range(6)]
+
+    spills = decidir_spills(li, grafo, cores, estimar_custos_spill(li))
+    restantes = [r for r in li.obter_registradores() if r not in spills]
+    for r in spills:
+        grafo.remover_no(r)
+    print(f"Spills na função grande: {len(spills)} de {len(restantes) + len(spills)}")
+
+    assert spills <= li.obter_registradores()
+    assert colorir_grafo(grafo, restantes, cores) is not None
+
+# Teste 19 – Driver iterado de alocação com reconstrução incremental
+def test_alocar_registradores_iterado():
+    print("\n-----------------------------------------\n")
+    print("Teste 19: Alocação Iterada (construção, coalescing, spill, coloração)")
+    print("\nCenário:")
+    print("  • Função aleatória com 60 blocos, registradores locais e globais")
+    print("  • 3 cores disponíveis, forçando rodadas de spill")
+    print("\nResultado esperado:")
+    print("  • Coloração válida para o programa final, com código de spill")
+    print("  • Grafo mantido por blocos igual a uma reconstrução completa")
+    print("  • Rodadas e tempo de cada fase reportados")
+    gerador = Random(19)
+    instrucoes = []
+    for bloco in range(60):
+        instrucoes.append(Instrucao("bloco_basico", [Declaracao(f"g{gerador.randrange(8)}", False)], [],
+                                    gerador.choice([1.0, 10.0])))
+        locais = [f"b{bloco}_{i}" for i in range(6)]
+        for _ in range(12):
+            if gerador.random() < 0.2:
+                instrucoes.append(Instrucao("copia", [Declaracao(gerador.choice(locais), False)],
+                                            [Uso(gerador.choice(locais), gerador.random() < 0.5)]))
+            else:
+                instrucoes.append(Instrucao("add", [Declaracao(gerador.choice(locais), gerador.random() < 0.1)],
+                                            [Uso(gerador.choice(locais + [f"g{gerador.randrange(8)}"]), gerador.random() < 0.6)]))
+    li = LinguagemIntermediaria(instrucoes)
+    cores = ["R0", "R1", "R2"]
+
+    resultado = alocar_registradores(li, cores)
+    print(f"\n{resultado}")
+    for fase, segundos in resultado.tempos.items():
+        print(f"  • {fase}: {segundos:.4f}s")
+
+    grafo = construir_grafo_interferencia(li)
+
+    assert resultado.coloracao is not None
+    assert resultado.rodadas >= 2 and resultado.spills
+    assert set(resultado.coloracao) == li.obter_registradores()
+    assert coloracao_valida(grafo, resultado.coloracao, cores, li.obter_registradores())
+    assert arestas(resultado.grafo) == arestas(grafo)
+    assert set(resultado.grafo.obter_nos()) == set(grafo.obter_nos())
+    assert any(instrucao.codigo_operacao == "recarregar" for instrucao in li.instrucoes)
+    assert set(resultado.tempos) == {"construcao", "coalescing", "custos", "spill", "insercao", "reconstrucao", "coloracao"}
+
+    sem_rodadas = alocar_registradores(LinguagemIntermediaria(list(instrucoes)), cores, max_rodadas=1)
+    assert sem_rodadas.coloracao is None and sem_rodadas.rodadas == 1
+
+# Teste 20 – LI compacta em colunas equivalente à LI de objetos
+def test_linguagem_compacta():
+    print("\n-----------------------------------------\n")
+    print("Teste 20: LI Compacta (colunas de ids, deslocamentos e flags)")
+    print("\nCenário:")
+    print("  • Mesma função aleatória em LinguagemIntermediaria e LinguagemCompacta")
+    print("  • Grafo, custos, coalescing e spill executados nas duas")
+    print("\nResultado esperado:")
+    print("  • Visão de instruções igual às instruções originais")
+    print("  • Mesmo grafo, mesmos custos e mesmo código após coalescing e spill")
+    gerador = Random(20)
+    instrucoes = []
+    for bloco in range(30):
+        instrucoes.append(Instrucao("bloco_basico", [Declaracao(f"g{gerador.randrange(6)}", False)], [],
+                                    gerador.choice([1.0, 10.0])))
+        locais = [f"b{bloco}_{i}" for i in range(5)]
+        for _ in range(10):
+            operacao = "copia" if gerador.random() < 0.2 else "add"
+            instrucoes.append(Instrucao(operacao, [Declaracao(gerador.choice(locais), gerador.random() < 0.1)],
+                                        [Uso(gerador.choice(locais + [f"g{gerador.randrange(6)}"]), gerador.random() < 0.6)]))
+    li = LinguagemIntermediaria(instrucoes)
+    compacta = LinguagemCompacta.de_linguagem(li)
+    print(f"\n{compacta}")
+
+    forma = lambda linguagem: [
+        (i.codigo_operacao, [(d.registrador, d.morto) for d in i.declaracoes],
+         [(u.registrador, u.morto) for u in i.usos], i.frequencia)
+        for i in linguagem.instrucoes
+    ]
+
+    assert len(compacta) == len(instrucoes)
+    assert forma(compacta) == forma(li)
+    assert compacta[-1].codigo_operacao == instrucoes[-1].codigo_operacao
+    assert compacta.obter_registradores() == li.obter_registradores()
+
+    grafo = construir_grafo_interferencia(li)
+    grafo_compacto = construir_grafo_interferencia(compacta, matriz_bits=True)
+    assert arestas(grafo_compacto) == arestas(grafo)
+    assert estimar_custos_spill(compacta) == estimar_custos_spill(li)
+
+    cores = ["R0", "R1", "R2"]
+    fazer_coalescing(li, grafo, cores, "conservador")
+    fazer_coalescing(compacta, grafo_compacto, cores, "conservador")
+    assert forma(compacta) == forma(li)
+
+    spills = decidir_spills(li, grafo, cores, estimar_custos_spill(li))
+    print(f"Spills: {sorted(spills)}")
+    inserir_codigo_spill(li, spills)
+    inserir_codigo_spill(compacta, spills)
+    assert spills and forma(compacta) == forma(li)
+    assert forma(compacta.para_linguagem()) == forma(li)
+    assert arestas(construir_grafo_interferencia(compacta)) == arestas(construir_grafo_interferencia(li))
+
+    # Operandos da visão escrevem direto nas colunas; a quantidade de operandos é fixa
+    pequena = LinguagemCompacta.de_instrucoes([
+        Instrucao("bloco_basico", [Declaracao("a", False)], []),
+        Instrucao("add", [Declaracao("b", False)], [Uso("a", False)]),
+    ])
+    instrucao = pequena[1]
+    instrucao.usos[0].morto = True
+    instrucao.declaracoes[0].registrador = "c"
+    assert pequena.usos_mortos[0] == 1
+    assert [(d.registrador, d.morto) for d in pequena[1].declaracoes] == [("c", False)]
+    assert arestas(construir_grafo_interferencia(pequena)) == set()
+    try:
+        instrucao.declaracoes.append(Declaracao("d", False))
+        assert False, "Lista de operandos da visão não deveria crescer"
+    except AttributeError:
+        pass
+
 if __name__ == "__main__":    
     test_construir_grafo_interferencia_basico()
     test_coalescing_basico()
@@ -286,4 +737,14 @@ if __name__ == "__main__":
     test_liveness_com_morte()
     test_coloracao_impossivel()
     test_coalescing_com_interferencia()
-    test_estimar_custos()
\ No newline at end of file
+    test_estimar_custos()
+    test_reescrever_registradores_no_local()
+    test_indice_ocorrencias()
+    test_cache_coloracao()
+    test_grafo_matriz_bits()
+    test_coloracao_iterativa()
+    test_coalescing_cadeia_copias()
+    test_coalescing_conservador()
+    test_decidir_spills_custo_por_grau()
+    test_alocar_registradores_iterado()
+    test_linguagem_compacta()